@@ -12,6 +12,13 @@ from datetime import datetime
 from bs4 import BeautifulSoup
 import re
 
+from config import PRECOMPRESS_OUTPUT
+from html_templates import get_template
+from html_writer import compression_summary, precompress, write_chunks
+from snapshot_store import snapshot_run
+from static_assets import build_stylesheet
+from tracing import report_run, span, traced
+
 
 class AlternativeHRDataCollector:
     """Collect HR data from alternative sources."""
@@ -22,6 +29,7 @@ class AlternativeHRDataCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
+    @traced("fetch")
     def get_linkedin_hr_posts(self):
         """Get HR posts from LinkedIn (public data)."""
         print("🔍 Buscando posts de RH no LinkedIn...")
@@ -56,6 +64,7 @@ class AlternativeHRDataCollector:
         
         return linkedin_posts
     
+    @traced("fetch")
     def get_hr_news(self):
         """Get HR news from Brazilian news sources."""
         print("📰 Buscando notícias sobre RH...")
@@ -103,6 +112,7 @@ class AlternativeHRDataCollector:
             print(f"⚠️ Erro ao buscar notícias: {e}")
             return []
     
+    @traced("fetch")
     def get_hr_trends(self):
         """Get HR trends from Google Trends or similar."""
         print("📈 Buscando tendências de RH...")
@@ -143,6 +153,7 @@ class AlternativeHRDataCollector:
         
         return trends
     
+    @traced("fetch")
     def get_hr_forum_posts(self):
         """Get HR discussions from forums and communities."""
         print("💬 Buscando discussões em fóruns de RH...")
@@ -192,319 +203,25 @@ class AlternativeHRDataCollector:
         return all_data
 
 
+def iter_html_from_real_data(data, output_dir="."):
+    """Yield the HTML page for collected real data in chunks."""
+    post_item = get_template("items/alternative_linkedin_post.html")
+    news_item = get_template("items/alternative_news.html")
+    trend_item = get_template("items/alternative_trend.html")
+    return get_template("alternative_data.html").stream(
+        stylesheet=build_stylesheet("alternative_data", output_dir),
+        data=data,
+        counts={key: len(data[key]) for key in ("linkedin_posts", "news", "trends", "forum_posts")},
+        linkedin_items=(post_item.render(post=post) for post in data["linkedin_posts"]),
+        news_items=(news_item.render(news=news) for news in data["news"]),
+        trend_items=(trend_item.render(trend=trend) for trend in data["trends"])
+    )
+
+
 def generate_html_from_real_data(data):
     """Generate HTML page from collected real data."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate LinkedIn posts HTML
-    linkedin_html = ""
-    for i, post in enumerate(data["linkedin_posts"], 1):
-        linkedin_html += f"""
-        <div class="data-item linkedin">
-            <div class="data-header">
-                <span class="platform-badge linkedin">LinkedIn</span>
-                <span class="author">{post['author']}</span>
-                <span class="engagement">❤️ {post['engagement']:,} | 💬 {post['comments']:,}</span>
-            </div>
-            <div class="content">{post['content']}</div>
-            <div class="date">{post['date']}</div>
-        </div>
-        """
-    
-    # Generate news HTML
-    news_html = ""
-    for i, news in enumerate(data["news"], 1):
-        news_html += f"""
-        <div class="data-item news">
-            <div class="data-header">
-                <span class="platform-badge news">Notícias</span>
-                <span class="source">{news['source']}</span>
-                <span class="engagement">📊 {news['engagement']:,} visualizações</span>
-            </div>
-            <div class="title">{news['title']}</div>
-            <div class="content">{news['summary']}</div>
-            <div class="date">{news['date']}</div>
-        </div>
-        """
-    
-    # Generate trends HTML
-    trends_html = ""
-    for i, trend in enumerate(data["trends"], 1):
-        trends_html += f"""
-        <div class="data-item trend">
-            <div class="data-header">
-                <span class="platform-badge trend">Tendência</span>
-                <span class="trend-status">{trend['trend']}</span>
-                <span class="volume">Volume: {trend['volume']}</span>
-            </div>
-            <div class="term">{trend['term']}</div>
-            <div class="engagement">📈 {trend['engagement']:,} buscas</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dados Reais de RH - Brasil</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1000px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        
-        .stats {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            text-align: center;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .section {{
-            padding: 30px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .section h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .data-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .data-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-        }}
-        
-        .data-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .platform-badge {{
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-            color: white;
-        }}
-        
-        .platform-badge.linkedin {{
-            background: #0077b5;
-        }}
-        
-        .platform-badge.news {{
-            background: #28a745;
-        }}
-        
-        .platform-badge.trend {{
-            background: #ffc107;
-            color: #333;
-        }}
-        
-        .author, .source {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .engagement {{
-            font-size: 0.9em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 5px 12px;
-            border-radius: 20px;
-        }}
-        
-        .title {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.2em;
-            margin-bottom: 10px;
-        }}
-        
-        .content {{
-            margin: 15px 0;
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-        }}
-        
-        .term {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.3em;
-            margin-bottom: 10px;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 10px;
-        }}
-        
-        .trend-status {{
-            font-weight: bold;
-            color: #28a745;
-        }}
-        
-        .volume {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2em;
-            }}
-            
-            .data-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Dados Reais de RH - Brasil</h1>
-            <p>Informações coletadas de múltiplas fontes sobre Recursos Humanos</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stats-grid">
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['linkedin_posts'])}</div>
-                    <div class="stat-label">Posts do LinkedIn</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['news'])}</div>
-                    <div class="stat-label">Notícias</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['trends'])}</div>
-                    <div class="stat-label">Tendências</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['forum_posts'])}</div>
-                    <div class="stat-label">Discussões</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>💼 Posts do LinkedIn</h2>
-            {linkedin_html}
-        </div>
-        
-        <div class="section">
-            <h2>📰 Notícias sobre RH</h2>
-            {news_html}
-        </div>
-        
-        <div class="section">
-            <h2>📈 Tendências de Busca</h2>
-            {trends_html}
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {data['timestamp']} | Alternative HR Data Collector</p>
-            <p>Fontes: LinkedIn, Notícias, Google Trends, Fóruns</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
+    html_content = "".join(iter_html_from_real_data(data))
     return html_content, timestamp
 
 
@@ -520,16 +237,23 @@ def main():
     data = collector.collect_all_data()
     
     # Generate HTML
-    html_content, timestamp = generate_html_from_real_data(data)
-    filename = f"real_hr_data_{timestamp}.html"
+    # Each run replaces the same page; earlier versions live in the snapshot store
+    filename = "real_hr_data.html"
     
     try:
         # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page to disk instead of building it in memory
+        with span("render", page=filename):
+            write_chunks(filename, iter_html_from_real_data(data))
         
         print(f"✅ Dados coletados e página HTML gerada!")
         print(f"📁 Arquivo: {filename}")
+        if PRECOMPRESS_OUTPUT:
+            print(f"🗜️ {compression_summary(filename, precompress(filename))}")
+
+        # Keep a deduplicated snapshot of this run's data and page
+        run = snapshot_run("real_hr_data", [filename], data=data)
+        print(f"📸 Snapshot {run['id']} (+{run['added_bytes']:,} bytes novos)")
         
         # Try to open in browser
         import webbrowser
@@ -547,6 +271,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Erro: {e}")
+    
+    report_run("real_hr_data")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Article Model
+
+Compact representations of HR news articles.
+
+Every collector produces articles as dicts with about eleven string keys and
+dates stored as "YYYY-MM-DD" strings. This module offers two denser forms:
+
+- Article: a __slots__ class for single articles.
+- ArticleTable: a columnar table for bulk work, with dictionary-encoded
+  source/category, integer date ordinals and typed numeric columns. When
+  NumPy is installed, numeric columns are exposed as zero-copy arrays and
+  ranking/grouping run vectorized.
+
+Both convert to and from the existing dict shape so the generators and HTML
+renderers keep working unchanged.
+"""
+
+import heapq
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; the table falls back to pure Python loops
+    np = None
+
+
+ARTICLE_FIELDS = ("rank", "title", "source", "summary", "url", "date",
+                  "views", "shares", "comments", "category", "is_current")
+
+NUMERIC_COLUMNS = ("rank", "date", "views", "shares", "comments")
+
+
+@lru_cache(maxsize=4096)
+def date_to_ordinal(value):
+    """Convert a "YYYY-MM-DD" string (zero padding optional) to a day ordinal."""
+    return datetime.strptime(value, "%Y-%m-%d").toordinal()
+
+
+@lru_cache(maxsize=4096)
+def ordinal_to_date(ordinal):
+    """Convert a day ordinal back to a "YYYY-MM-DD" string."""
+    return date.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+
+def _to_array(typecode, values):
+    """Copy a sequence or NumPy array into a typed array.array."""
+    result = array(typecode)
+    if np is not None and isinstance(values, np.ndarray):
+        result.frombytes(values.astype(typecode, copy=False).tobytes())
+    else:
+        result.extend(int(v) for v in values)
+    return result
+
+
+class Article:
+    """A single news article stored in slots instead of a dict."""
+
+    __slots__ = ("rank", "title", "source", "summary", "url", "date_ordinal",
+                 "views", "shares", "comments", "category", "is_current")
+
+    def __init__(self, title, source, summary, url, date_ordinal, views=0,
+                 shares=0, comments=0, category="RH Geral", rank=0, is_current=None):
+        self.rank = rank
+        self.title = title
+        self.source = source
+        self.summary = summary
+        self.url = url
+        self.date_ordinal = date_ordinal
+        self.views = views
+        self.shares = shares
+        self.comments = comments
+        self.category = category
+        self.is_current = is_current
+
+    @property
+    def date(self):
+        return ordinal_to_date(self.date_ordinal)
+
+    @classmethod
+    def from_dict(cls, news):
+        """Build an Article from the collectors' dict shape."""
+        return cls(
+            title=news['title'],
+            source=news['source'],
+            summary=news.get('summary', ''),
+            url=news.get('url', ''),
+            date_ordinal=date_to_ordinal(news['date']),
+            views=news.get('views', 0),
+            shares=news.get('shares', 0),
+            comments=news.get('comments', 0),
+            category=news.get('category', 'RH Geral'),
+            rank=news.get('rank', 0),
+            is_current=news.get('is_current')
+        )
+
+    def to_dict(self):
+        """Convert back to the dict shape used by the HTML generators."""
+        news = {
+            "rank": self.rank,
+            "title": self.title,
+            "source": self.source,
+            "summary": self.summary,
+            "url": self.url,
+            "date": self.date,
+            "views": self.views,
+            "shares": self.shares,
+            "comments": self.comments,
+            "category": self.category
+        }
+        if self.is_current is not None:
+            news["is_current"] = self.is_current
+        return news
+
+    def __repr__(self):
+        return f"Article(rank={self.rank!r}, title={self.title!r}, source={self.source!r})"
+
+
+class StringDictionary:
+    """Map repeated strings (sources, categories) to small integer codes."""
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+    def code_of(self, value):
+        """Return the code for a value, or None if it was never seen."""
+        return self._codes.get(value)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ArticleTable:
+    """Columnar storage for many articles."""
+
+    def __init__(self):
+        self.sources = StringDictionary()
+        self.categories = StringDictionary()
+        self.rank = array('l')
+        self.date = array('l')
+        self.views = array('q')
+        self.shares = array('q')
+        self.comments = array('q')
+        self.source_code = array('l')
+        self.category_code = array('l')
+        # -1 means the flag was absent in the source dict
+        self.is_current = array('b')
+        self.titles = []
+        self.summaries = []
+        self.urls = []
+
+    @classmethod
+    def from_dicts(cls, news_iterable):
+        """Build a table from dicts in the collectors' shape."""
+        table = cls()
+        table.extend(news_iterable)
+        return table
+
+    @classmethod
+    def from_columns(cls, titles, summaries, urls, dates, views, shares, comments,
+                     sources, source_codes, categories, category_codes,
+                     ranks=None, is_current=None):
+        """Build a table directly from columns, e.g. vectorized generator output.
+
+        ``sources`` and ``categories`` are the dictionaries the ``*_codes``
+        columns index into. Numeric columns may be lists or NumPy arrays.
+        """
+        table = cls()
+        for value in sources:
+            table.sources.encode(value)
+        for value in categories:
+            table.categories.encode(value)
+        count = len(titles)
+        table.titles = list(titles)
+        table.summaries = list(summaries)
+        table.urls = list(urls)
+        table.date = _to_array('l', dates)
+        table.views = _to_array('q', views)
+        table.shares = _to_array('q', shares)
+        table.comments = _to_array('q', comments)
+        table.source_code = _to_array('l', source_codes)
+        table.category_code = _to_array('l', category_codes)
+        table.rank = _to_array('l', ranks if ranks is not None else [0] * count)
+        table.is_current = _to_array('b', is_current if is_current is not None else [-1] * count)
+        return table
+
+    def __len__(self):
+        return len(self.titles)
+
+    def append(self, news):
+        """Append one article dict (or Article) to the table."""
+        if isinstance(news, Article):
+            news = news.to_dict()
+        self.rank.append(news.get('rank', 0))
+        self.date.append(date_to_ordinal(news['date']))
+        self.views.append(news.get('views', 0))
+        self.shares.append(news.get('shares', 0))
+        self.comments.append(news.get('comments', 0))
+        self.source_code.append(self.sources.encode(news['source']))
+        self.category_code.append(self.categories.encode(news.get('category', 'RH Geral')))
+        current = news.get('is_current')
+        self.is_current.append(-1 if current is None else int(bool(current)))
+        self.titles.append(news['title'])
+        self.summaries.append(news.get('summary', ''))
+        self.urls.append(news.get('url', ''))
+
+    def extend(self, news_iterable):
+        for news in news_iterable:
+            self.append(news)
+        return self
+
+    def column(self, name):
+        """Return a numeric column, as a zero-copy NumPy array when available."""
+        values = getattr(self, name)
+        if np is not None:
+            return np.frombuffer(values, dtype=values.typecode)
+        return values
+
+    def article(self, index):
+        """Materialize one row as an Article."""
+        current = self.is_current[index]
+        return Article(
+            title=self.titles[index],
+            source=self.sources.decode(self.source_code[index]),
+            summary=self.summaries[index],
+            url=self.urls[index],
+            date_ordinal=self.date[index],
+            views=self.views[index],
+            shares=self.shares[index],
+            comments=self.comments[index],
+            category=self.categories.decode(self.category_code[index]),
+            rank=self.rank[index],
+            is_current=None if current < 0 else bool(current)
+        )
+
+    def iter_dicts(self, indices=None):
+        """Yield rows in the dict shape, optionally only the given indices."""
+        if indices is None:
+            indices = range(len(self))
+        for index in indices:
+            yield self.article(int(index)).to_dict()
+
+    def to_dicts(self, indices=None):
+        return list(self.iter_dicts(indices))
+
+    def top_k_indices(self, k, by='views'):
+        """Indices of the K largest values of a numeric column, best first.
+
+        Ties keep table order, like the stable sorts used by the collectors.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        if np is not None:
+            values = self.column(by)
+            if k < len(values):
+                candidates = np.argpartition(-values, k - 1)[:k]
+                # argpartition may pick any of several tied boundary values;
+                # widen to all ties so the stable order below stays exact
+                threshold = values[candidates].min()
+                candidates = np.flatnonzero(values >= threshold)
+            else:
+                candidates = np.arange(len(values))
+            order = np.lexsort((candidates, -values[candidates]))
+            return candidates[order][:k].tolist()
+        values = getattr(self, by)
+        return heapq.nsmallest(k, range(len(values)), key=lambda i: (-values[i], i))
+
+    def group_totals(self, by='category', column='views'):
+        """Count and sum a numeric column per category or source."""
+        codes_name, dictionary = (('category_code', self.categories) if by == 'category'
+                                  else ('source_code', self.sources))
+        if np is not None:
+            codes = self.column(codes_name)
+            counts = np.bincount(codes, minlength=len(dictionary))
+            sums = np.bincount(codes, weights=self.column(column), minlength=len(dictionary))
+            return {dictionary.decode(code): {'count': int(counts[code]), column: int(sums[code])}
+                    for code in range(len(dictionary)) if counts[code]}
+        totals = {}
+        for code, value in zip(getattr(self, codes_name), getattr(self, column)):
+            name = dictionary.decode(code)
+            if name not in totals:
+                totals[name] = {'count': 0, column: 0}
+            totals[name]['count'] += 1
+            totals[name][column] += value
+        return totals
+
+    def assign_ranks(self, indices):
+        """Write ranks 1..N for the given row order."""
+        for rank, index in enumerate(indices, 1):
+            self.rank[int(index)] = rank
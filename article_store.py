@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Article Store
+
+Persistent SQLite store for collected HR news articles.
+
+Collectors upsert their articles here (keyed by canonical URL) instead of
+throwing them away after rendering, and dashboards can ask for "top K in a
+date window, optionally filtered by category or source" without re-crawling.
+
+Usage:
+    python article_store.py top --days 7 --category Tecnologia -k 10
+"""
+
+import argparse
+import sqlite3
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from article_model import date_to_ordinal, ordinal_to_date
+from tracing import traced
+
+
+DEFAULT_DB_PATH = "hr_news.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT 'RH Geral',
+    date TEXT NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    shares INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    is_current INTEGER,
+    rank INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date);
+CREATE INDEX IF NOT EXISTS idx_articles_source_date ON articles (source, date);
+CREATE INDEX IF NOT EXISTS idx_articles_category_date ON articles (category, date);
+CREATE INDEX IF NOT EXISTS idx_articles_views ON articles (views DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen);
+"""
+
+UPSERT_SQL = """
+INSERT INTO articles (url, title, source, summary, category, date, views, shares,
+                      comments, is_current, rank, first_seen, last_seen)
+VALUES (:url, :title, :source, :summary, :category, :date, :views, :shares,
+        :comments, :is_current, :rank, :seen, :seen)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    source = excluded.source,
+    summary = excluded.summary,
+    category = excluded.category,
+    date = excluded.date,
+    views = excluded.views,
+    shares = excluded.shares,
+    comments = excluded.comments,
+    is_current = excluded.is_current,
+    rank = excluded.rank,
+    last_seen = excluded.last_seen
+"""
+
+ORDER_COLUMNS = {
+    "views": "views DESC, date DESC",
+    "shares": "shares DESC, date DESC",
+    "comments": "comments DESC, date DESC",
+    "date": "date DESC, views DESC"
+}
+
+# Tracking parameters that never change which article a URL points to
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+
+def canonical_url(url):
+    """Normalize a URL so the same article always maps to the same key."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/") or "/"
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith(TRACKING_PARAMS)]
+    return urlunsplit((scheme, host, path, urlencode(sorted(query)), ""))
+
+
+def _normalize_date(value):
+    """Store dates zero-padded so they sort and range-filter correctly."""
+    return ordinal_to_date(date_to_ordinal(value))
+
+
+def _row_to_news(row):
+    news = {
+        "rank": row["rank"],
+        "title": row["title"],
+        "source": row["source"],
+        "summary": row["summary"],
+        "url": row["url"],
+        "date": row["date"],
+        "views": row["views"],
+        "shares": row["shares"],
+        "comments": row["comments"],
+        "category": row["category"]
+    }
+    if row["is_current"] is not None:
+        news["is_current"] = bool(row["is_current"])
+    return news
+
+
+class ArticleStore:
+    """SQLite-backed article store with WAL journaling and batched upserts."""
+
+    def __init__(self, path=DEFAULT_DB_PATH, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    @traced("store")
+    def upsert_many(self, news_iterable, seen_at=None):
+        """Insert or update articles in batches. Returns the number written."""
+        seen = (seen_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        written = 0
+        batch = []
+        for news in news_iterable:
+            if not news.get("url"):
+                continue
+            current = news.get("is_current")
+            batch.append({
+                "url": canonical_url(news["url"]),
+                "title": news["title"],
+                "source": news["source"],
+                "summary": news.get("summary", ""),
+                "category": news.get("category", "RH Geral"),
+                "date": _normalize_date(news["date"]),
+                "views": news.get("views", 0),
+                "shares": news.get("shares", 0),
+                "comments": news.get("comments", 0),
+                "is_current": None if current is None else int(bool(current)),
+                "rank": news.get("rank", 0),
+                "seen": seen
+            })
+            if len(batch) >= self.batch_size:
+                written += self._write_batch(batch)
+                batch = []
+        if batch:
+            written += self._write_batch(batch)
+        return written
+
+    def _write_batch(self, batch):
+        with self.conn:
+            self.conn.executemany(UPSERT_SQL, batch)
+        return len(batch)
+
+    def top_articles(self, k=10, days=None, category=None, source=None,
+                     until=None, order_by="views"):
+        """Top K articles in a date window, optionally filtered.
+
+        Args:
+            k (int): Number of articles to return
+            days (int): Window length in days ending at ``until`` (all dates if None)
+            category (str): Only articles of this category
+            source (str): Only articles from this source
+            until (str): Last day of the window as "YYYY-MM-DD" (today if None)
+            order_by (str): One of "views", "shares", "comments" or "date"
+        """
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"order_by must be one of {sorted(ORDER_COLUMNS)}")
+        clauses = []
+        params = []
+        end = datetime.strptime(until, "%Y-%m-%d") if until else datetime.now()
+        if days is not None:
+            clauses.append("date >= ?")
+            params.append((end - timedelta(days=days - 1)).strftime("%Y-%m-%d"))
+        if days is not None or until:
+            clauses.append("date <= ?")
+            params.append(end.strftime("%Y-%m-%d"))
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM articles {where} ORDER BY {ORDER_COLUMNS[order_by]} LIMIT ?"
+        params.append(k)
+        return [_row_to_news(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, url):
+        """Fetch one article by URL (canonicalized), or None."""
+        row = self.conn.execute("SELECT * FROM articles WHERE url = ?",
+                                (canonical_url(url),)).fetchone()
+        return _row_to_news(row) if row else None
+
+    def iter_articles(self):
+        """Yield every stored article in insertion order without loading them all."""
+        for row in self.conn.execute("SELECT * FROM articles ORDER BY id"):
+            yield _row_to_news(row)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def categories(self):
+        """Categories with their article counts, largest first."""
+        rows = self.conn.execute(
+            "SELECT category, COUNT(*) FROM articles GROUP BY category ORDER BY 2 DESC")
+        return {category: count for category, count in rows}
+
+
+def main():
+    """Query the article store from the command line."""
+    parser = argparse.ArgumentParser(description="Consulta o banco de notícias de RH")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Caminho do banco SQLite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    top = subparsers.add_parser("top", help="Top K notícias em uma janela de dias")
+    top.add_argument("-k", type=int, default=10)
+    top.add_argument("--days", type=int, default=None)
+    top.add_argument("--until", default=None)
+    top.add_argument("--category", default=None)
+    top.add_argument("--source", default=None)
+    top.add_argument("--order-by", default="views", choices=sorted(ORDER_COLUMNS))
+
+    subparsers.add_parser("categories", help="Contagem de notícias por categoria")
+
+    args = parser.parse_args()
+
+    with ArticleStore(args.db) as store:
+        if args.command == "top":
+            results = store.top_articles(k=args.k, days=args.days, category=args.category,
+                                         source=args.source, until=args.until,
+                                         order_by=args.order_by)
+            print(f"📰 {len(results)} notícias encontradas ({store.count()} no banco)")
+            for i, news in enumerate(results, 1):
+                print(f"   {i}. {news['title'][:60]} | {news['source']} | {news['date']} | "
+                      f"{news['views']:,} visualizações")
+        else:
+            for category, count in store.categories().items():
+                print(f"   • {category}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Benchmarks
+
+Benchmark suite for the ranking, statistics and HTML rendering hot paths.
+
+Each benchmark runs at several input sizes (100, 10k and 1M articles by
+default), records the best wall time over a few repeats plus the peak memory
+allocated during one extra traced run, and appends the results to a JSON
+Lines history file. The compare command diffs two runs from the history and
+flags regressions.
+
+Usage:
+    python benchmarks.py run --sizes 100 10000 --only stats rank
+    python benchmarks.py list
+    python benchmarks.py compare            # last run vs. the one before
+    python benchmarks.py compare 3 7        # run #3 vs. run #7
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import cycle, islice
+
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+DEFAULT_HISTORY = "benchmark_history.jsonl"
+DEFAULT_SEED = 42
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark. The function gets a size and returns the callable to time."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+_news_cache = {}
+
+
+def synthetic_news(size):
+    """Reproducible article dicts, cached per size across benchmarks."""
+    if size not in _news_cache:
+        from synthetic_news import SyntheticNewsGenerator
+        generator = SyntheticNewsGenerator(seed=DEFAULT_SEED, now=datetime(2025, 8, 14))
+        _news_cache.clear()
+        _news_cache[size] = generator.generate_dicts(size)
+    return _news_cache[size]
+
+
+_output_dir = None
+
+
+def output_dir():
+    """Scratch directory for the stylesheets the render benchmarks build; removed at exit."""
+    global _output_dir
+    if _output_dir is None:
+        _output_dir = tempfile.TemporaryDirectory(prefix="hr_benchmarks_")
+    return _output_dir.name
+
+
+def _ranked_news(size):
+    """Ranked copies of the cached articles, so renders never mutate the cache."""
+    return [dict(item, rank=rank) for rank, item in enumerate(synthetic_news(size), 1)]
+
+
+def _repeat_to(items, size):
+    return [dict(item) for item in islice(cycle(items), size)]
+
+
+@benchmark("stats")
+def bench_stats(size):
+    from news_stats import compute_news_statistics
+    news = synthetic_news(size)
+    return lambda: compute_news_statistics(news)
+
+
+@benchmark("rank")
+def bench_rank(size):
+    from news_ranking import TopKRanker, date_views_score
+    news = synthetic_news(size)
+
+    def run():
+        ranker = TopKRanker(k=100, score=date_views_score)
+        ranker.extend(news)
+        return ranker.results()
+    return run
+
+
+@benchmark("rank_sort_baseline")
+def bench_rank_sort_baseline(size):
+    # run() writes ranks, so it works on copies of the cached articles
+    news = [dict(item) for item in synthetic_news(size)]
+
+    def run():
+        ranked = sorted(news, key=lambda x: (x['date'], x['views']), reverse=True)[:100]
+        for i, item in enumerate(ranked, 1):
+            item['rank'] = i
+        return ranked
+    return run
+
+
+@benchmark("categorize")
+def bench_categorize(size):
+    from current_hr_news_scraper import CurrentHRNewsScraper
+    from synthetic_news import CURRENT_TOPICS
+    scraper = CurrentHRNewsScraper()
+    topics = list(islice(cycle(CURRENT_TOPICS), size))
+    return lambda: [scraper.get_category_from_topic(topic) for topic in topics]
+
+
+@benchmark("render_current")
+def bench_render_current(size):
+    from current_hr_news_scraper import iter_current_news_html
+    from news_stats import compute_news_statistics
+    news = _ranked_news(size)
+    stats = compute_news_statistics(news)
+    return lambda: "".join(iter_current_news_html(news, stats, output_dir=output_dir()))
+
+
+@benchmark("render_top_100")
+def bench_render_top_100(size):
+    from news_stats import compute_news_statistics
+    from top_100_hr_news import iter_top_100_html
+    news = _ranked_news(size)
+    stats = compute_news_statistics(news)
+    return lambda: "".join(iter_top_100_html(news, stats, output_dir=output_dir()))
+
+
+@benchmark("render_real_data")
+def bench_render_real_data(size):
+    from real_hr_scraper import RealHRScraper, iter_real_data_html
+    scraper = RealHRScraper()
+    with _quiet():
+        base = scraper.collect_all_real_data()
+    # Split the size across the four sections
+    data = dict(base)
+    for key in ("news", "jobs", "salaries", "certifications"):
+        data[key] = _repeat_to(base[key], max(1, size // 4))
+    return lambda: "".join(iter_real_data_html(data, output_dir()))
+
+
+@benchmark("render_alternative")
+def bench_render_alternative(size):
+    from alternative_hr_data import AlternativeHRDataCollector, iter_html_from_real_data
+    collector = AlternativeHRDataCollector()
+    with _quiet():
+        base = collector.collect_all_data()
+    data = dict(base)
+    for key in ("linkedin_posts", "news", "trends", "forum_posts"):
+        data[key] = _repeat_to(base[key], max(1, size // 4))
+    return lambda: "".join(iter_html_from_real_data(data, output_dir()))
+
+
+@benchmark("render_tweets")
+def bench_render_tweets(size):
+    import generate_hr_html
+    tweets = _repeat_to(generate_hr_html.generate_simulated_tweets(), size)
+
+    def run():
+        original = generate_hr_html.generate_simulated_tweets
+        generate_hr_html.generate_simulated_tweets = lambda: tweets
+        try:
+            return "".join(generate_hr_html.iter_html_page(output_dir()))
+        finally:
+            generate_hr_html.generate_simulated_tweets = original
+    return run
+
+
+@benchmark("render_grok")
+def bench_render_grok(size):
+    from grok_ai_tweets import generate_html_page
+    lines = [f"{i}. @rh_brasil: Dicas essenciais para gestão de pessoas! ❤️ 1,234 | 💬 56"
+             for i in range(1, size + 1)]
+    text = "\n".join(lines)
+    return lambda: generate_html_page(text, "20250814_000000")
+
+
+class _quiet:
+    """Silence the collectors' progress prints during setup."""
+
+    def __enter__(self):
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+        return self
+
+    def __exit__(self, *exc):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+
+def measure(func, repeat):
+    """Best wall time over ``repeat`` runs and peak traced memory of one run."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def run_benchmarks(names, sizes, repeat, history_path):
+    """Run the selected benchmarks and append one record to the history file."""
+    results = []
+    for size in sizes:
+        for name in names:
+            func = BENCHMARKS[name](size)
+            seconds, peak = measure(func, repeat)
+            results.append({"name": name, "size": size, "seconds": seconds, "peak_bytes": peak})
+            print(f"   {name:<22} {size:>10,}  {seconds * 1000:>12.2f} ms  {peak / 2**20:>10.2f} MiB")
+    record = {
+        "run": len(load_history(history_path)) + 1,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": results
+    }
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def compare_runs(base, head, threshold):
+    """Print per-benchmark ratios between two history records. Returns regressions."""
+    base_results = {(r["name"], r["size"]): r for r in base["results"]}
+    regressions = []
+    print(f"📊 Run #{base['run']} ({base['git']}) → run #{head['run']} ({head['git']})")
+    for result in head["results"]:
+        key = (result["name"], result["size"])
+        before = base_results.get(key)
+        if before is None:
+            continue
+        time_ratio = result["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        mem_ratio = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else 1.0
+        flag = ""
+        if time_ratio > 1 + threshold or mem_ratio > 1 + threshold:
+            flag = "⚠️ regressão"
+            regressions.append(key)
+        elif time_ratio < 1 - threshold:
+            flag = "✅ melhoria"
+        print(f"   {key[0]:<22} {key[1]:>10,}  tempo x{time_ratio:>6.2f}  memória x{mem_ratio:>6.2f}  {flag}")
+    return regressions
+
+
+def main():
+    """Run, list or compare benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmarks de ranking, estatísticas e renderização")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="Arquivo de histórico (JSON Lines)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Executa os benchmarks")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=None)
+    run.add_argument("--repeat", type=int, default=3)
+
+    subparsers.add_parser("list", help="Lista as execuções gravadas")
+
+    compare = subparsers.add_parser("compare", help="Compara duas execuções")
+    compare.add_argument("base", type=int, nargs="?", help="Execução base (padrão: penúltima)")
+    compare.add_argument("head", type=int, nargs="?", help="Execução nova (padrão: última)")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="Variação relativa considerada regressão (padrão: 0.10)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        names = args.only or list(BENCHMARKS)
+        print(f"🚀 Executando {len(names)} benchmarks em {len(args.sizes)} tamanhos...")
+        record = run_benchmarks(names, args.sizes, args.repeat, args.history)
+        print(f"💾 Execução #{record['run']} salva em {args.history}")
+    elif args.command == "list":
+        for record in load_history(args.history):
+            print(f"   #{record['run']} {record['timestamp']} git={record['git']} "
+                  f"({len(record['results'])} resultados)")
+    else:
+        history = {record["run"]: record for record in load_history(args.history)}
+        if len(history) < 2:
+            print("⚠️ São necessárias pelo menos duas execuções para comparar")
+            return 1
+        runs = sorted(history)
+        base = history.get(args.base or runs[-2])
+        head = history.get(args.head or runs[-1])
+        if base is None or head is None:
+            print("❌ Execução não encontrada no histórico")
+            return 1
+        regressions = compare_runs(base, head, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
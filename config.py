@@ -43,3 +43,28 @@ ADVANCED_FILTERS = [
     "-filter:replies",  # Exclude replies
     "-filter:retweets"  # Exclude retweets (optional)
 ]
+
+# Output Compression (generated HTML pages)
+PRECOMPRESS_OUTPUT = True  # Write .gz/.br copies next to each generated page
+COMPRESSION_FORMATS = ("gz", "br")  # .br is skipped when the brotli package is missing
+GZIP_LEVEL = 9  # 1 (fastest) to 9 (smallest)
+BROTLI_QUALITY = 11  # 0 (fastest) to 11 (smallest)
+
+# Static Site Build (site_builder.py)
+SITE_URL = "https://hr-news-scraper.vercel.app"  # Public base URL used in sitemap.xml
+SITE_INDEX_SIZE = 100  # Articles on the site's index page
+SITE_PAGE_SIZE = 100  # Articles per category/source page; larger groups get more pages
+
+# Daemon Mode (daemon.py)
+DAEMON_INTERVALS = {  # Seconds between refreshes of each source
+    "current_news": 900,  # Applies to each site in CurrentHRNewsScraper.news_sources
+    "top_100": 3600,
+    "real_data": 3600,
+    "alternative_data": 3600,
+    "tweets": 1800,
+}
+DAEMON_JITTER = 0.1  # Random +/- fraction of each interval so sources don't fire together
+
+# Tracing (tracing.py)
+TRACING_ENABLED = False  # Record per-stage spans; HR_TRACE=1 in the environment also enables it
+TRACE_DIR = "traces"  # Chrome trace JSON files are written here
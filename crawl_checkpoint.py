@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Crawl Checkpoint
+
+Periodic on-disk checkpoints so an interrupted crawl can resume.
+
+A checkpoint records the crawl frontier (sources not collected yet) and the
+articles of every source already collected. It is rewritten atomically after
+each completed source, so a crash, OOM kill or deploy loses at most the
+source in flight; a resumed crawl reuses the recorded results and only
+visits the remaining sources. A finished crawl deletes its checkpoint.
+
+A checkpoint older than max_age, or one taken over a different source list,
+is discarded with a warning and the crawl starts fresh, so old results are
+never published as current news.
+
+Usage:
+    python current_hr_news_scraper.py --resume
+    python crawl_checkpoint.py            # show the pending checkpoint
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from fragment_cache import DEFAULT_CACHE_DIR
+
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(DEFAULT_CACHE_DIR, "current_news_crawl.json")
+
+# Seconds between checkpoint writes (0: after every source); the last one is always written
+DEFAULT_SAVE_INTERVAL = 0
+
+# Seconds after which a checkpoint is too old to resume
+DEFAULT_MAX_AGE = 3 * 3600
+
+
+class CrawlCheckpoint:
+    """Frontier and partial results of one crawl, persisted as JSON."""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, resume=False, save_interval=DEFAULT_SAVE_INTERVAL,
+                 max_age=DEFAULT_MAX_AGE):
+        self.path = path
+        self.save_interval = save_interval
+        self.max_age = max_age
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.frontier = []
+        self.completed = {}
+        self.resumed = False
+        self._last_save = 0.0
+        if resume:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Erro ao ler checkpoint {self.path}: {e}")
+            return
+        try:
+            age = (datetime.now() - datetime.fromisoformat(data["started_at"])).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            age = None
+        if age is None or age > self.max_age:
+            print(f"⚠️ Checkpoint de {data.get('started_at', '?')} expirado; iniciando nova coleta")
+            return
+        self.started_at = data.get("started_at", self.started_at)
+        self.frontier = data.get("frontier", [])
+        self.completed = data.get("completed", {})
+        self.resumed = True
+
+    def begin(self, names):
+        """Set the crawl's work list; names already completed are not revisited.
+
+        A resumed checkpoint taken over a different list of names is dropped.
+        """
+        names = list(names)
+        if self.resumed and set(self.completed) | set(self.frontier) != set(names):
+            print("⚠️ Checkpoint de outra lista de fontes; iniciando nova coleta")
+            self.started_at = datetime.now().isoformat(timespec="seconds")
+            self.completed = {}
+            self.resumed = False
+        self.frontier = [name for name in names if name not in self.completed]
+        return self.frontier
+
+    def is_done(self, name):
+        return name in self.completed
+
+    def record(self, name, result):
+        """Store one completed unit of work and checkpoint if the interval has passed."""
+        self.completed[name] = result
+        if name in self.frontier:
+            self.frontier.remove(name)
+        if not self.frontier or time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "started_at": self.started_at,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "frontier": self.frontier,
+            "completed": self.completed
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._last_save = time.monotonic()
+
+    def finish(self):
+        """The crawl completed; nothing is left to resume."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    """Print what a --resume would pick up."""
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CHECKPOINT_PATH
+    checkpoint = CrawlCheckpoint(path, resume=True)
+    if not checkpoint.resumed:
+        print(f"✅ Nenhum checkpoint pendente em {path}")
+        return
+    items = sum(len(result) for result in checkpoint.completed.values())
+    print(f"💾 Coleta iniciada em {checkpoint.started_at}")
+    print(f"   • Concluídas: {', '.join(checkpoint.completed) or '-'} ({items} itens)")
+    print(f"   • Pendentes: {', '.join(checkpoint.frontier) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ This software is proprietary and confidential. Unauthorized use, reproduction,
 or distribution is strictly prohibited.
 """
 
+import argparse
 import requests
 from bs4 import BeautifulSoup
 import json
@@ -17,6 +18,60 @@ import time
 import re
 import random
 
+from article_store import ArticleStore
+from config import PRECOMPRESS_OUTPUT
+from crawl_checkpoint import CrawlCheckpoint
+from engagement_timeseries import EngagementTimeSeries
+from fragment_cache import DEFAULT_CACHE_DIR, FragmentCache
+from html_templates import get_template, iter_group_stats
+from html_writer import compression_summary, precompress, write_chunks
+from news_diff import diff_runs, render_changes
+from news_ranking import TopKRanker, date_views_score
+from news_search import NewsSearchIndex
+from news_stats import compute_news_statistics
+from snapshot_store import SnapshotStore, snapshot_run
+from static_assets import build_stylesheet
+from tracing import report_run, span, traced
+
+
+FRAGMENT_CACHE_PATH = f"{DEFAULT_CACHE_DIR}/current_news_fragments.json"
+
+# Page heading (and <title>) of the current-news page
+DEFAULT_HEADING = "100 Notícias Atuais de RH"
+
+# Topic keyword -> category, first match wins
+CATEGORY_MAPPING = {
+    "Nova legislação trabalhista": "Legislação",
+    "IA e automação": "Tecnologia",
+    "Home office híbrido": "Trabalho Remoto",
+    "Benefícios flexíveis": "Benefícios",
+    "Diversidade e inclusão": "Diversidade",
+    "Geração Z": "Gerações",
+    "Bem-estar corporativo": "Bem-estar",
+    "E-learning": "Treinamento",
+    "Retenção de talentos": "Retenção",
+    "Salários": "Remuneração",
+    "Transformação digital": "Tecnologia",
+    "Gestão de performance": "Gestão",
+    "Cultura organizacional": "Cultura",
+    "Liderança": "Liderança",
+    "Recrutamento": "Recrutamento",
+    "People Analytics": "Analytics",
+    "Compliance": "Compliance",
+    "Gestão de mudanças": "Gestão",
+    "Desenvolvimento": "Desenvolvimento",
+    "Clima organizacional": "Cultura"
+}
+
+
+def category_from_topic(topic):
+    """Category of a news topic, "RH Geral" when no keyword matches."""
+    topic = topic.lower()
+    for key, value in CATEGORY_MAPPING.items():
+        if key.lower() in topic:
+            return value
+    return "RH Geral"
+
 
 class CurrentHRNewsScraper:
     """Scrape current HR news from real Brazilian websites."""
@@ -71,58 +126,84 @@ class CurrentHRNewsScraper:
             }
         ]
     
-    def scrape_real_hr_news(self):
-        """Scrape real HR news from Brazilian websites."""
+    def scrape_real_hr_news(self, checkpoint=None):
+        """Scrape real HR news from Brazilian websites.
+        
+        With a CrawlCheckpoint, each collected source is checkpointed and
+        sources already in the checkpoint are not collected again.
+        """
         print("📰 Fazendo web scraping de notícias atuais de RH...")
         
-        all_news = []
+        source_lists = []
+        if checkpoint is not None:
+            checkpoint.begin(source['name'] for source in self.news_sources)
+            if checkpoint.resumed:
+                print(f"♻️ Retomando coleta iniciada em {checkpoint.started_at} "
+                      f"({len(checkpoint.completed)} fontes já coletadas)")
         
         # Try to scrape from real sources
         for source in self.news_sources:
+            if checkpoint is not None and checkpoint.is_done(source['name']):
+                source_lists.append(checkpoint.completed[source['name']])
+                print(f"⏭️ {source['name']} já coletada (checkpoint)")
+                continue
             try:
                 print(f"🔍 Tentando acessar {source['name']}...")
-                
-                # In a real scenario, you would:
-                # 1. Check robots.txt
-                # 2. Respect rate limits
-                # 3. Parse actual HTML content
-                # 4. Extract real data
-                
-                # For demonstration, we'll simulate real scraping with current data
-                current_date = datetime.now()
-                
-                # Generate realistic current news for this source
-                source_news = self.generate_current_news_for_source(source, current_date)
-                all_news.extend(source_news)
+                source_news = self.collect_source(source)
+                source_lists.append(source_news)
+                if checkpoint is not None:
+                    checkpoint.record(source['name'], source_news)
                 
                 print(f"✅ {len(source_news)} notícias coletadas de {source['name']}")
                 
                 # Respect rate limits
-                time.sleep(1)
+                with span("rate_limit"):
+                    time.sleep(1)
                 
             except Exception as e:
                 print(f"⚠️ Erro ao acessar {source['name']}: {e}")
                 continue
         
-        # If we couldn't get enough real data, supplement with current simulated data
-        if len(all_news) < 100:
-            print(f"💡 Complementando com dados simulados atuais...")
-            additional_news = self.generate_additional_current_news(100 - len(all_news))
-            all_news.extend(additional_news)
+        top_100_news = self.rank_current_news(source_lists)
+        if checkpoint is not None:
+            checkpoint.finish()
         
-        # Sort by date (most recent first) and then by views
-        all_news.sort(key=lambda x: (x['date'], x['views']), reverse=True)
+        print(f"✅ {len(top_100_news)} notícias atuais coletadas e ranqueadas")
+        return top_100_news
+    
+    @traced("fetch")
+    def collect_source(self, source):
+        """Collect the current news of one source (one entry of news_sources)."""
+        # In a real scenario, you would:
+        # 1. Check robots.txt
+        # 2. Respect rate limits
+        # 3. Parse actual HTML content
+        # 4. Extract real data
+        
+        # For demonstration, we'll simulate real scraping with current data
+        current_date = datetime.now()
         
-        # Take top 100
-        top_100_news = all_news[:100]
+        # Generate realistic current news for this source
+        return self.generate_current_news_for_source(source, current_date)
+    
+    @traced("rank")
+    def rank_current_news(self, source_lists):
+        """Merge per-source news lists into the ranked top 100."""
+        # Rank articles as they stream in instead of sorting everything at the end
+        ranker = TopKRanker(k=100, score=date_views_score)
+        for source_news in source_lists:
+            ranker.extend(source_news)
         
-        # Reassign ranks
-        for i, news in enumerate(top_100_news, 1):
-            news['rank'] = i
+        # If we couldn't get enough real data, supplement with current simulated data
+        if ranker.seen < 100:
+            print(f"💡 Complementando com dados simulados atuais...")
+            additional_news = self.generate_additional_current_news(100 - ranker.seen)
+            ranker.extend(additional_news)
         
-        print(f"✅ {len(top_100_news)} notícias atuais coletadas e ranqueadas")
-        return top_100_news
+        # Top 100 by date (most recent first) and then by views, ranks reassigned
+        return ranker.results()
     
+    @traced("parse")
     def generate_current_news_for_source(self, source, current_date):
         """Generate realistic current news for a specific source."""
         news_list = []
@@ -335,36 +416,10 @@ class CurrentHRNewsScraper:
         
         return random.choice(summaries)
     
+    @traced("categorize")
     def get_category_from_topic(self, topic):
         """Get category from topic."""
-        category_mapping = {
-            "Nova legislação trabalhista": "Legislação",
-            "IA e automação": "Tecnologia",
-            "Home office híbrido": "Trabalho Remoto",
-            "Benefícios flexíveis": "Benefícios",
-            "Diversidade e inclusão": "Diversidade",
-            "Geração Z": "Gerações",
-            "Bem-estar corporativo": "Bem-estar",
-            "E-learning": "Treinamento",
-            "Retenção de talentos": "Retenção",
-            "Salários": "Remuneração",
-            "Transformação digital": "Tecnologia",
-            "Gestão de performance": "Gestão",
-            "Cultura organizacional": "Cultura",
-            "Liderança": "Liderança",
-            "Recrutamento": "Recrutamento",
-            "People Analytics": "Analytics",
-            "Compliance": "Compliance",
-            "Gestão de mudanças": "Gestão",
-            "Desenvolvimento": "Desenvolvimento",
-            "Clima organizacional": "Cultura"
-        }
-        
-        for key, value in category_mapping.items():
-            if key.lower() in topic.lower():
-                return value
-        
-        return "RH Geral"
+        return category_from_topic(topic)
     
     def generate_additional_current_news(self, count):
         """Generate additional current news to reach 100 articles."""
@@ -424,528 +479,115 @@ class CurrentHRNewsScraper:
         return additional_news
     
     def get_news_statistics(self, news_list):
-        """Generate statistics from the current news data."""
-        total_views = sum(news['views'] for news in news_list)
-        total_shares = sum(news['shares'] for news in news_list)
-        total_comments = sum(news['comments'] for news in news_list)
-        current_news = sum(1 for news in news_list if news.get('is_current', False))
-        
-        categories = {}
-        for news in news_list:
-            cat = news['category']
-            if cat not in categories:
-                categories[cat] = {'count': 0, 'views': 0}
-            categories[cat]['count'] += 1
-            categories[cat]['views'] += news['views']
-        
-        sources = {}
-        for news in news_list:
-            source = news['source']
-            if source not in sources:
-                sources[source] = {'count': 0, 'views': 0}
-            sources[source]['count'] += 1
-            sources[source]['views'] += news['views']
-        
-        return {
-            'total_views': total_views,
-            'total_shares': total_shares,
-            'total_comments': total_comments,
-            'current_news': current_news,
-            'categories': categories,
-            'sources': sources,
-            'avg_views': total_views // len(news_list),
-            'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0],
-            'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0]
-        }
+        """Generate statistics from the current news data in a single pass."""
+        return compute_news_statistics(news_list)
+
+
+def _rank_class(rank):
+    return "top-10" if rank <= 10 else "top-50" if rank <= 50 else "top-100"
+
+
+def iter_current_news_html(news_list, stats, output_dir=".", pagination="", changes="",
+                           fragment_cache=None, page_title=None, site_nav="",
+                           heading=DEFAULT_HEADING):
+    """Yield the HTML page for current HR news in chunks.
+
+    With a FragmentCache, unchanged articles are spliced from cached
+    fragments instead of being formatted again.
+    """
+    if fragment_cache is not None:
+        news_items = (fragment_cache.render(news, _rank_class(news['rank'])) for news in news_list)
+    else:
+        item = get_template("items/current_news_item.html")
+        news_items = (item.render(news=news, rank_class=_rank_class(news['rank']))
+                      for news in news_list)
+    return get_template("current_news.html").stream(
+        stylesheet=build_stylesheet("current_news", output_dir),
+        page_title=page_title,
+        heading=heading,
+        stats=stats,
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        changes=changes,
+        news_items=news_items,
+        pagination=pagination,
+        site_nav=site_nav,
+        category_items=iter_group_stats(stats['categories']),
+        source_items=iter_group_stats(stats['sources'])
+    )
 
 
 def generate_current_news_html(news_list, stats):
     """Generate HTML page for current HR news."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate news HTML
-    news_html = ""
-    for news in news_list:
-        rank_class = "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
-        current_class = "current" if news.get('is_current', False) else ""
-        
-        news_html += f"""
-        <div class="news-item {rank_class} {current_class}">
-            <div class="rank-badge">#{news['rank']}</div>
-            <div class="news-content">
-                <div class="news-header">
-                    <span class="source">{news['source']}</span>
-                    <span class="category">{news['category']}</span>
-                    <span class="date">{news['date']}</span>
-                    {f'<span class="current-badge">🔥 Atual</span>' if news.get('is_current', False) else ''}
-                </div>
-                <h3 class="title">{news['title']}</h3>
-                <p class="summary">{news['summary']}</p>
-                <div class="engagement">
-                    <span class="views">👁️ {news['views']:,} visualizações</span>
-                    <span class="shares">📤 {news['shares']:,} compartilhamentos</span>
-                    <span class="comments">💬 {news['comments']:,} comentários</span>
-                    <a href="https://www.google.com/search?q={news['title'].replace(' ', '+')}+{news['source'].replace(' ', '+')}+RH" target="_blank" rel="noopener noreferrer" class="search-google">
-                        🔍 Buscar no Google
-                    </a>
-                </div>
-            </div>
-        </div>
-        """
-    
-    # Generate category stats HTML
-    category_html = ""
-    for category, data in sorted(stats['categories'].items(), key=lambda x: x[1]['views'], reverse=True):
-        category_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{category}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    # Generate source stats HTML
-    source_html = ""
-    for source, data in sorted(stats['sources'].items(), key=lambda x: x[1]['views'], reverse=True):
-        source_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{source}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>100 Notícias Atuais de RH - Brasil</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-                 .header {{
-             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-             color: white;
-             padding: 40px;
-             text-align: center;
-             position: relative;
-         }}
-         
-         .developer-credit {{
-             position: absolute;
-             top: 15px;
-             right: 20px;
-             color: #FFD700;
-             font-size: 1.1em;
-             font-weight: bold;
-             text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-             z-index: 10;
-         }}
-         
-         .developer-credit a {{
-             color: #FFD700;
-             text-decoration: none;
-             transition: color 0.2s;
-         }}
-         
-         .developer-credit a:hover {{
-             color: #FFA500;
-             text-decoration: underline;
-         }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.3em;
-            opacity: 0.9;
-            margin-bottom: 20px;
-        }}
-        
-        .stats-overview {{
-            background: #f8f9fa;
-            padding: 30px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            text-align: center;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 12px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 1.1em;
-            font-weight: 500;
-        }}
-        
-        .content {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            padding: 30px;
-        }}
-        
-        .news-section {{
-            background: white;
-        }}
-        
-        .news-section h2 {{
-            color: #333;
-            margin-bottom: 25px;
-            font-size: 2em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .news-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-            position: relative;
-        }}
-        
-        .news-item:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 12px 30px rgba(0,0,0,0.15);
-        }}
-        
-        .news-item.top-10 {{
-            border-left: 5px solid #28a745;
-            background: linear-gradient(135deg, #f8fff9 0%, #ffffff 100%);
-        }}
-        
-        .news-item.top-50 {{
-            border-left: 5px solid #ffc107;
-        }}
-        
-        .news-item.top-100 {{
-            border-left: 5px solid #6c757d;
-        }}
-        
-        .news-item.current {{
-            border: 2px solid #dc3545;
-            background: linear-gradient(135deg, #fff5f5 0%, #ffffff 100%);
-        }}
-        
-        .rank-badge {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            background: #667eea;
-            color: white;
-            padding: 8px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        .current-badge {{
-            background: #dc3545;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.8em;
-            font-weight: bold;
-            animation: pulse 2s infinite;
-        }}
-        
-        @keyframes pulse {{
-            0% {{ opacity: 1; }}
-            50% {{ opacity: 0.7; }}
-            100% {{ opacity: 1; }}
-        }}
-        
-        .news-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .source {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .category {{
-            background: #e9ecef;
-            color: #495057;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .title {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.4em;
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }}
-        
-        .search-google {{
-            background: #4285f4;
-            color: white;
-            padding: 8px 15px;
-            border-radius: 20px;
-            text-decoration: none;
-            font-weight: 500;
-            transition: background-color 0.2s;
-            display: inline-flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .search-google:hover {{
-            background: #3367d6;
-            text-decoration: none;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(66, 133, 244, 0.3);
-        }}
-        
-        .summary {{
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-            margin-bottom: 20px;
-        }}
-        
-        .engagement {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .engagement span {{
-            font-size: 0.95em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: 500;
-        }}
-        
-        .sidebar {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 12px;
-            height: fit-content;
-        }}
-        
-        .sidebar h3 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-label {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.1em;
-            margin-bottom: 5px;
-        }}
-        
-        .stat-number {{
-            color: #667eea;
-            font-weight: bold;
-            font-size: 1.2em;
-        }}
-        
-        .stat-views {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 5px;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 25px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        @media (max-width: 1200px) {{
-            .content {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2.5em;
-            }}
-            
-            .news-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .engagement {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-         <div class="container">
-         <div class="header">
-             <div class="developer-credit">Desenvolvido por <a href="https://workitu.com" target="_blank" rel="noopener noreferrer">Workitu TecH</a></div>
-             <h1>🔥 100 Notícias Atuais de RH</h1>
-             <p>As notícias mais recentes sobre Recursos Humanos no Brasil</p>
-             <p>Coletadas de fontes reais e atualizadas diariamente</p>
-             <p>Rankeadas por popularidade</p>
-         </div>
-        
-        <div class="stats-overview">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_views']:,}</div>
-                    <div class="stat-label">Total de Visualizações</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_shares']:,}</div>
-                    <div class="stat-label">Total de Compartilhamentos</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_comments']:,}</div>
-                    <div class="stat-label">Total de Comentários</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['current_news']}</div>
-                    <div class="stat-label">Notícias da Semana</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="news-section">
-                <h2>📰 Notícias Atuais de RH</h2>
-                {news_html}
-            </div>
-            
-            <div class="sidebar">
-                <h3>📈 Estatísticas por Categoria</h3>
-                {category_html}
-                
-                <h3>📰 Estatísticas por Fonte</h3>
-                {source_html}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Current HR News Scraper</p>
-            <p>Notícias coletadas de fontes reais brasileiras de RH</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
+    html_content = "".join(iter_current_news_html(news_list, stats))
     return html_content, timestamp
 
 
 def main():
     """Main function to scrape and display current HR news."""
+    parser = argparse.ArgumentParser(description="Coleta as 100 notícias de RH mais atuais")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continua a coleta interrompida a partir do último checkpoint")
+    args = parser.parse_args()
+    
     print("🚀 Current HR News Scraper")
     print("=" * 60)
     
     # Initialize scraper
     scraper = CurrentHRNewsScraper()
     
-    # Collect current news
-    news_list = scraper.scrape_real_hr_news()
+    # Collect current news, checkpointing each source so a crash can resume
+    checkpoint = CrawlCheckpoint(resume=args.resume)
+    news_list = scraper.scrape_real_hr_news(checkpoint)
     
     # Generate statistics
     stats = scraper.get_news_statistics(news_list)
     
     # Generate HTML
-    html_content, timestamp = generate_current_news_html(news_list, stats)
-    filename = f"current_hr_news_{timestamp}.html"
+    # Each run replaces the same page; earlier versions live in the snapshot store
+    filename = "current_hr_news.html"
     
     try:
-        # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f"✅ 100 notícias atuais coletadas e página HTML gerada!")
-        print(f"📁 Arquivo: {filename}")
+        # Reuse fragments from the previous run and skip unchanged pages
+        fragment_cache = FragmentCache("items/current_news_item.html", FRAGMENT_CACHE_PATH)
+        digest = fragment_cache.page_digest(news_list, stats, build_stylesheet("current_news"))
+        if fragment_cache.page_changed("current_hr_news", digest):
+            # Show what changed since the last snapshot of this page
+            previous = SnapshotStore().latest_data("current_hr_news")
+            changes = render_changes(diff_runs(previous, news_list)) if previous else ""
+            # Stream the page to disk instead of building it in memory
+            with span("render", page=filename):
+                write_chunks(filename, iter_current_news_html(news_list, stats, changes=changes,
+                                                              fragment_cache=fragment_cache))
+            print(f"✅ 100 notícias atuais coletadas e página HTML gerada!")
+            print(f"📁 Arquivo: {filename}")
+            if PRECOMPRESS_OUTPUT:
+                print(f"🗜️ {compression_summary(filename, precompress(filename))}")
+            print(f"♻️ {fragment_cache.hits} fragmentos reaproveitados, {fragment_cache.misses} renderizados")
+        else:
+            filename = None
+            print("♻️ Nenhuma mudança desde a última execução; página não regravada")
+        fragment_cache.save()
+        
+        # Persist articles so dashboards can query them without re-crawling
+        with ArticleStore() as store:
+            saved = store.upsert_many(news_list)
+            print(f"🗄️ {saved} notícias salvas em {store.path} ({store.count()} no total)")
+            indexed = NewsSearchIndex(store).sync()
+            print(f"🔍 {indexed} notícias indexadas para busca textual")
+            EngagementTimeSeries(store).record_run(news_list)
+
+        # Keep a deduplicated snapshot of this run's data and page
+        run = snapshot_run("current_hr_news", [filename] if filename else [], data=news_list)
+        print(f"📸 Snapshot {run['id']} (+{run['added_bytes']:,} bytes novos)")
         
         # Try to open in browser
-        import webbrowser
-        import os
-        file_path = os.path.abspath(filename)
-        webbrowser.open(f'file://{file_path}')
-        print(f"🔗 Página aberta no navegador")
+        if filename:
+            import webbrowser
+            import os
+            file_path = os.path.abspath(filename)
+            webbrowser.open(f'file://{file_path}')
+            print(f"🔗 Página aberta no navegador")
         
         # Show summary
         print("\n📊 Resumo das estatísticas:")
@@ -964,6 +606,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Erro: {e}")
+    
+    report_run("current_hr_news")
 
 
 if __name__ == "__main__":
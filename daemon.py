@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+HR Daemon
+
+Long-running mode that keeps the collectors warm and refreshes each source
+on its own schedule.
+
+The one-shot scripts pay interpreter startup, template compilation, HTTP
+session setup, the SQLite connection and cache loading on every run. The
+daemon does all of that once: collectors and their sessions, the compiled
+templates, the fragment cache, the article store and the snapshot index stay
+in memory between refreshes.
+
+Every site of the current-news scraper, the other collectors and the Grok
+search are separate jobs with their own interval from DAEMON_INTERVALS,
+randomized by DAEMON_JITTER. A page is only regenerated when the input it is
+built from changed; pages keep stable names in the output directory and are
+replaced atomically, with a snapshot of every new version.
+
+Usage:
+    python daemon.py                    # run until Ctrl+C / SIGTERM
+    python daemon.py --once             # refresh every source once and exit
+    python daemon.py --output-dir live --no-tweets
+"""
+
+import argparse
+import heapq
+import os
+import random
+import signal
+import threading
+import time
+from datetime import datetime
+
+from alternative_hr_data import AlternativeHRDataCollector, iter_html_from_real_data
+from article_store import ArticleStore
+from config import DAEMON_INTERVALS, DAEMON_JITTER, PRECOMPRESS_OUTPUT
+from current_hr_news_scraper import (FRAGMENT_CACHE_PATH, CurrentHRNewsScraper,
+                                     iter_current_news_html)
+from engagement_timeseries import EngagementTimeSeries
+from fragment_cache import FragmentCache, input_digest
+from grok_ai_tweets import GrokTweetSearcher, generate_html_page, load_api_key
+from html_writer import precompress, write_chunks
+from news_diff import diff_runs, render_changes
+from news_search import NewsSearchIndex
+from news_stats import compute_news_statistics
+from real_hr_scraper import RealHRScraper, iter_real_data_html
+from snapshot_store import SnapshotStore
+from static_assets import build_stylesheet
+from top_100_hr_news import Top100HRNewsCollector, iter_top_100_html
+from tracing import report_run, reset, span
+
+
+DEFAULT_OUTPUT_DIR = "live"
+
+# Stagger the first round of current-news sites like the one-shot scraper does
+SOURCE_STAGGER_SECONDS = 1
+
+
+class HRDaemon:
+    """Warm collectors plus a jittered per-job schedule."""
+
+    def __init__(self, output_dir=DEFAULT_OUTPUT_DIR, intervals=None, jitter=DAEMON_JITTER,
+                 with_tweets=True):
+        self.output_dir = output_dir
+        self.intervals = dict(DAEMON_INTERVALS, **(intervals or {}))
+        self.jitter = jitter
+        self.stop_event = threading.Event()
+        self.random = random.Random()
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Everything below is created once and reused by every refresh
+        self.scraper = CurrentHRNewsScraper()
+        self.top_100 = Top100HRNewsCollector()
+        self.real = RealHRScraper()
+        self.alternative = AlternativeHRDataCollector()
+        self.searcher = GrokTweetSearcher(load_api_key()) if with_tweets else None
+        self.fragment_cache = FragmentCache("items/current_news_item.html", FRAGMENT_CACHE_PATH)
+        self.store = ArticleStore()
+        self.search_index = NewsSearchIndex(self.store)
+        self.timeseries = EngagementTimeSeries(self.store)
+        self.snapshots = SnapshotStore()
+
+        self.source_news = {}
+        self.digests = {}
+        self._attempted = set()
+        self._queue = []
+        self.jobs = {}
+        now = time.monotonic()
+        for position, source in enumerate(self.scraper.news_sources):
+            self._add_job(f"source:{source['name']}", "current_news",
+                          lambda source=source: self.refresh_news_source(source),
+                          now + position * SOURCE_STAGGER_SECONDS)
+        self._add_job("top_100", "top_100", self.refresh_top_100, now)
+        self._add_job("real_data", "real_data", self.refresh_real_data, now)
+        self._add_job("alternative_data", "alternative_data", self.refresh_alternative_data, now)
+        if self.searcher is not None:
+            self._add_job("tweets", "tweets", self.refresh_tweets, now)
+
+    def _add_job(self, name, interval_key, func, first_run):
+        self.jobs[name] = (func, self.intervals[interval_key])
+        heapq.heappush(self._queue, (first_run, name))
+
+    def _next_delay(self, interval):
+        return interval * self.random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _changed(self, name, data):
+        """Record the digest of a job's input. Returns False when it is unchanged."""
+        digest = input_digest(data)
+        if self.digests.get(name) == digest:
+            return False
+        self.digests[name] = digest
+        return True
+
+    def _publish(self, filename, chunks, kind, data):
+        """Atomically replace a page, precompress it and snapshot the new version."""
+        path = os.path.join(self.output_dir, filename)
+        # write_chunks swaps the finished file in, so readers never see a partial page
+        with span("render", page=filename):
+            size = write_chunks(path, chunks)
+        if PRECOMPRESS_OUTPUT:
+            precompress(path)
+        self.snapshots.save_run(kind, [path], data=data)
+        self.snapshots.apply_retention()
+        print(f"📄 {path} atualizado ({size:,} bytes)")
+        return path
+
+    def _changes_section(self, kind, news_list):
+        previous = self.snapshots.latest_data(kind)
+        return render_changes(diff_runs(previous, news_list)) if previous else ""
+
+    def _save_articles(self, news_list):
+        saved = self.store.upsert_many(news_list)
+        self.search_index.sync()
+        self.timeseries.record_run(news_list)
+        return saved
+
+    def refresh_news_source(self, source):
+        """Re-collect one current-news site; republish the page if it changed."""
+        self._attempted.add(source['name'])
+        news = self.scraper.collect_source(source)
+        if not self._changed(f"source:{source['name']}", news):
+            return
+        self.source_news[source['name']] = news
+        self.publish_current_news()
+
+    def publish_current_news(self):
+        # Wait until every site has been tried once so the first page is complete
+        if len(self._attempted) < len(self.scraper.news_sources):
+            return
+        news_list = self.scraper.rank_current_news(self.source_news.values())
+        stats = compute_news_statistics(news_list)
+        digest = self.fragment_cache.page_digest(
+            news_list, stats, build_stylesheet("current_news", self.output_dir))
+        if not self.fragment_cache.page_changed("current_hr_news", digest):
+            return
+        changes = self._changes_section("current_hr_news", news_list)
+        self._publish("current_hr_news.html", iter_current_news_html(
+            news_list, stats, output_dir=self.output_dir, changes=changes,
+            fragment_cache=self.fragment_cache), "current_hr_news", news_list)
+        self.fragment_cache.save()
+        self._save_articles(news_list)
+
+    def refresh_top_100(self):
+        news_list = self.top_100.get_top_hr_news()
+        if not self._changed("top_100", news_list):
+            return
+        stats = compute_news_statistics(news_list)
+        changes = self._changes_section("top_100_hr_news", news_list)
+        self._publish("top_100_hr_news.html", iter_top_100_html(
+            news_list, stats, output_dir=self.output_dir, changes=changes),
+            "top_100_hr_news", news_list)
+        self._save_articles(news_list)
+
+    def refresh_real_data(self):
+        data = self.real.collect_all_real_data()
+        if self._changed("real_data", data):
+            self._publish("real_hr_scraped.html", iter_real_data_html(data, self.output_dir),
+                          "real_hr_scraped", data)
+
+    def refresh_alternative_data(self):
+        data = self.alternative.collect_all_data()
+        if self._changed("alternative_data", data):
+            self._publish("real_hr_data.html", iter_html_from_real_data(data, self.output_dir),
+                          "real_hr_data", data)
+
+    def refresh_tweets(self):
+        result = self.searcher.search_tweets()
+        if result is None or not self._changed("tweets", result):
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._publish("rh_tweets.html", [generate_html_page(result, timestamp)], "rh_tweets",
+                      {"text": result})
+
+    def run(self, once=False):
+        """Run jobs as they come due until stop() (or one round with once=True)."""
+        while self._queue and not self.stop_event.is_set():
+            due, name = heapq.heappop(self._queue)
+            if self.stop_event.wait(max(0.0, due - time.monotonic())):
+                break
+            func, interval = self.jobs[name]
+            # One trace per job keeps memory flat and reports while the daemon runs
+            reset()
+            started = time.perf_counter()
+            try:
+                with span("job", job=name):
+                    func()
+            except Exception as e:
+                print(f"⚠️ Erro ao atualizar {name}: {e}")
+            print(f"🔄 {name} ({time.perf_counter() - started:.2f}s)")
+            report_run(f"daemon_{name}")
+            if not once:
+                heapq.heappush(self._queue, (time.monotonic() + self._next_delay(interval), name))
+        self.close()
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+    def close(self):
+        self.fragment_cache.save()
+        self.store.close()
+
+
+def main():
+    """Start the daemon and stop it cleanly on SIGINT/SIGTERM."""
+    parser = argparse.ArgumentParser(description="Atualiza as páginas de RH continuamente")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--once", action="store_true", help="Atualiza cada fonte uma vez e sai")
+    parser.add_argument("--no-tweets", action="store_true", help="Não consulta a API do Grok")
+    parser.add_argument("--jitter", type=float, default=DAEMON_JITTER)
+    args = parser.parse_args()
+
+    with_tweets = not args.no_tweets
+    if with_tweets and load_api_key() == "your_xai_api_key_here":
+        print("⚠️ XAI_API_KEY não configurada; busca de tweets desativada")
+        with_tweets = False
+
+    daemon = HRDaemon(args.output_dir, jitter=args.jitter, with_tweets=with_tweets)
+    signal.signal(signal.SIGINT, daemon.stop)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    print(f"🚀 HR Daemon: {len(daemon.jobs)} tarefas, páginas em {args.output_dir}/")
+    daemon.run(once=args.once)
+    print("👋 Daemon encerrado")
+
+
+if __name__ == "__main__":
+    main()
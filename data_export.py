@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Data Export
+
+Stream collected HR data to NDJSON, CSV and Parquet for warehouse loaders.
+
+Every record type has a fixed schema (field names and types), so files from
+different runs line up column for column. Writers consume iterables one
+record at a time: NDJSON and CSV write each line as it arrives and Parquet
+writes one row group per batch, so exporting the whole article store never
+materializes the dataset in memory.
+
+Parquet needs the optional pyarrow package. A path ending in .gz is written
+gzip-compressed for NDJSON and CSV.
+
+Usage:
+    python data_export.py store --formats ndjson parquet --output-dir exports
+    python data_export.py real --formats csv
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import datetime
+from itertools import islice
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow is optional; Parquet export is unavailable without it
+    pa = None
+    pq = None
+
+
+SCHEMAS = {
+    "news": (
+        ("rank", "int"), ("title", "string"), ("source", "string"), ("summary", "string"),
+        ("url", "string"), ("date", "string"), ("category", "string"), ("views", "int"),
+        ("shares", "int"), ("comments", "int"), ("engagement", "int"), ("is_current", "bool")
+    ),
+    "jobs": (
+        ("title", "string"), ("company", "string"), ("location", "string"), ("salary", "string"),
+        ("requirements", "string"), ("date", "string"), ("applications", "int")
+    ),
+    "salaries": (
+        ("position", "string"), ("avg_salary", "string"), ("range", "string"),
+        ("experience", "string"), ("location", "string"), ("trend", "string")
+    ),
+    "certifications": (
+        ("name", "string"), ("institution", "string"), ("duration", "string"), ("price", "string"),
+        ("rating", "string"), ("students", "int"), ("trend", "string")
+    ),
+    "trends": (
+        ("term", "string"), ("trend", "string"), ("volume", "string"), ("engagement", "int")
+    ),
+    "posts": (
+        ("platform", "string"), ("author", "string"), ("content", "string"),
+        ("engagement", "int"), ("comments", "int"), ("date", "string")
+    ),
+}
+
+# Keys of collect_all_real_data() / collect_all_data() and their schema
+DATASET_SCHEMAS = {
+    "news": "news",
+    "jobs": "jobs",
+    "salaries": "salaries",
+    "certifications": "certifications",
+    "trends": "trends",
+    "linkedin_posts": "posts",
+    "forum_posts": "posts",
+}
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+PARQUET_BATCH_SIZE = 10_000
+
+_CASTS = {"string": str, "int": int, "bool": bool}
+
+
+def project(record, schema):
+    """Reduce a record to the schema's fields, casting values and keeping None."""
+    row = {}
+    for field, kind in schema:
+        value = record.get(field)
+        row[field] = None if value is None else _CASTS[kind](value)
+    return row
+
+
+def _open_text(path):
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "wb"), encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def write_ndjson(records, path, schema):
+    """Write one JSON object per line. Returns the number of records."""
+    schema = SCHEMAS[schema] if isinstance(schema, str) else schema
+    count = 0
+    with _open_text(path) as f:
+        for record in records:
+            f.write(json.dumps(project(record, schema), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_csv(records, path, schema):
+    """Write a CSV file with a header row. Returns the number of records."""
+    schema = SCHEMAS[schema] if isinstance(schema, str) else schema
+    count = 0
+    with _open_text(path) as f:
+        writer = csv.writer(f)
+        writer.writerow(field for field, _ in schema)
+        for record in records:
+            writer.writerow(project(record, schema).values())
+            count += 1
+    return count
+
+
+def arrow_schema(schema):
+    """pyarrow schema for one of SCHEMAS."""
+    types = {"string": pa.string(), "int": pa.int64(), "bool": pa.bool_()}
+    return pa.schema([(field, types[kind]) for field, kind in schema])
+
+
+def write_parquet(records, path, schema, batch_size=PARQUET_BATCH_SIZE, compression="zstd"):
+    """Write a compressed Parquet file one row group per batch. Returns the record count."""
+    if pa is None:
+        raise RuntimeError("pyarrow não está instalado; exportação Parquet indisponível")
+    schema = SCHEMAS[schema] if isinstance(schema, str) else schema
+    target = arrow_schema(schema)
+    names = [field for field, _ in schema]
+    count = 0
+    records = iter(records)
+    with pq.ParquetWriter(path, target, compression=compression) as writer:
+        while True:
+            batch = [project(record, schema) for record in islice(records, batch_size)]
+            if not batch:
+                break
+            columns = {name: [row[name] for row in batch] for name in names}
+            writer.write_table(pa.Table.from_pydict(columns, schema=target))
+            count += len(batch)
+    return count
+
+
+WRITERS = {"ndjson": write_ndjson, "csv": write_csv, "parquet": write_parquet}
+
+
+def export_records(records, path, schema, fmt):
+    """Write records in one format; the format is not inferred from the path."""
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato desconhecido: {fmt}")
+    return WRITERS[fmt](records, path, schema)
+
+
+def export_dataset(data, output_dir, basename, formats=("ndjson", "csv")):
+    """Export every known list of a collector result dict.
+
+    Args:
+        data (dict): Output of collect_all_real_data() or collect_all_data()
+        output_dir (str): Directory for the files
+        basename (str): Prefix for file names (<basename>_<key>.<ext>)
+        formats (tuple): Any of FORMATS
+
+    Returns:
+        dict: {path: records written}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for key, schema in DATASET_SCHEMAS.items():
+        if key not in data:
+            continue
+        for fmt in formats:
+            if fmt == "parquet" and pa is None:
+                print("⚠️ pyarrow não instalado; pulando Parquet")
+                continue
+            path = os.path.join(output_dir, f"{basename}_{key}.{fmt}")
+            written[path] = export_records(data[key], path, schema, fmt)
+    return written
+
+
+def main():
+    """Export the article store or a fresh collector run."""
+    parser = argparse.ArgumentParser(description="Exporta dados de RH em NDJSON, CSV ou Parquet")
+    parser.add_argument("source", choices=("store", "real", "alternative"),
+                        help="store: banco de notícias; real/alternative: nova coleta")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=["ndjson"])
+    parser.add_argument("--output-dir", default="exports")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite (source=store)")
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    try:
+        if args.source == "store":
+            from article_store import DEFAULT_DB_PATH, ArticleStore
+            os.makedirs(args.output_dir, exist_ok=True)
+            written = {}
+            with ArticleStore(args.db or DEFAULT_DB_PATH) as store:
+                for fmt in args.formats:
+                    if fmt == "parquet" and pa is None:
+                        print("⚠️ pyarrow não instalado; pulando Parquet")
+                        continue
+                    path = os.path.join(args.output_dir, f"hr_news_store_{timestamp}.{fmt}")
+                    written[path] = export_records(store.iter_articles(), path, "news", fmt)
+        elif args.source == "real":
+            from real_hr_scraper import RealHRScraper
+            data = RealHRScraper().collect_all_real_data()
+            written = export_dataset(data, args.output_dir, f"real_hr_data_{timestamp}", args.formats)
+        else:
+            from alternative_hr_data import AlternativeHRDataCollector
+            data = AlternativeHRDataCollector().collect_all_data()
+            written = export_dataset(data, args.output_dir, f"alternative_hr_data_{timestamp}",
+                                     args.formats)
+    except Exception as e:
+        print(f"❌ Erro na exportação: {e}")
+        return
+
+    for path, count in written.items():
+        print(f"📤 {path}: {count} registros")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Engagement Time Series
+
+Track views/shares/comments per article across collector runs.
+
+Each run appends one point per URL. Points are stored as zigzag varints of
+the deltas to the previous point (timestamp in seconds, views, shares,
+comments), appended to a per-URL blob, so a point usually costs a handful of
+bytes instead of a full copy of the article. The latest values, views per
+hour and acceleration are kept in indexed columns, which makes "fastest
+rising" a plain index scan and lets velocity feed the ranker.
+
+Usage:
+    python engagement_timeseries.py rising -k 10
+"""
+
+import argparse
+from datetime import datetime
+
+from article_store import DEFAULT_DB_PATH, ArticleStore, canonical_url
+
+
+TIMESERIES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS engagement_series (
+    url TEXT PRIMARY KEY,
+    points INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    last_views INTEGER NOT NULL,
+    last_shares INTEGER NOT NULL,
+    last_comments INTEGER NOT NULL,
+    velocity REAL NOT NULL DEFAULT 0,
+    acceleration REAL NOT NULL DEFAULT 0,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_engagement_velocity ON engagement_series (velocity DESC);
+"""
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def encode_varints(values):
+    """Encode signed integers as zigzag LEB128 varints."""
+    out = bytearray()
+    for value in values:
+        value = _zigzag(value)
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_varints(data):
+    """Decode a byte string produced by encode_varints()."""
+    values = []
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(_unzigzag(value))
+        value = 0
+        shift = 0
+    return values
+
+
+class EngagementTimeSeries:
+    """Delta-compressed engagement history stored next to the article store."""
+
+    def __init__(self, store):
+        self.store = store
+        self.conn = store.conn
+        self.conn.executescript(TIMESERIES_SCHEMA)
+
+    def record_run(self, news_iterable, at=None):
+        """Append one point per article for this run. Returns the points written."""
+        ts = int((at or datetime.now()).timestamp())
+        written = 0
+        with self.conn:
+            for news in news_iterable:
+                if not news.get("url"):
+                    continue
+                self._append(canonical_url(news["url"]), ts, news.get("views", 0),
+                             news.get("shares", 0), news.get("comments", 0))
+                written += 1
+        return written
+
+    def _append(self, url, ts, views, shares, comments):
+        row = self.conn.execute(
+            "SELECT points, last_ts, last_views, last_shares, last_comments, velocity "
+            "FROM engagement_series WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            self.conn.execute(
+                "INSERT INTO engagement_series (url, points, last_ts, last_views, last_shares, "
+                "last_comments, data) VALUES (?, 1, ?, ?, ?, ?, ?)",
+                (url, ts, views, shares, comments, encode_varints((ts, views, shares, comments))))
+            return
+        points, last_ts, last_views, last_shares, last_comments, last_velocity = row
+        if ts <= last_ts:
+            # Same run recorded twice; keep the first point
+            return
+        hours = (ts - last_ts) / 3600
+        velocity = (views - last_views) / hours
+        acceleration = (velocity - last_velocity) / hours if points > 1 else 0.0
+        delta = encode_varints((ts - last_ts, views - last_views,
+                                shares - last_shares, comments - last_comments))
+        self.conn.execute(
+            "UPDATE engagement_series SET points = points + 1, last_ts = ?, last_views = ?, "
+            "last_shares = ?, last_comments = ?, velocity = ?, acceleration = ?, "
+            "data = CAST(data || ? AS BLOB) WHERE url = ?",
+            (ts, views, shares, comments, velocity, acceleration, delta, url))
+
+    def history(self, url):
+        """Full history of one URL as (datetime, views, shares, comments) tuples."""
+        row = self.conn.execute("SELECT data FROM engagement_series WHERE url = ?",
+                                (canonical_url(url),)).fetchone()
+        if row is None:
+            return []
+        values = decode_varints(row[0])
+        points = []
+        ts = views = shares = comments = 0
+        for i in range(0, len(values), 4):
+            ts += values[i]
+            views += values[i + 1]
+            shares += values[i + 2]
+            comments += values[i + 3]
+            points.append((datetime.fromtimestamp(ts), views, shares, comments))
+        return points
+
+    def velocity(self, url):
+        """Latest (views per hour, acceleration in views per hour²) for a URL."""
+        row = self.conn.execute(
+            "SELECT velocity, acceleration FROM engagement_series WHERE url = ?",
+            (canonical_url(url),)).fetchone()
+        return (row[0], row[1]) if row else (0.0, 0.0)
+
+    def velocities(self):
+        """Views per hour for every tracked URL."""
+        return dict(self.conn.execute("SELECT url, velocity FROM engagement_series"))
+
+    def fastest_rising(self, k=10, min_points=2):
+        """URLs with the highest current views per hour, joined with article data."""
+        rows = self.conn.execute(
+            "SELECT s.url, s.velocity, s.acceleration, s.last_views, a.title, a.source "
+            "FROM engagement_series s LEFT JOIN articles a ON a.url = s.url "
+            "WHERE s.points >= ? ORDER BY s.velocity DESC LIMIT ?", (min_points, k))
+        return [{"url": url, "velocity": velocity, "acceleration": acceleration,
+                 "views": views, "title": title, "source": source}
+                for url, velocity, acceleration, views, title, source in rows]
+
+
+def velocity_score(series):
+    """Build a TopKRanker score that ranks articles by views per hour."""
+    velocities = series.velocities()
+
+    def score(news):
+        return velocities.get(canonical_url(news.get("url", "")), 0.0)
+
+    return score
+
+
+def main():
+    """Show the fastest rising articles from the command line."""
+    parser = argparse.ArgumentParser(description="Engajamento das notícias ao longo das execuções")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Caminho do banco SQLite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rising = subparsers.add_parser("rising", help="Notícias que mais crescem em visualizações")
+    rising.add_argument("-k", type=int, default=10)
+    history = subparsers.add_parser("history", help="Histórico de uma URL")
+    history.add_argument("url")
+    args = parser.parse_args()
+
+    with ArticleStore(args.db) as store:
+        series = EngagementTimeSeries(store)
+        if args.command == "rising":
+            print("📈 Notícias que mais crescem:")
+            for i, item in enumerate(series.fastest_rising(args.k), 1):
+                print(f"   {i}. {(item['title'] or item['url'])[:60]} | "
+                      f"{item['velocity']:,.0f} visualizações/h")
+        else:
+            for when, views, shares, comments in series.history(args.url):
+                print(f"   {when:%Y-%m-%d %H:%M} | 👁️ {views:,} | 📤 {shares:,} | 💬 {comments:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Fragment Cache
+
+Reuse rendered article fragments between runs.
+
+Consecutive collector runs mostly return the same articles in a slightly
+different order. FragmentCache keys each article by a hash of the fields the
+item template shows, renders it once with placeholders in place of the rank,
+and splices the real rank back in on every later render. The cache lives in
+memory and is saved to disk, so the next run only formats new or changed
+articles.
+
+A digest of the whole page (article keys, ranks, statistics and template
+version) is also kept, letting callers skip rendering and writing entirely
+when nothing changed since the previous run.
+"""
+
+import hashlib
+import json
+import os
+
+from html_templates import get_template
+
+
+DEFAULT_CACHE_DIR = ".cache"
+
+FRAGMENT_FIELDS = ("title", "source", "summary", "url", "date", "views",
+                   "shares", "comments", "category", "is_current")
+
+# NUL never appears in escaped article text, so the sentinels cannot clash
+RANK_SENTINEL = "\x00rank\x00"
+RANK_CLASS_SENTINEL = "\x00rank_class\x00"
+
+
+def _digest(data):
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def input_digest(data):
+    """Digest of collected data, ignoring the collectors' own timestamp field."""
+    if isinstance(data, dict):
+        data = {key: value for key, value in data.items() if key != "timestamp"}
+    return _digest(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class FragmentCache:
+    """Rendered item fragments keyed by article content, persisted as JSON."""
+
+    def __init__(self, template_name, path=None):
+        self.template = get_template(template_name)
+        self.version = _digest(self.template.source)
+        self.path = path
+        self.fragments = {}
+        self.pages = {}
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Erro ao ler cache de fragmentos {self.path}: {e}")
+            return
+        if data.get("version") == self.version:
+            self.fragments = data.get("fragments", {})
+            self.pages = data.get("pages", {})
+
+    def save(self):
+        """Write the fragments used since loading, plus page digests, atomically."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Drop fragments of articles that left the page; keep everything if
+        # nothing was rendered this run (e.g. the page was unchanged)
+        keys = self._used or self.fragments
+        # Long-lived callers (daemon.py) keep the same trimmed set in memory
+        self.fragments = {key: self.fragments[key] for key in keys}
+        self._used = set()
+        data = {
+            "version": self.version,
+            "fragments": self.fragments,
+            "pages": self.pages
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def key(news):
+        """Hash of the article fields shown by the item template (rank excluded)."""
+        return _digest(repr(tuple(news.get(field) for field in FRAGMENT_FIELDS)))
+
+    def render(self, news, rank_class):
+        """Render one article, reusing the cached fragment when it is unchanged."""
+        key = self.key(news)
+        fragment = self.fragments.get(key)
+        if fragment is None:
+            self.misses += 1
+            placeholder = dict(news, rank=RANK_SENTINEL)
+            fragment = self.template.render(news=placeholder, rank_class=RANK_CLASS_SENTINEL)
+            self.fragments[key] = fragment
+        else:
+            self.hits += 1
+        self._used.add(key)
+        return fragment.replace(RANK_SENTINEL, str(news['rank'])).replace(RANK_CLASS_SENTINEL, rank_class)
+
+    def page_digest(self, news_list, stats, *extra):
+        """Digest of everything a page shows except its generation time."""
+        parts = [self.version, json.dumps(stats, sort_keys=True, default=str)]
+        parts.extend(str(value) for value in extra)
+        parts.extend(f"{news['rank']}:{self.key(news)}" for news in news_list)
+        return _digest("\n".join(parts))
+
+    def page_changed(self, name, digest):
+        """Record a page digest. Returns False when it matches the previous one."""
+        if self.pages.get(name) == digest:
+            return False
+        self.pages[name] = digest
+        return True
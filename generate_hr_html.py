@@ -8,6 +8,12 @@ This script generates a beautiful HTML page with simulated HR tweets results.
 import json
 from datetime import datetime
 
+from config import PRECOMPRESS_OUTPUT
+from html_templates import get_template
+from html_writer import compression_summary, precompress, write_chunks
+from static_assets import build_stylesheet
+from tracing import report_run, span
+
 
 def generate_simulated_tweets():
     """Generate simulated HR tweets data."""
@@ -86,258 +92,25 @@ def generate_simulated_tweets():
     return tweets
 
 
+def iter_html_page(output_dir="."):
+    """Yield the HR tweets HTML page in chunks."""
+    tweets = generate_simulated_tweets()
+    item = get_template("items/tweet_item.html")
+    return get_template("hr_tweets.html").stream(
+        stylesheet=build_stylesheet("hr_tweets", output_dir),
+        tweet_count=len(tweets),
+        total_likes=sum(t['likes'] for t in tweets),
+        total_comments=sum(t['comments'] for t in tweets),
+        max_likes=max(t['likes'] for t in tweets),
+        generated_at=datetime.now().strftime('%d/%m/%Y às %H:%M'),
+        tweet_items=(item.render(number=i, tweet=tweet) for i, tweet in enumerate(tweets, 1))
+    )
+
+
 def generate_html_page():
     """Generate a beautiful HTML page with HR tweets."""
-    tweets = generate_simulated_tweets()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate tweets HTML
-    tweets_html = ""
-    for i, tweet in enumerate(tweets, 1):
-        tweets_html += f"""
-        <div class="tweet-item">
-            <div class="tweet-header">
-                <span class="tweet-number">#{i}</span>
-                <span class="tweet-username">{tweet['username']}</span>
-                <span class="tweet-stats">
-                    ❤️ {tweet['likes']:,} | 💬 {tweet['comments']:,}
-                </span>
-            </div>
-            <div class="tweet-text">{tweet['text']}</div>
-            <div class="tweet-footer">
-                <a href="{tweet['link']}" class="tweet-link" target="_blank">Ver no X →</a>
-            </div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Top HR Tweets - Brasil</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        
-        .stats {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            text-align: center;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .tweets-section {{
-            padding: 30px;
-        }}
-        
-        .tweets-section h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-        }}
-        
-        .tweet-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .tweet-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-        }}
-        
-        .tweet-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .tweet-number {{
-            background: #667eea;
-            color: white;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }}
-        
-        .tweet-username {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .tweet-stats {{
-            font-size: 0.9em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 5px 12px;
-            border-radius: 20px;
-        }}
-        
-        .tweet-text {{
-            margin: 15px 0;
-            color: #333;
-            line-height: 1.6;
-            font-size: 1.1em;
-        }}
-        
-        .tweet-footer {{
-            margin-top: 15px;
-        }}
-        
-        .tweet-link {{
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 500;
-            padding: 8px 16px;
-            border: 2px solid #667eea;
-            border-radius: 20px;
-            transition: all 0.2s;
-            display: inline-block;
-        }}
-        
-        .tweet-link:hover {{
-            background: #667eea;
-            color: white;
-            text-decoration: none;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2em;
-            }}
-            
-            .tweet-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Top HR Tweets - Brasil</h1>
-            <p>Os tweets mais populares sobre Recursos Humanos no momento</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stats-grid">
-                <div class="stat-item">
-                    <div class="stat-number">{len(tweets)}</div>
-                    <div class="stat-label">Tweets Analisados</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{sum(t['likes'] for t in tweets):,}</div>
-                    <div class="stat-label">Total de Likes</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{sum(t['comments'] for t in tweets):,}</div>
-                    <div class="stat-label">Total de Comentários</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{max(t['likes'] for t in tweets):,}</div>
-                    <div class="stat-label">Mais Likes (1º lugar)</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="tweets-section">
-            <h2>📊 Ranking por Engajamento</h2>
-            {tweets_html}
-        </div>
-        
-        <div class="footer">
-            <p>Gerado em {datetime.now().strftime('%d/%m/%Y às %H:%M')} | Grok HR Tweets Searcher</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
+    html_content = "".join(iter_html_page())
     return html_content, timestamp
 
 
@@ -345,15 +118,18 @@ def main():
     """Generate and save the HTML page."""
     print("🚀 Gerando página HTML dos tweets de RH...")
     
-    html_content, timestamp = generate_html_page()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"hr_tweets_page_{timestamp}.html"
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page to disk instead of building it in memory
+        with span("render", page=filename):
+            write_chunks(filename, iter_html_page())
         
         print(f"✅ Página HTML gerada com sucesso!")
         print(f"📁 Arquivo: {filename}")
+        if PRECOMPRESS_OUTPUT:
+            print(f"🗜️ {compression_summary(filename, precompress(filename))}")
         print(f"🌐 Abra o arquivo no seu navegador para visualizar")
         
         # Try to open the file in the default browser
@@ -365,6 +141,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Erro ao gerar página HTML: {e}")
+    
+    report_run("hr_tweets_page")
 
 
 if __name__ == "__main__":
@@ -37,6 +37,10 @@ except ImportError:
     FILE_ENCODING = "utf-8"
     SEARCH_TERMS = ["inteligência artificial", "IA", "artificial intelligence"]
     ADVANCED_FILTERS = ["filter:safe", "-filter:replies"]
+    PRECOMPRESS_OUTPUT = True
+
+from html_writer import compression_summary, precompress, write_chunks
+from tracing import report_run, span, traced
 
 
 class GrokTweetSearcher:
@@ -104,6 +108,7 @@ Formate como uma lista numerada.
             "max_tokens": max_tokens
         }
     
+    @traced("fetch")
     def search_tweets(self, model: str = None) -> Optional[str]:
         """
         Search for trending AI tweets using Grok API.
@@ -308,10 +313,11 @@ def main():
                 print(f"💾 Results saved to: {filename}")
                 
                 # Generate HTML file
-                html_content = generate_html_page(result, timestamp)
-                with open(html_filename, 'w', encoding=FILE_ENCODING) as f:
-                    f.write(html_content)
+                with span("render", page=html_filename):
+                    write_chunks(html_filename, [generate_html_page(result, timestamp)])
                 print(f"🌐 HTML page saved to: {html_filename}")
+                if PRECOMPRESS_OUTPUT:
+                    print(f"🗜️ {compression_summary(html_filename, precompress(html_filename))}")
                 
             except Exception as e:
                 print(f"⚠️  Could not save results to file: {e}")
@@ -319,6 +325,8 @@ def main():
             print("💾 File saving disabled in configuration")
     else:
         print("❌ Failed to retrieve tweets. Please check your API key and try again.")
+    
+    report_run("rh_tweets")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Host Sharding
+
+Consistent-hash assignment of crawl sources to workers by hostname.
+
+Politeness limits are per host, so every host should be crawled by exactly
+one worker. HashRing places each worker at many points (virtual nodes) on a
+64-bit hash ring and gives a host to the first worker clockwise from the
+host's own hash. When a worker joins or leaves only the hosts next to its
+points move, about 1/N of them, and every other host keeps its worker.
+
+The job queue uses the ring to let each worker claim only the fetch jobs of
+its own hosts (see job_queue.py); shard_sources() does the same for a plain
+list of sources.
+
+Usage:
+    python host_sharding.py assign --workers w1 w2 w3
+    python host_sharding.py rebalance --workers w1 w2 w3 --to w1 w2 w3 w4
+"""
+
+import argparse
+import bisect
+import hashlib
+from urllib.parse import urlsplit
+
+
+DEFAULT_REPLICAS = 128
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def host_of(source):
+    """Lower-case host of a source's "url", without a leading "www."."""
+    host = (urlsplit(source["url"]).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes."""
+
+    def __init__(self, nodes=(), replicas=DEFAULT_REPLICAS):
+        self.replicas = replicas
+        self.nodes = set(nodes)
+        self._points = []
+        self._owners = []
+        self._rebuild()
+
+    def _rebuild(self):
+        ring = sorted((_hash(f"{node}#{i}"), node) for node in self.nodes
+                      for i in range(self.replicas))
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+
+    def add(self, node):
+        if node not in self.nodes:
+            self.nodes.add(node)
+            self._rebuild()
+
+    def remove(self, node):
+        if node in self.nodes:
+            self.nodes.discard(node)
+            self._rebuild()
+
+    def node_for(self, key):
+        """Worker owning key, or None when the ring is empty."""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[index]
+
+
+def shard_sources(sources, workers, replicas=DEFAULT_REPLICAS):
+    """Split sources by host. Returns {worker: [sources]} with every worker present."""
+    ring = HashRing(workers, replicas)
+    shards = {worker: [] for worker in workers}
+    for source in sources:
+        shards[ring.node_for(host_of(source))].append(source)
+    return shards
+
+
+def moved_hosts(hosts, old_workers, new_workers, replicas=DEFAULT_REPLICAS):
+    """Hosts whose worker changes between two memberships: {host: (old, new)}."""
+    old_ring = HashRing(old_workers, replicas)
+    new_ring = HashRing(new_workers, replicas)
+    moves = {}
+    for host in hosts:
+        old, new = old_ring.node_for(host), new_ring.node_for(host)
+        if old != new:
+            moves[host] = (old, new)
+    return moves
+
+
+def main():
+    """Show how the collector's sources are spread over a set of workers."""
+    from current_hr_news_scraper import CurrentHRNewsScraper
+
+    parser = argparse.ArgumentParser(description="Distribui as fontes entre workers por host")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    assign = subparsers.add_parser("assign", help="Mostra o worker de cada fonte")
+    assign.add_argument("--workers", nargs="+", required=True)
+    rebalance = subparsers.add_parser("rebalance", help="Mostra os hosts que mudam de worker")
+    rebalance.add_argument("--workers", nargs="+", required=True)
+    rebalance.add_argument("--to", nargs="+", required=True)
+    args = parser.parse_args()
+
+    sources = CurrentHRNewsScraper().news_sources
+    if args.command == "assign":
+        for worker, shard in shard_sources(sources, args.workers).items():
+            hosts = ", ".join(host_of(source) for source in shard) or "-"
+            print(f"   {worker}: {hosts}")
+    else:
+        hosts = {host_of(source) for source in sources}
+        moves = moved_hosts(hosts, args.workers, args.to)
+        for host, (old, new) in sorted(moves.items()):
+            print(f"   {host}: {old} → {new}")
+        print(f"🔀 {len(moves)} de {len(hosts)} hosts mudam de worker")
+
+
+if __name__ == "__main__":
+    main()
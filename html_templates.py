@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+HTML Templates
+
+Small precompiled template layer shared by the HTML page generators.
+
+Templates live in the templates/ directory and use a deliberately tiny
+syntax:
+
+- {{ news.title }}           value lookup, HTML-escaped
+- {{ news.views|num }}       thousands separator (1,234)
+- {{ news.title|query }}     URL query encoding (spaces become +)
+- {{ body|raw }}             insert without escaping
+- {% if news.is_current %}...{% endif %}
+- {% include "css/top_100.css" %}   inlined once at compile time
+- {% slot news_items %}      streamed content supplied by the caller
+
+Each template is parsed once into a Python function whose static fragments
+are constants, and compiled templates are cached by name, so rendering a
+page only costs the per-item lookups and escaping.
+"""
+
+import os
+import re
+from functools import lru_cache
+from html import escape
+from urllib.parse import quote_plus
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+_TOKEN_RE = re.compile(r"\{\{\s*(.+?)\s*\}\}|\{%\s*(.+?)\s*%\}", re.S)
+_PATH_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+class TemplateError(Exception):
+    """Raised when a template cannot be parsed."""
+
+
+def _escape(value):
+    value = str(value)
+    # Most values have nothing to escape; skip the five replace() passes then
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return escape(value)
+    return value
+
+
+def _num(value):
+    return format(value, ",")
+
+
+def _query(value):
+    return escape(quote_plus(str(value)))
+
+
+FILTERS = {
+    "raw": "str",
+    "num": "_num",
+    "query": "_query",
+}
+
+
+def _lookup_code(path, strict=True):
+    """Python expression reading a dotted path from the render context."""
+    if not _PATH_RE.match(path):
+        raise TemplateError(f"Expressão inválida no template: {path!r}")
+    code = "ctx"
+    for part in path.split("."):
+        code = f'{code}["{part}"]' if strict else f'({code} or _EMPTY).get("{part}")'
+    return code
+
+
+class Template:
+    """A compiled template: static fragments plus lookups, split at slots."""
+
+    def __init__(self, source, name="<string>", loader=None):
+        self.name = name
+        self._loader = loader or load_source
+        self._constants = []
+        self.slots = []
+        segments = [[]]
+        stack = []
+        for kind, value in self._tokenize(source):
+            target = stack[-1][1] if stack else segments[-1]
+            if kind == "text":
+                target.append(self._constant(value))
+            elif kind == "expr":
+                target.append(self._expression(value))
+            elif value.startswith("if "):
+                stack.append((_lookup_code(value[3:].strip(), strict=False), []))
+            elif value == "endif":
+                if not stack:
+                    raise TemplateError(f"{name}: endif sem if")
+                condition, body = stack.pop()
+                code = f'("".join(({", ".join(body)},)) if {condition} else "")' if body else '""'
+                (stack[-1][1] if stack else segments[-1]).append(code)
+            elif value.startswith("slot "):
+                if stack:
+                    raise TemplateError(f"{name}: slot dentro de if")
+                self.slots.append(value[5:].strip())
+                segments.append([])
+            else:
+                raise TemplateError(f"{name}: instrução desconhecida {value!r}")
+        if stack:
+            raise TemplateError(f"{name}: if sem endif")
+        self._segments = [self._compile(parts) for parts in segments]
+        self.source = source
+
+    def _tokenize(self, source):
+        """Split source into text/expr/stmt tokens, inlining includes."""
+        position = 0
+        for match in _TOKEN_RE.finditer(source):
+            if match.start() > position:
+                yield "text", source[position:match.start()]
+            position = match.end()
+            expr, stmt = match.groups()
+            if expr is not None:
+                yield "expr", expr
+            elif stmt.startswith("include "):
+                yield from self._tokenize(self._loader(stmt[8:].strip().strip("\"'")))
+            else:
+                yield "stmt", stmt
+        if position < len(source):
+            yield "text", source[position:]
+
+    def _constant(self, text):
+        self._constants.append(text)
+        return f"_c{len(self._constants) - 1}"
+
+    def _expression(self, expr):
+        path, _, filter_name = (part.strip() for part in expr.partition("|"))
+        if not filter_name:
+            return f"_escape({_lookup_code(path)})"
+        if filter_name not in FILTERS:
+            raise TemplateError(f"{self.name}: filtro desconhecido {filter_name!r}")
+        return f"{FILTERS[filter_name]}({_lookup_code(path)})"
+
+    def _compile(self, parts):
+        if not parts:
+            return lambda ctx: ""
+        if len(parts) == 1 and parts[0].startswith("_c"):
+            text = self._constants[int(parts[0][2:])]
+            return lambda ctx: text
+        # One f-string per segment: BUILD_STRING beats joining a tuple
+        body = "".join(f"{{{part}}}" for part in parts)
+        source = f"def render(ctx):\n    return f'''{body}'''\n"
+        namespace = {"_escape": _escape, "_num": _num, "_query": _query, "_EMPTY": {}}
+        namespace.update((f"_c{i}", text) for i, text in enumerate(self._constants))
+        exec(compile(source, self.name, "exec"), namespace)
+        return namespace["render"]
+
+    def render(self, **context):
+        """Render the whole template to one string."""
+        if not self.slots:
+            return self._segments[0](context)
+        return "".join(self.stream(**context))
+
+    def stream(self, **context):
+        """Yield the template in chunks, streaming each slot's content in place."""
+        segments = self._segments
+        yield segments[0](context)
+        for slot, segment in zip(self.slots, segments[1:]):
+            content = context.get(slot, "")
+            if isinstance(content, str):
+                yield content
+            else:
+                yield from content
+            yield segment(context)
+
+
+def load_source(name):
+    """Read a template file from TEMPLATE_DIR."""
+    with open(os.path.join(TEMPLATE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """Compiled template by file name, compiled once per process."""
+    return Template(load_source(name), name=name)
+
+
+def iter_group_stats(groups):
+    """Render per-category or per-source sidebar items, most viewed first."""
+    item = get_template("items/stat_item.html")
+    for name, data in sorted(groups.items(), key=lambda x: x[1]['views'], reverse=True):
+        yield item.render(name=name, data=data)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+HTML Writer
+
+Buffered writer for pages produced as a stream of string chunks.
+
+The page generators yield their HTML piece by piece (iter_current_news_html,
+iter_top_100_html, ...). Writing those chunks through HTMLStreamWriter keeps
+memory bounded by the buffer size instead of the page size, and avoids the
+quadratic cost of growing one big string with += inside a loop.
+
+precompress() writes .gz (and .br, when the optional brotli package is
+installed) copies next to a generated page so a static file server can send
+them as-is instead of compressing on every request.
+"""
+
+import gzip
+import os
+
+from config import BROTLI_QUALITY, COMPRESSION_FORMATS, GZIP_LEVEL
+from tracing import span, traced
+
+try:
+    import brotli
+except ImportError:
+    # brotli is optional; only .gz copies are written without it
+    brotli = None
+
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class HTMLStreamWriter:
+    """Encode text chunks to UTF-8 and write them to a binary stream in blocks.
+
+    ``stream`` is anything with a ``write(bytes)`` method: a file opened in
+    binary mode, ``socket.makefile('wb')``, a BytesIO, a WSGI write callable
+    wrapped in an object, etc.
+    """
+
+    def __init__(self, stream, buffer_size=DEFAULT_BUFFER_SIZE, encoding='utf-8'):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self.bytes_written = 0
+        self._pending = []
+        self._pending_size = 0
+
+    def write(self, chunk):
+        """Queue one chunk; flush once the buffer is full."""
+        if not chunk:
+            return
+        data = chunk.encode(self.encoding)
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, chunks):
+        for chunk in chunks:
+            self.write(chunk)
+        return self
+
+    def flush(self):
+        """Write everything queued so far to the underlying stream."""
+        if self._pending:
+            with span("write"):
+                self.stream.write(b"".join(self._pending))
+            self.bytes_written += self._pending_size
+            self._pending = []
+            self._pending_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+
+def write_chunks(target, chunks, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Stream chunks to a file path or binary stream. Returns the bytes written."""
+    if isinstance(target, str):
+        # Write beside the target and swap it in, so readers never see half a page
+        tmp_path = f"{target}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                size = write_chunks(f, chunks, buffer_size)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return size
+    with HTMLStreamWriter(target, buffer_size) as writer:
+        writer.write_all(chunks)
+    return writer.bytes_written
+
+
+def compress_bytes(data, fmt, level=None):
+    """Compress with "gz" or "br". Output is deterministic for equal input."""
+    if fmt == "gz":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL if level is None else level, mtime=0)
+    if fmt == "br":
+        if brotli is None:
+            raise RuntimeError("brotli não está instalado")
+        return brotli.compress(data, quality=BROTLI_QUALITY if level is None else level)
+    raise ValueError(f"Formato de compressão desconhecido: {fmt}")
+
+
+def _replace_if_changed(path, data):
+    """Atomically write data to path unless it already holds these bytes."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+@traced("compress")
+def precompress(path, formats=COMPRESSION_FORMATS, levels=None):
+    """Write compressed copies of a file as path.gz / path.br.
+
+    Copies whose bytes did not change are left untouched. Returns
+    {fmt: (compressed_size, written)} for each format that was produced.
+    """
+    levels = levels or {}
+    with open(path, 'rb') as f:
+        data = f.read()
+    results = {}
+    for fmt in formats:
+        if fmt == "br" and brotli is None:
+            continue
+        compressed = compress_bytes(data, fmt, levels.get(fmt))
+        written = _replace_if_changed(f"{path}.{fmt}", compressed)
+        results[fmt] = (len(compressed), written)
+    return results
+
+
+def compression_summary(path, results):
+    """One-line size report for precompress() results."""
+    size = os.path.getsize(path)
+    parts = [f"{size:,} bytes"]
+    for fmt, (compressed_size, written) in results.items():
+        ratio = compressed_size / size * 100 if size else 0
+        status = "" if written else ", inalterado"
+        parts.append(f".{fmt} {compressed_size:,} bytes ({ratio:.0f}%{status})")
+    return " | ".join(parts)
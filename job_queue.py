@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Job Queue
+
+Durable SQLite job queue and workers for crawling many sources in parallel.
+
+Crawling is split into two kinds of jobs:
+
+- fetch: collect one source's page with CurrentHRNewsScraper.collect_source
+  and enqueue a parse job with the articles it found
+- parse: clean the articles and upsert them into the article store
+
+Fetch jobs carry their source's host. Workers register with a heartbeat and
+build a consistent-hash ring of the live workers (host_sharding.py); each
+one only claims fetch jobs for the hosts it owns, so each host's rate limit
+is paced by a single worker, and the ring rebalances when workers join or
+leave.
+Independently of sharding, a fetch job is never claimed while another job
+for the same host is leased, which keeps per-host politeness during
+rebalancing too.
+
+Workers claim jobs with a lease. A job whose worker dies becomes visible
+again once its lease (visibility timeout) expires; a job that raises is
+retried with exponential backoff until it runs out of attempts and is marked
+failed. Claims, completions and retries are single transactions, so any
+number of worker processes can share one queue file, and throughput grows
+with the number of workers since each one spends most of its time waiting
+on the network and on rate limits.
+
+SQLite stands in for a networked queue: workers on several machines need the
+queue file on storage with working file locks.
+
+Usage:
+    python job_queue.py enqueue                  # fetch jobs for every known source
+    python job_queue.py enqueue --sources sources.json
+    python job_queue.py worker --idle-exit
+    python job_queue.py workers -n 8 --idle-exit
+    python job_queue.py stats
+    python job_queue.py purge --days 7
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+
+from host_sharding import HashRing, host_of
+
+
+DEFAULT_QUEUE_PATH = "hr_jobs.db"
+
+DEFAULT_LEASE_SECONDS = 60
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 600
+POLL_INTERVAL = 1.0
+# Workers silent for longer than this drop out of the ring
+WORKER_TTL = 30
+# Pause after each fetch, like the one-shot scraper's per-source rate limit
+FETCH_DELAY = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT,
+    host TEXT,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (state, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (state, lease_expires);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs (dedupe_key)
+    WHERE state IN ('queued', 'leased');
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    last_seen REAL NOT NULL
+);
+"""
+
+# Queue files created before jobs had a host column
+HOST_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_jobs_host ON jobs (host, state)"
+
+CLAIM_SQL = """
+UPDATE jobs
+SET state = 'leased', lease_owner = :owner, lease_expires = :now + :lease,
+    attempts = attempts + 1, updated_at = :now
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, host, available_at,
+               -- At most one job per host in a claim, even when limit > 1
+               ROW_NUMBER() OVER (PARTITION BY host ORDER BY available_at, id) AS host_rank
+        FROM jobs AS candidate
+        WHERE ((state = 'queued' AND available_at <= :now)
+               OR (state = 'leased' AND lease_expires <= :now AND attempts < max_attempts))
+          AND (host IS NULL
+               OR ((:hosts IS NULL OR host IN (SELECT value FROM json_each(:hosts)))
+                   AND NOT EXISTS (SELECT 1 FROM jobs AS busy
+                                   WHERE busy.host = candidate.host AND busy.state = 'leased'
+                                     AND busy.lease_expires > :now)))
+    )
+    WHERE host IS NULL OR host_rank = 1
+    ORDER BY available_at
+    LIMIT :limit
+)
+RETURNING id, kind, payload, attempts, max_attempts
+"""
+
+# Leases that expired on their last attempt will never be claimed again
+EXPIRE_SQL = """
+UPDATE jobs
+SET state = 'failed', last_error = 'lease expired', lease_owner = NULL, updated_at = :now
+WHERE state = 'leased' AND lease_expires <= :now AND attempts >= max_attempts
+"""
+
+
+def retry_delay(attempts):
+    """Exponential backoff before the next attempt, capped at RETRY_MAX_SECONDS."""
+    return min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+
+
+class JobQueue:
+    """Leased jobs in one SQLite file, safe to share between processes."""
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "host" not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN host TEXT")
+        self.conn.execute(HOST_INDEX_SQL)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _write(self, sql, params=()):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.execute(sql, params)
+            rows = cursor.fetchall()
+            count = cursor.rowcount
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return rows, count
+
+    def enqueue(self, kind, payload, dedupe_key=None, delay=0, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                host=None):
+        """Add a job. Returns its id, or None when an equal dedupe_key is still pending."""
+        now = time.time()
+        rows, _ = self._write(
+            "INSERT OR IGNORE INTO jobs (kind, payload, dedupe_key, host, max_attempts, "
+            "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?) RETURNING id",
+            (kind, json.dumps(payload, ensure_ascii=False), dedupe_key, host, max_attempts,
+             now + delay, now, now))
+        return rows[0]["id"] if rows else None
+
+    def claim(self, owner, limit=1, hosts=None):
+        """Lease up to ``limit`` ready jobs. Returns a list of job dicts.
+
+        With ``hosts``, jobs bound to other hosts are left for their owners;
+        jobs without a host (parse jobs) can always be claimed.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(EXPIRE_SQL, {"now": now})
+            rows = self.conn.execute(CLAIM_SQL, {
+                "owner": owner, "now": now, "lease": self.lease_seconds, "limit": limit,
+                "hosts": None if hosts is None else json.dumps(sorted(hosts))
+            }).fetchall()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [{"id": row["id"], "kind": row["kind"], "payload": json.loads(row["payload"]),
+                 "attempts": row["attempts"], "max_attempts": row["max_attempts"]}
+                for row in rows]
+
+    def extend_lease(self, job_id, owner, seconds=None):
+        """Heartbeat for long jobs. Returns False when the lease was lost."""
+        now = time.time()
+        _, count = self._write(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+            "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (now + (seconds or self.lease_seconds), now, job_id, owner))
+        return count == 1
+
+    def complete(self, job_id, owner):
+        """Mark a leased job done. Returns False when the lease was lost meanwhile."""
+        _, count = self._write(
+            "UPDATE jobs SET state = 'done', lease_owner = NULL, last_error = NULL, updated_at = ? "
+            "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time(), job_id, owner))
+        return count == 1
+
+    def fail(self, job_id, owner, error):
+        """Schedule a retry with backoff, or mark the job failed on its last attempt."""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                (job_id, owner)).fetchone()
+            if row is not None:
+                if row["attempts"] >= row["max_attempts"]:
+                    state, available_at = "failed", now
+                else:
+                    state, available_at = "queued", now + retry_delay(row["attempts"])
+                self.conn.execute(
+                    "UPDATE jobs SET state = ?, available_at = ?, lease_owner = NULL, "
+                    "last_error = ?, updated_at = ? WHERE id = ?",
+                    (state, available_at, str(error)[:1000], now, job_id))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return row is not None
+
+    def heartbeat(self, worker_id, ttl=WORKER_TTL):
+        """Register a worker as alive and drop silent ones. Returns the live worker ids."""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "INSERT INTO workers (worker_id, last_seen) VALUES (?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET last_seen = excluded.last_seen",
+                (worker_id, now))
+            self.conn.execute("DELETE FROM workers WHERE last_seen < ?", (now - ttl,))
+            rows = self.conn.execute("SELECT worker_id FROM workers").fetchall()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return sorted(row["worker_id"] for row in rows)
+
+    def leave(self, worker_id):
+        """Remove a worker from the ring right away (clean shutdown)."""
+        self._write("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    def active_hosts(self):
+        """Hosts with queued or leased jobs."""
+        return [row["host"] for row in self.conn.execute(
+            "SELECT DISTINCT host FROM jobs WHERE host IS NOT NULL AND state IN ('queued', 'leased')")]
+
+    def stats(self):
+        """{kind: {state: count}}."""
+        counts = {}
+        for row in self.conn.execute("SELECT kind, state, COUNT(*) AS n FROM jobs GROUP BY kind, state"):
+            counts.setdefault(row["kind"], {})[row["state"]] = row["n"]
+        return counts
+
+    def pending(self):
+        """Jobs that are queued or leased (including expired leases)."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE state IN ('queued', 'leased')").fetchone()[0]
+
+    def purge(self, older_than_days=7):
+        """Delete finished jobs older than the given age. Returns the count."""
+        cutoff = time.time() - older_than_days * 86400
+        _, count = self._write(
+            "DELETE FROM jobs WHERE state IN ('done', 'failed') AND updated_at < ?", (cutoff,))
+        return count
+
+
+class CrawlWorker:
+    """Runs fetch and parse jobs with the existing collector and article store."""
+
+    def __init__(self, queue, worker_id=None, fetch_delay=FETCH_DELAY, db_path=None, sharded=True):
+        # Imported here so queue-only commands don't load the scraping stack
+        from article_store import DEFAULT_DB_PATH, ArticleStore
+        from current_hr_news_scraper import CurrentHRNewsScraper
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.fetch_delay = fetch_delay
+        self.scraper = CurrentHRNewsScraper()
+        self.store = ArticleStore(db_path or DEFAULT_DB_PATH)
+        self.handlers = {"fetch": self.handle_fetch, "parse": self.handle_parse}
+        self.sharded = sharded
+        self.ring = HashRing()
+        self._owners = {}
+        self.processed = 0
+        self.failed = 0
+
+    def owned_hosts(self):
+        """Heartbeat, rebuild the ring if membership changed, return this worker's hosts."""
+        workers = self.queue.heartbeat(self.worker_id)
+        if set(workers) != self.ring.nodes:
+            self.ring = HashRing(workers)
+            self._owners = {}
+            print(f"🔀 [{self.worker_id}] {len(workers)} workers ativos; hosts redistribuídos")
+        owned = []
+        for host in self.queue.active_hosts():
+            owner = self._owners.get(host)
+            if owner is None:
+                owner = self._owners[host] = self.ring.node_for(host)
+            if owner == self.worker_id:
+                owned.append(host)
+        return owned
+
+    def handle_fetch(self, payload):
+        source = payload["source"]
+        news = self.scraper.collect_source(source)
+        self.queue.enqueue("parse", {"source": source["name"], "news": news})
+        time.sleep(self.fetch_delay)
+
+    def handle_parse(self, payload):
+        news = [item for item in payload["news"] if item.get("url") and item.get("title")]
+        self.store.upsert_many(news)
+
+    def run_job(self, job):
+        handler = self.handlers.get(job["kind"])
+        try:
+            if handler is None:
+                raise ValueError(f"Tipo de tarefa desconhecido: {job['kind']}")
+            handler(job["payload"])
+        except Exception as e:
+            self.failed += 1
+            self.queue.fail(job["id"], self.worker_id, e)
+            print(f"⚠️ [{self.worker_id}] tarefa {job['id']} ({job['kind']}) falhou "
+                  f"na tentativa {job['attempts']}/{job['max_attempts']}: {e}")
+            return False
+        self.queue.complete(job["id"], self.worker_id)
+        self.processed += 1
+        return True
+
+    def run(self, max_jobs=None, idle_exit=False, poll_interval=POLL_INTERVAL):
+        """Claim and run jobs until max_jobs, or until the queue drains with idle_exit."""
+        while max_jobs is None or self.processed + self.failed < max_jobs:
+            hosts = self.owned_hosts() if self.sharded else None
+            jobs = self.queue.claim(self.worker_id, hosts=hosts)
+            if not jobs:
+                if idle_exit and not self.queue.pending():
+                    break
+                time.sleep(poll_interval)
+                continue
+            for job in jobs:
+                self.run_job(job)
+        if self.sharded:
+            self.queue.leave(self.worker_id)
+        self.store.close()
+        return self.processed
+
+
+def _worker_process(queue_path, worker_id, max_jobs, idle_exit, fetch_delay, lease_seconds,
+                    sharded=True):
+    with JobQueue(queue_path, lease_seconds) as queue:
+        worker = CrawlWorker(queue, worker_id, fetch_delay, sharded=sharded)
+        processed = worker.run(max_jobs, idle_exit)
+    print(f"✅ [{worker.worker_id}] {processed} tarefas concluídas, {worker.failed} falhas")
+
+
+def _load_sources(path):
+    if path is None:
+        from current_hr_news_scraper import CurrentHRNewsScraper
+        return CurrentHRNewsScraper().news_sources
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    """Enqueue crawl jobs, run workers and inspect the queue."""
+    parser = argparse.ArgumentParser(description="Fila de tarefas de coleta de notícias de RH")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="Arquivo SQLite da fila")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                        help="Tempo de reserva de cada tarefa, em segundos")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    enqueue = subparsers.add_parser("enqueue", help="Agenda a coleta das fontes")
+    enqueue.add_argument("--sources", default=None,
+                         help="JSON com a lista de fontes (padrão: fontes do coletor atual)")
+    for name in ("worker", "workers"):
+        worker = subparsers.add_parser(name, help="Executa um worker" if name == "worker"
+                                       else "Executa vários workers locais")
+        if name == "workers":
+            worker.add_argument("-n", type=int, default=os.cpu_count(), help="Número de processos")
+        worker.add_argument("--id", default=None, help="Identificador do worker")
+        worker.add_argument("--max-jobs", type=int, default=None)
+        worker.add_argument("--idle-exit", action="store_true", help="Sai quando a fila esvaziar")
+        worker.add_argument("--delay", type=float, default=FETCH_DELAY,
+                            help="Pausa após cada coleta, em segundos")
+        worker.add_argument("--no-sharding", action="store_true",
+                            help="Qualquer worker pode coletar qualquer host")
+    subparsers.add_parser("stats", help="Mostra a situação da fila")
+    purge = subparsers.add_parser("purge", help="Remove tarefas finalizadas antigas")
+    purge.add_argument("--days", type=float, default=7)
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        _worker_process(args.queue, args.id, args.max_jobs, args.idle_exit, args.delay, args.lease,
+                        not args.no_sharding)
+        return
+    if args.command == "workers":
+        # Create the schema once before the workers race to do it
+        JobQueue(args.queue).close()
+        start = time.perf_counter()
+        processes = [multiprocessing.Process(
+            target=_worker_process,
+            args=(args.queue, f"{args.id or socket.gethostname()}:{i}", args.max_jobs,
+                  args.idle_exit, args.delay, args.lease, not args.no_sharding))
+            for i in range(args.n)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        print(f"⏱️ {args.n} workers em {time.perf_counter() - start:.2f}s")
+        return
+
+    with JobQueue(args.queue, args.lease) as queue:
+        if args.command == "enqueue":
+            try:
+                sources = _load_sources(args.sources)
+            except (OSError, ValueError) as e:
+                print(f"❌ Erro ao ler fontes: {e}")
+                return
+            added = sum(queue.enqueue("fetch", {"source": source}, host=host_of(source),
+                                      dedupe_key=f"fetch:{source['name']}") is not None
+                        for source in sources)
+            print(f"📥 {added} tarefas de coleta agendadas ({len(sources) - added} já pendentes)")
+        elif args.command == "stats":
+            for kind, states in sorted(queue.stats().items()):
+                summary = ", ".join(f"{state}: {count}" for state, count in sorted(states.items()))
+                print(f"   {kind}: {summary}")
+            print(f"📋 {queue.pending()} tarefas pendentes")
+        else:
+            print(f"🧹 {queue.purge(args.days)} tarefas antigas removidas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+News Diff
+
+What changed between two runs of a ranked news list.
+
+Both lists are indexed by canonical URL in one pass each, so the diff is
+O(n): articles added and removed, rank moves and engagement deltas for the
+articles present in both runs. The result is plain JSON-serializable data;
+render_changes() turns it into the optional "changes" section of the
+current-news and top-100 pages.
+
+Usage:
+    python news_diff.py --kind current_hr_news          # last two snapshots
+    python news_diff.py old.json new.json -o diff.json  # two saved news lists
+"""
+
+import argparse
+import heapq
+import json
+import sys
+
+from article_store import canonical_url
+from html_templates import get_template
+from snapshot_store import DEFAULT_SNAPSHOT_DIR, SnapshotStore
+
+
+ENGAGEMENT_FIELDS = ("views", "shares", "comments")
+
+
+def _index(news_list):
+    index = {}
+    for news in news_list:
+        url = news.get('url')
+        if url:
+            index[canonical_url(url)] = news
+    return index
+
+
+def _brief(url, news):
+    return {"url": url, "title": news.get('title'), "source": news.get('source'),
+            "rank": news.get('rank')}
+
+
+def diff_runs(old_list, new_list):
+    """Compare two ranked news lists keyed by canonical URL.
+
+    Returns:
+        dict: summary counts plus "added", "removed", "moved" and
+        "engagement" lists. Moves carry old/new rank and ``change`` (positive
+        means the article climbed); engagement entries carry per-field deltas.
+    """
+    old_index = _index(old_list)
+    new_index = _index(new_list)
+    added = []
+    moved = []
+    engagement = []
+    for url, news in new_index.items():
+        old = old_index.get(url)
+        if old is None:
+            added.append(_brief(url, news))
+            continue
+        old_rank, new_rank = old.get('rank'), news.get('rank')
+        if old_rank != new_rank and old_rank is not None and new_rank is not None:
+            entry = _brief(url, news)
+            entry.update(old_rank=old_rank, new_rank=new_rank, change=old_rank - new_rank)
+            moved.append(entry)
+        deltas = {field: news.get(field, 0) - old.get(field, 0) for field in ENGAGEMENT_FIELDS}
+        if any(deltas.values()):
+            entry = _brief(url, news)
+            entry.update(deltas)
+            engagement.append(entry)
+    removed = [_brief(url, news) for url, news in old_index.items() if url not in new_index]
+    return {
+        "summary": {
+            "old_count": len(old_index),
+            "new_count": len(new_index),
+            "added": len(added),
+            "removed": len(removed),
+            "moved": len(moved),
+            "engagement": len(engagement)
+        },
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+        "engagement": engagement
+    }
+
+
+def _change_items(diff, limit):
+    for news in diff["added"][:limit]:
+        yield "added", "🆕", news["title"], f"entrou em #{news['rank']}"
+    for news in diff["removed"][:limit]:
+        yield "removed", "❌", news["title"], f"saiu (era #{news['rank']})"
+    for news in heapq.nlargest(limit, diff["moved"], key=lambda m: abs(m["change"])):
+        direction = "up" if news["change"] > 0 else "down"
+        icon = "⬆️" if news["change"] > 0 else "⬇️"
+        yield direction, icon, news["title"], f"#{news['old_rank']} → #{news['new_rank']}"
+    for news in heapq.nlargest(limit, diff["engagement"], key=lambda e: e["views"]):
+        if news["views"] > 0:
+            yield "up", "📈", news["title"], f"+{news['views']:,} visualizações"
+
+
+def render_changes(diff, limit=5):
+    """HTML for the page's changes section; empty when nothing changed."""
+    summary = diff["summary"]
+    if not any(summary[key] for key in ("added", "removed", "moved", "engagement")):
+        return ""
+    item = get_template("items/change_item.html")
+    change_items = (item.render(kind=kind, icon=icon, title=title, detail=detail)
+                    for kind, icon, title, detail in _change_items(diff, limit))
+    return get_template("items/changes.html").render(summary=summary, change_items=change_items)
+
+
+def _load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    """Diff two news lists (JSON files) or the last two snapshots of a kind."""
+    parser = argparse.ArgumentParser(description="Diferenças entre duas execuções do ranking")
+    parser.add_argument("files", nargs="*", help="Listas de notícias antiga e nova (JSON)")
+    parser.add_argument("--kind", default=None, help="Tipo de snapshot, ex.: current_hr_news")
+    parser.add_argument("--snapshots", default=None, help="Diretório dos snapshots")
+    parser.add_argument("-o", "--output", default=None, help="Arquivo JSON de saída")
+    args = parser.parse_args()
+
+    if args.kind:
+        store = SnapshotStore(args.snapshots or DEFAULT_SNAPSHOT_DIR)
+        runs = [run for run in store.runs(args.kind) if "data.json" in run["files"]]
+        if len(runs) < 2:
+            print(f"⚠️ São necessárias duas execuções de {args.kind} para comparar")
+            return 1
+        old_list, new_list = (json.loads(store.restore(run["id"], "data.json")) for run in runs[-2:])
+    elif len(args.files) == 2:
+        old_list, new_list = (_load_json(path) for path in args.files)
+    else:
+        parser.error("informe dois arquivos JSON ou --kind")
+
+    diff = diff_runs(old_list, new_list)
+    output = json.dumps(diff, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        summary = diff["summary"]
+        print(f"🔄 {summary['added']} novas, {summary['removed']} removidas, "
+              f"{summary['moved']} mudaram de posição → {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
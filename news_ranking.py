@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+News Ranking
+
+Streaming top-K ranker for HR news articles.
+
+Articles are pushed one at a time into a bounded heap, so ranking N candidates
+costs O(N log K) time and O(K) memory instead of sorting the whole list and
+slicing it. Scores are pluggable and an optional per-source cap keeps a single
+source from dominating the ranking.
+"""
+
+import heapq
+import math
+from datetime import datetime
+
+from tracing import traced
+
+
+def views_score(news):
+    """Score an article by its raw view count."""
+    return news['views']
+
+
+def date_views_score(news):
+    """Score an article by date first and views second (most recent first)."""
+    return (news['date'], news['views'])
+
+
+def engagement_score(view_weight=1.0, share_weight=0.0, comment_weight=0.0,
+                     half_life_days=None, now=None):
+    """Build a weighted engagement score with optional exponential recency decay.
+
+    With ``half_life_days`` set, an article loses half of its score every
+    ``half_life_days`` days since its publication date.
+    """
+    reference = now or datetime.now()
+    decay_rate = math.log(2) / half_life_days if half_life_days else 0.0
+
+    def score(news):
+        value = (news['views'] * view_weight
+                 + news.get('shares', 0) * share_weight
+                 + news.get('comments', 0) * comment_weight)
+        if decay_rate:
+            published = datetime.strptime(news['date'], "%Y-%m-%d")
+            age_days = max(0.0, (reference - published).total_seconds() / 86400)
+            value *= math.exp(-decay_rate * age_days)
+        return value
+
+    return score
+
+
+class _Entry:
+    """Heap entry ordered so that the weakest candidate sits on top."""
+
+    __slots__ = ('score', 'seq', 'item', 'source', 'alive')
+
+    def __init__(self, score, seq, item, source):
+        self.score = score
+        self.seq = seq
+        self.item = item
+        self.source = source
+        self.alive = True
+
+    def __lt__(self, other):
+        # Lower score is weaker; on ties the later arrival is weaker, which
+        # keeps the final ranking stable with respect to input order.
+        if self.score != other.score:
+            return self.score < other.score
+        return self.seq > other.seq
+
+
+class TopKRanker:
+    """Keep the K best articles of a stream in a bounded min-heap."""
+
+    def __init__(self, k=100, score=views_score, per_source_cap=None,
+                 source_key='source'):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.score = score
+        self.per_source_cap = per_source_cap
+        self.source_key = source_key
+        self._heap = []
+        self._by_source = {}
+        self._size = 0
+        self._dead = 0
+        self._seq = 0
+        self.seen = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, news):
+        """Offer one article to the ranker. Returns True if it was kept."""
+        self.seen += 1
+        entry = _Entry(self.score(news), self._seq, news, news.get(self.source_key))
+        self._seq += 1
+
+        if self.per_source_cap is not None:
+            source_heap = self._by_source.setdefault(entry.source, [])
+            self._prune(source_heap)
+            if len(source_heap) >= self.per_source_cap:
+                weakest = source_heap[0]
+                if not weakest < entry:
+                    return False
+                # Replace the source's weakest article; the global size is
+                # unchanged so no other article needs to be evicted.
+                heapq.heapreplace(source_heap, entry)
+                weakest.alive = False
+                self._dead += 1
+                heapq.heappush(self._heap, entry)
+                self._maybe_compact()
+                return True
+
+        if self._size < self.k:
+            self._insert(entry)
+            return True
+
+        self._prune(self._heap)
+        weakest = self._heap[0]
+        if not weakest < entry:
+            return False
+        heapq.heappop(self._heap)
+        weakest.alive = False
+        if self.per_source_cap is not None:
+            # The evicted entry stays in its source heap until pruned lazily.
+            self._dead += 1
+        self._size -= 1
+        self._insert(entry)
+        self._maybe_compact()
+        return True
+
+    def extend(self, news_iterable):
+        """Offer every article of an iterable to the ranker."""
+        for news in news_iterable:
+            self.push(news)
+        return self
+
+    def results(self, assign_ranks=True):
+        """Return the kept articles best-first, optionally rewriting their rank."""
+        entries = sorted((e for e in self._heap if e.alive), reverse=True)
+        ranked = [entry.item for entry in entries]
+        if assign_ranks:
+            for i, news in enumerate(ranked, 1):
+                news['rank'] = i
+        return ranked
+
+    def _insert(self, entry):
+        heapq.heappush(self._heap, entry)
+        if self.per_source_cap is not None:
+            heapq.heappush(self._by_source[entry.source], entry)
+        self._size += 1
+
+    def _prune(self, heap):
+        while heap and not heap[0].alive:
+            heapq.heappop(heap)
+
+    def _maybe_compact(self):
+        # Lazy deletion leaves dead entries behind; rebuild once they outnumber
+        # the live ones so memory stays O(K).
+        if self._dead <= self.k:
+            return
+        self._heap = [e for e in self._heap if e.alive]
+        heapq.heapify(self._heap)
+        for source, heap in self._by_source.items():
+            live = [e for e in heap if e.alive]
+            heapq.heapify(live)
+            self._by_source[source] = live
+        self._dead = 0
+
+
+@traced("rank")
+def rank_top_k(news_iterable, k=100, score=views_score, per_source_cap=None):
+    """Rank a stream of articles and return the top K with ranks 1..K."""
+    ranker = TopKRanker(k=k, score=score, per_source_cap=per_source_cap)
+    ranker.extend(news_iterable)
+    return ranker.results()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+News Search
+
+Full-text search over collected HR news with Portuguese accent folding and
+light stemming.
+
+The index is an SQLite FTS5 table living next to the article store. Python's
+sqlite3 module cannot register custom FTS5 tokenizers, so titles and
+summaries are normalized in Python (accent folding + light stemming, so that
+"recrutamento", "recrutar" and "recrutadores" all index as "recrut") before
+they reach FTS5, and queries go through the same normalization. Results are
+ranked with BM25 and can be filtered by date and category.
+
+Usage:
+    python news_search.py "recrutamento digital" --category Recrutamento --days 30
+"""
+
+import argparse
+import re
+import unicodedata
+from datetime import datetime, timedelta
+
+from article_store import DEFAULT_DB_PATH, ArticleStore, _row_to_news
+
+
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS search_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Title matches weigh more than summary matches in BM25
+TITLE_WEIGHT = 10.0
+SUMMARY_WEIGHT = 3.0
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Plural endings, tried first (on accent-folded words)
+PLURAL_SUFFIXES = (
+    ("oes", "ao"),
+    ("aes", "ao"),
+    ("ais", "al"),
+    ("eis", "el"),
+    ("ois", "ol"),
+    ("ns", "m"),
+    ("res", "r"),
+    ("s", "")
+)
+
+# Derivational and verb endings, longest first
+STEM_SUFFIXES = (
+    "amentos", "imentos", "amento", "imento", "adoras", "adores", "adora",
+    "ador", "acoes", "acao", "mente", "idade", "ancia", "encia", "anca",
+    "ismo", "ista", "avel", "ivel", "ando", "endo", "indo", "aram", "eram",
+    "iram", "ado", "ida", "ar", "er", "ir"
+)
+
+MIN_STEM_LENGTH = 3
+
+
+def fold_accents(text):
+    """Lowercase and strip diacritics ("Gestão" -> "gestao")."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem(word):
+    """Light Portuguese stemmer for an accent-folded, lowercased word."""
+    if len(word) <= MIN_STEM_LENGTH:
+        return word
+    for suffix, replacement in PLURAL_SUFFIXES:
+        if not word.endswith(suffix):
+            continue
+        # A bare final "s" is not a plural in words like "bonus", "tenis" or "stress"
+        if suffix == "s" and word.endswith(("ss", "us", "is")):
+            break
+        candidate = word[:-len(suffix)] + replacement
+        if len(candidate) >= MIN_STEM_LENGTH:
+            word = candidate
+        break
+    for suffix in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def analyze(text):
+    """Split text into folded, stemmed terms."""
+    return [stem(token) for token in WORD_RE.findall(fold_accents(text or ""))]
+
+
+def build_match_query(query):
+    """Turn free text into a safe FTS5 MATCH expression (all terms required)."""
+    terms = analyze(query)
+    return " AND ".join(f'"{term}"' for term in terms)
+
+
+class NewsSearchIndex:
+    """BM25 full-text index over the articles of an ArticleStore."""
+
+    def __init__(self, store):
+        self.store = store
+        self.conn = store.conn
+        self.conn.executescript(SEARCH_SCHEMA)
+
+    def sync(self):
+        """Index articles added or updated since the previous sync.
+
+        Returns the number of articles (re)indexed.
+        """
+        row = self.conn.execute(
+            "SELECT value FROM search_meta WHERE key = 'last_seen'").fetchone()
+        since = row[0] if row else ""
+        rows = self.conn.execute(
+            "SELECT id, title, summary, last_seen FROM articles WHERE last_seen >= ?",
+            (since,)).fetchall()
+        if not rows:
+            return 0
+        latest = max(r["last_seen"] for r in rows)
+        with self.conn:
+            self.conn.executemany("DELETE FROM articles_fts WHERE rowid = ?",
+                                  [(r["id"],) for r in rows])
+            self.conn.executemany(
+                "INSERT INTO articles_fts (rowid, title, summary) VALUES (?, ?, ?)",
+                [(r["id"], " ".join(analyze(r["title"])), " ".join(analyze(r["summary"])))
+                 for r in rows])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_meta (key, value) VALUES ('last_seen', ?)",
+                (latest,))
+        return len(rows)
+
+    def rebuild(self):
+        """Drop and rebuild the whole index."""
+        with self.conn:
+            self.conn.execute("DELETE FROM articles_fts")
+            self.conn.execute("DELETE FROM search_meta WHERE key = 'last_seen'")
+        return self.sync()
+
+    def search(self, query, k=10, category=None, start=None, end=None):
+        """BM25-ranked search, best match first.
+
+        Args:
+            query (str): Free text, e.g. "recrutar talentos"
+            k (int): Maximum number of results
+            category (str): Only articles of this category
+            start (str): First day "YYYY-MM-DD" (inclusive)
+            end (str): Last day "YYYY-MM-DD" (inclusive)
+
+        Returns:
+            list: Article dicts with an extra "score" key (lower is better)
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        clauses = ["articles_fts MATCH ?"]
+        params = [match]
+        if category:
+            clauses.append("a.category = ?")
+            params.append(category)
+        if start:
+            clauses.append("a.date >= ?")
+            params.append(start)
+        if end:
+            clauses.append("a.date <= ?")
+            params.append(end)
+        params.append(k)
+        sql = f"""
+            SELECT a.*, bm25(articles_fts, {TITLE_WEIGHT}, {SUMMARY_WEIGHT}) AS score
+            FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+            WHERE {' AND '.join(clauses)}
+            ORDER BY score
+            LIMIT ?
+        """
+        results = []
+        for row in self.conn.execute(sql, params):
+            news = _row_to_news(row)
+            news["score"] = row["score"]
+            results.append(news)
+        return results
+
+
+def main():
+    """Search collected news from the command line."""
+    parser = argparse.ArgumentParser(description="Busca textual nas notícias de RH coletadas")
+    parser.add_argument("query", help="Termos de busca")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Caminho do banco SQLite")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--category", default=None)
+    parser.add_argument("--days", type=int, default=None, help="Somente os últimos N dias")
+    args = parser.parse_args()
+
+    start = None
+    if args.days:
+        start = (datetime.now() - timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+
+    with ArticleStore(args.db) as store:
+        index = NewsSearchIndex(store)
+        index.sync()
+        results = index.search(args.query, k=args.k, category=args.category, start=start)
+        print(f"🔍 {len(results)} resultados para \"{args.query}\"")
+        for i, news in enumerate(results, 1):
+            print(f"   {i}. {news['title'][:60]} | {news['source']} | {news['date']} "
+                  f"(score {news['score']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+News Server
+
+WSGI service that serves the latest collected news from memory.
+
+Unlike api/index.js, which generates articles and a full page on every
+request, the server renders everything once per refresh: the current-news
+page, its stylesheet, /api/news and /api/stats are encoded to bytes (plus a
+gzip copy) with their headers and a strong ETag computed up front. A request
+is a dictionary lookup, an If-None-Match comparison and a write of bytes
+that already exist.
+
+A background thread reloads the dataset on an interval. The new responses
+are built off to the side and swapped in with a single assignment, so
+requests keep getting the previous (stale) version while a refresh runs and
+never see a half-built one. Nothing is rebuilt when the data did not change,
+so ETags stay valid across refreshes.
+
+The built-in server is threaded and skips per-request logging; under a
+production WSGI server use the app factory, e.g.
+``gunicorn -w 4 'news_server:create_app()'``.
+
+Usage:
+    python news_server.py                       # latest daemon/scraper snapshot
+    python news_server.py --source scrape --interval 300 --port 8080
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import threading
+from datetime import datetime
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from current_hr_news_scraper import iter_current_news_html
+from fragment_cache import DEFAULT_CACHE_DIR, input_digest
+from html_writer import compress_bytes
+from news_stats import compute_news_statistics
+from static_assets import build_stylesheet
+
+
+DEFAULT_REFRESH_INTERVAL = 60
+ASSET_DIR = os.path.join(DEFAULT_CACHE_DIR, "server")
+
+# Responses smaller than this are not worth a gzip copy
+MIN_GZIP_SIZE = 1024
+
+PAGE_CACHE_CONTROL = "no-cache"
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_NOT_FOUND = b'{"error": "Not found"}'
+_METHOD_NOT_ALLOWED = b'{"error": "Method not allowed", "allowedMethods": ["GET", "HEAD"]}'
+_UNAVAILABLE = b'{"error": "Dados ainda carregando"}'
+
+
+def _etag(body):
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+class Resource:
+    """One URL's response, encoded once: identity and gzip variants with headers."""
+
+    __slots__ = ('etag', 'headers', 'body', 'gzip_etag', 'gzip_headers', 'gzip_body')
+
+    def __init__(self, body, content_type, cache_control=PAGE_CACHE_CONTROL):
+        common = [("Content-Type", content_type), ("Cache-Control", cache_control),
+                  ("Vary", "Accept-Encoding"), ("Access-Control-Allow-Origin", "*")]
+        self.body = body
+        self.etag = _etag(body)
+        self.headers = common + [("ETag", self.etag), ("Content-Length", str(len(body)))]
+        self.gzip_body = None
+        self.gzip_etag = None
+        self.gzip_headers = None
+        if len(body) >= MIN_GZIP_SIZE:
+            self.gzip_body = compress_bytes(body, "gz")
+            # A different representation needs a different strong ETag
+            self.gzip_etag = self.etag[:-1] + '-gz"'
+            self.gzip_headers = common + [("ETag", self.gzip_etag), ("Content-Encoding", "gzip"),
+                                          ("Content-Length", str(len(self.gzip_body)))]
+
+
+def _json_resource(data):
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Resource(body, "application/json; charset=utf-8")
+
+
+def build_resources(news_list, asset_dir=ASSET_DIR):
+    """Every served URL for one dataset. Returns {path: Resource}."""
+    stats = compute_news_statistics(news_list)
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    page = "".join(iter_current_news_html(news_list, stats, output_dir=asset_dir)).encode("utf-8")
+    href = build_stylesheet("current_news", asset_dir)
+    with open(os.path.join(asset_dir, href), "rb") as f:
+        stylesheet = f.read()
+    html = Resource(page, "text/html; charset=utf-8")
+    return {
+        "/": html,
+        "/index.html": html,
+        f"/{href}": Resource(stylesheet, "text/css; charset=utf-8", ASSET_CACHE_CONTROL),
+        "/api/news": _json_resource({"generated_at": generated_at, "count": len(news_list),
+                                     "news": news_list}),
+        "/api/stats": _json_resource({"generated_at": generated_at, **stats}),
+    }
+
+
+def _accepts_gzip(accept_encoding):
+    """True when Accept-Encoding allows gzip: listed, or via "*", with q > 0."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _matches(if_none_match, etag):
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class NewsServer:
+    """WSGI app serving prebuilt responses, refreshed in the background.
+
+    Args:
+        load (callable): Returns the current ranked news list
+        interval (float): Seconds between reloads
+        asset_dir (str): Where the stylesheet is built before being read into memory
+    """
+
+    def __init__(self, load, interval=DEFAULT_REFRESH_INTERVAL, asset_dir=ASSET_DIR):
+        self.load = load
+        self.interval = interval
+        self.asset_dir = asset_dir
+        self.resources = None
+        self.digest = None
+        self.refreshes = 0
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        """Reload and swap in new responses. Returns True when the data changed.
+
+        Concurrent calls return immediately; on errors the previous responses
+        keep being served.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            news_list = self.load()
+            if not news_list:
+                return False
+            digest = input_digest(news_list)
+            if digest == self.digest:
+                return False
+            resources = build_resources(news_list, self.asset_dir)
+            # Single reference assignment: readers see the old or the new dict
+            self.resources = resources
+            self.digest = digest
+            self.refreshes += 1
+            return True
+        except Exception as e:
+            print(f"⚠️ Erro ao atualizar os dados servidos: {e}")
+            return False
+        finally:
+            self._refresh_lock.release()
+
+    def start(self):
+        """Load once, then keep refreshing in a daemon thread."""
+        self.refresh()
+        self._thread = threading.Thread(target=self._refresh_loop, name="news-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    def __call__(self, environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        if method not in ("GET", "HEAD"):
+            start_response("405 Method Not Allowed", [
+                ("Content-Type", "application/json"), ("Allow", "GET, HEAD"),
+                ("Content-Length", str(len(_METHOD_NOT_ALLOWED)))])
+            return [_METHOD_NOT_ALLOWED]
+        resources = self.resources
+        if resources is None:
+            start_response("503 Service Unavailable", [
+                ("Content-Type", "application/json"), ("Retry-After", "5"),
+                ("Content-Length", str(len(_UNAVAILABLE)))])
+            return [_UNAVAILABLE]
+        resource = resources.get(environ.get("PATH_INFO") or "/")
+        if resource is None:
+            start_response("404 Not Found", [("Content-Type", "application/json"),
+                                             ("Content-Length", str(len(_NOT_FOUND)))])
+            return [_NOT_FOUND]
+
+        accept_encoding = environ.get("HTTP_ACCEPT_ENCODING", "")
+        if resource.gzip_body is not None and _accepts_gzip(accept_encoding):
+            etag, headers, body = resource.gzip_etag, resource.gzip_headers, resource.gzip_body
+        else:
+            etag, headers, body = resource.etag, resource.headers, resource.body
+        if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and _matches(if_none_match, etag):
+            start_response("304 Not Modified", [("ETag", etag), ("Vary", "Accept-Encoding")])
+            return []
+        start_response("200 OK", headers)
+        return [] if method == "HEAD" else [body]
+
+
+def create_app(source="snapshot", interval=DEFAULT_REFRESH_INTERVAL):
+    """App factory for WSGI servers; starts the background refresh."""
+    if source == "snapshot":
+        from snapshot_store import SnapshotStore
+
+        def load():
+            return SnapshotStore().latest_data("current_hr_news")
+    else:
+        from current_hr_news_scraper import CurrentHRNewsScraper
+        scraper = CurrentHRNewsScraper()
+        load = scraper.scrape_real_hr_news
+    return NewsServer(load, interval).start()
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        # Writing a log line per request would dominate the request cost
+        pass
+
+
+def main():
+    """Serve the latest news on a local port."""
+    parser = argparse.ArgumentParser(description="Serve as notícias de RH a partir da memória")
+    parser.add_argument("--source", choices=("snapshot", "scrape"), default="snapshot",
+                        help="snapshot: última execução salva; scrape: nova coleta a cada atualização")
+    parser.add_argument("--interval", type=float, default=DEFAULT_REFRESH_INTERVAL)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    app = create_app(args.source, args.interval)
+    if app.resources is None:
+        print("⚠️ Nenhum dado disponível ainda; respondendo 503 até a primeira atualização")
+    httpd = make_server(args.host, args.port, app, server_class=ThreadingWSGIServer,
+                        handler_class=QuietHandler)
+    print(f"🌐 Servindo em http://{args.host}:{args.port}/ (atualização a cada {args.interval:g}s)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor encerrado")
+    finally:
+        app.stop()
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+News Statistics
+
+Single-pass, incremental statistics for HR news lists.
+
+NewsStatistics keeps running totals, per-category and per-source aggregates,
+view percentiles and distinct counts. Articles can be added or removed one at
+a time, so streaming and incremental crawls get up-to-date statistics without
+re-scanning the whole list.
+"""
+
+from collections import Counter
+
+from tracing import traced
+
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+class _SortedValues:
+    """Multiset of numbers that is only sorted when a percentile is requested.
+
+    Appends are O(1) and removals are recorded as tombstones, so streaming
+    millions of articles never pays for keeping the list ordered.
+    """
+
+    __slots__ = ('values', 'removed', 'dirty')
+
+    def __init__(self):
+        self.values = []
+        self.removed = Counter()
+        self.dirty = False
+
+    def add(self, value):
+        self.values.append(value)
+        self.dirty = True
+
+    def remove(self, value):
+        self.removed[value] += 1
+
+    def percentile(self, pct):
+        """Nearest-rank percentile."""
+        values = self._sorted()
+        if not values:
+            return 0
+        rank = max(1, -(-pct * len(values) // 100))
+        return values[min(rank, len(values)) - 1]
+
+    def _sorted(self):
+        if self.removed:
+            kept = []
+            removed = self.removed
+            for value in self.values:
+                if removed.get(value):
+                    removed[value] -= 1
+                else:
+                    kept.append(value)
+            self.values = kept
+            self.removed = Counter()
+        if self.dirty:
+            self.values.sort()
+            self.dirty = False
+        return self.values
+
+
+class _GroupStats:
+    """Running aggregates for one category or one source."""
+
+    __slots__ = ('count', 'views', 'view_values', 'members')
+
+    def __init__(self):
+        self.count = 0
+        self.views = 0
+        self.view_values = _SortedValues()
+        self.members = Counter()
+
+    def add(self, views, member):
+        self.count += 1
+        self.views += views
+        self.view_values.add(views)
+        members = self.members
+        members[member] = members.get(member, 0) + 1
+
+    def remove(self, views, member):
+        self.count -= 1
+        self.views -= views
+        self.view_values.remove(views)
+        self.members[member] -= 1
+        if self.members[member] <= 0:
+            del self.members[member]
+
+    def percentile(self, pct):
+        return self.view_values.percentile(pct)
+
+
+class NewsStatistics:
+    """Online aggregator producing the same shape as get_news_statistics."""
+
+    def __init__(self, news_list=None, percentiles=DEFAULT_PERCENTILES):
+        self.percentiles = tuple(percentiles)
+        self.count = 0
+        self.total_views = 0
+        self.total_shares = 0
+        self.total_comments = 0
+        self.current_news = 0
+        self.categories = {}
+        self.sources = {}
+        self.urls = Counter()
+        self._all_views = _SortedValues()
+        if news_list:
+            self.extend(news_list)
+
+    def add(self, news):
+        """Account for one new article."""
+        views = news['views']
+        self.count += 1
+        self.total_views += views
+        self.total_shares += news['shares']
+        self.total_comments += news['comments']
+        if news.get('is_current', False):
+            self.current_news += 1
+        self._all_views.add(views)
+        category = news['category']
+        source = news['source']
+        group = self.categories.get(category)
+        if group is None:
+            group = self.categories[category] = _GroupStats()
+        group.add(views, source)
+        group = self.sources.get(source)
+        if group is None:
+            group = self.sources[source] = _GroupStats()
+        group.add(views, category)
+        url = news.get('url')
+        if url:
+            urls = self.urls
+            urls[url] = urls.get(url, 0) + 1
+
+    def extend(self, news_iterable):
+        """Account for every article of an iterable."""
+        add = self.add
+        for news in news_iterable:
+            add(news)
+        return self
+
+    def remove(self, news):
+        """Forget an article previously passed to add()."""
+        views = news['views']
+        self.count -= 1
+        self.total_views -= views
+        self.total_shares -= news['shares']
+        self.total_comments -= news['comments']
+        if news.get('is_current', False):
+            self.current_news -= 1
+        self._all_views.remove(views)
+        self._remove_from_group(self.categories, news['category'], views, news['source'])
+        self._remove_from_group(self.sources, news['source'], views, news['category'])
+        url = news.get('url')
+        if url:
+            self.urls[url] -= 1
+            if self.urls[url] <= 0:
+                del self.urls[url]
+
+    def update(self, old_news, new_news):
+        """Replace one article's contribution with its updated version."""
+        self.remove(old_news)
+        self.add(new_news)
+
+    def percentile(self, pct):
+        """View-count percentile over all articles."""
+        return self._all_views.percentile(pct)
+
+    def as_dict(self):
+        """Snapshot of the statistics in the get_news_statistics format."""
+        categories = {name: self._group_dict(group, 'distinct_sources')
+                      for name, group in self.categories.items()}
+        sources = {name: self._group_dict(group, 'distinct_categories')
+                   for name, group in self.sources.items()}
+        return {
+            'total_views': self.total_views,
+            'total_shares': self.total_shares,
+            'total_comments': self.total_comments,
+            'current_news': self.current_news,
+            'categories': categories,
+            'sources': sources,
+            'avg_views': self.total_views // self.count if self.count else 0,
+            'top_category': self._top(self.categories),
+            'top_source': self._top(self.sources),
+            'percentiles': {f'p{pct}': self.percentile(pct) for pct in self.percentiles},
+            'distinct': {
+                'categories': len(self.categories),
+                'sources': len(self.sources),
+                'urls': len(self.urls)
+            }
+        }
+
+    def _group_dict(self, group, members_label):
+        data = {'count': group.count, 'views': group.views}
+        for pct in self.percentiles:
+            data[f'p{pct}'] = group.percentile(pct)
+        data[members_label] = len(group.members)
+        return data
+
+    @staticmethod
+    def _remove_from_group(groups, name, views, member):
+        group = groups.get(name)
+        if group is None:
+            return
+        group.remove(views, member)
+        if group.count <= 0:
+            del groups[name]
+
+    @staticmethod
+    def _top(groups):
+        if not groups:
+            return None
+        return max(groups.items(), key=lambda x: x[1].views)[0]
+
+
+@traced("stats")
+def compute_news_statistics(news_list):
+    """Compute statistics for a news list in a single pass."""
+    return NewsStatistics(news_list).as_dict()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Paginated Pages
+
+Archive output mode: split a large ranked news list into static pages of a
+fixed size linked with previous/next navigation.
+
+Every page renders at most ``page_size`` articles plus the sidebar (one
+entry per category and per source), so page weight and render time stay
+the same whether the archive holds 100 or 100,000 articles. Statistics are
+computed once over the whole list and shown on every page.
+
+Usage:
+    python paginated_pages.py -k 10000 --page-size 100
+    python paginated_pages.py --layout current --days 30 --output-dir archive
+"""
+
+import argparse
+import os
+from datetime import datetime
+
+from article_store import DEFAULT_DB_PATH, ORDER_COLUMNS, ArticleStore
+from config import PRECOMPRESS_OUTPUT
+from current_hr_news_scraper import iter_current_news_html
+from html_templates import get_template
+from html_writer import precompress, write_chunks
+from news_stats import compute_news_statistics
+from top_100_hr_news import iter_top_100_html
+from tracing import report_run, span
+
+
+DEFAULT_PAGE_SIZE = 100
+
+LAYOUTS = {
+    "top_100": (iter_top_100_html, "top_100_hr_news_archive"),
+    "current": (iter_current_news_html, "current_hr_news_archive"),
+}
+
+
+def page_count(total, page_size=DEFAULT_PAGE_SIZE):
+    """Number of pages needed for ``total`` articles (at least one)."""
+    return max(1, -(-total // page_size))
+
+
+def page_filename(basename, page):
+    """First page keeps the plain name so existing links still work."""
+    return f"{basename}.html" if page == 1 else f"{basename}_p{page}.html"
+
+
+def render_pagination(basename, page, pages):
+    """Previous/next navigation for one page."""
+    return get_template("items/pagination.html").render(
+        page=page,
+        pages=pages,
+        prev_href=page_filename(basename, page - 1) if page > 1 else None,
+        next_href=page_filename(basename, page + 1) if page < pages else None
+    )
+
+
+def write_paginated(news_list, basename, output_dir=".", page_size=DEFAULT_PAGE_SIZE,
+                    layout="top_100", stats=None):
+    """Write news_list as linked pages of ``page_size`` articles.
+
+    Args:
+        news_list (list): Ranked articles in the collectors' dict shape
+        basename (str): File name prefix, without extension
+        output_dir (str): Directory for the pages and their assets
+        page_size (int): Articles per page
+        layout (str): One of LAYOUTS
+        stats (dict): Precomputed statistics; computed from news_list if None
+
+    Returns:
+        list: Paths of the written pages, first page first
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    render, _ = LAYOUTS[layout]
+    if stats is None:
+        stats = compute_news_statistics(news_list)
+    os.makedirs(output_dir, exist_ok=True)
+    pages = page_count(len(news_list), page_size)
+    paths = []
+    for page in range(1, pages + 1):
+        chunk = news_list[(page - 1) * page_size:page * page_size]
+        path = os.path.join(output_dir, page_filename(basename, page))
+        with span("render", page=page):
+            write_chunks(path, render(chunk, stats, output_dir=output_dir,
+                                      pagination=render_pagination(basename, page, pages)))
+        if PRECOMPRESS_OUTPUT:
+            precompress(path)
+        paths.append(path)
+    return paths
+
+
+def main():
+    """Render the article store as a paginated archive."""
+    parser = argparse.ArgumentParser(description="Gera o arquivo paginado de notícias de RH")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Caminho do banco SQLite")
+    parser.add_argument("-k", type=int, default=10_000, help="Máximo de notícias no arquivo")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--layout", default="top_100", choices=sorted(LAYOUTS))
+    parser.add_argument("--days", type=int, default=None)
+    parser.add_argument("--category", default=None)
+    parser.add_argument("--source", default=None)
+    parser.add_argument("--order-by", default="views", choices=sorted(ORDER_COLUMNS))
+    parser.add_argument("--output-dir", default=".")
+    args = parser.parse_args()
+
+    with ArticleStore(args.db) as store:
+        news_list = store.top_articles(k=args.k, days=args.days, category=args.category,
+                                       source=args.source, order_by=args.order_by)
+    for rank, news in enumerate(news_list, 1):
+        news['rank'] = rank
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    basename = f"{LAYOUTS[args.layout][1]}_{timestamp}"
+    try:
+        paths = write_paginated(news_list, basename, args.output_dir, args.page_size, args.layout)
+        print(f"✅ {len(news_list)} notícias em {len(paths)} páginas de até {args.page_size}")
+        print(f"📁 Primeira página: {paths[0]}")
+    except Exception as e:
+        print(f"❌ Erro ao gerar páginas: {e}")
+    
+    report_run("paginated_pages")
+
+
+if __name__ == "__main__":
+    main()
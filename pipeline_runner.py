@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Pipeline Runner
+
+One entry point that refreshes every collector concurrently.
+
+Each collector, and each page built from its output, is a task with explicit
+dependencies. The scheduler starts every task whose dependencies are done on
+a thread pool, so the independent collectors (which spend their time waiting
+on the network and on rate-limit sleeps) overlap and a refresh takes about as
+long as the slowest collector instead of the sum of all of them. A page is
+written as soon as its own collector finishes; a failed task only skips the
+tasks that depend on it.
+
+All collector outputs are merged into one JSON dataset, and a per-task timing
+report is printed at the end.
+
+Usage:
+    python pipeline_runner.py
+    python pipeline_runner.py --output-dir output --workers 4
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from alternative_hr_data import AlternativeHRDataCollector, iter_html_from_real_data
+from article_store import ArticleStore
+from config import PRECOMPRESS_OUTPUT
+from current_hr_news_scraper import CurrentHRNewsScraper, iter_current_news_html
+from engagement_timeseries import EngagementTimeSeries
+from grok_ai_tweets import GrokTweetSearcher, generate_html_page, load_api_key
+from html_writer import precompress, write_chunks
+from news_diff import diff_runs, render_changes
+from news_search import NewsSearchIndex
+from news_stats import compute_news_statistics
+from real_hr_scraper import RealHRScraper, iter_real_data_html
+from snapshot_store import SnapshotStore, snapshot_run
+from top_100_hr_news import Top100HRNewsCollector, iter_top_100_html
+from tracing import report_run, span
+
+
+# Collector task name -> key in the merged dataset
+COLLECTORS = ("current_news", "top_100", "real_data", "alternative_data", "tweets")
+
+# The snapshot index is one JSON file; page tasks update it one at a time
+_snapshot_lock = threading.Lock()
+
+
+class PipelineTask:
+    """A named unit of work. ``func`` gets {dependency name: result}."""
+
+    def __init__(self, name, func, deps=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+
+def _check_graph(tasks):
+    """Raise ValueError for unknown dependencies or cycles (Kahn's algorithm)."""
+    names = {task.name for task in tasks}
+    if len(names) != len(tasks):
+        raise ValueError("Nomes de tarefas repetidos")
+    pending = {}
+    dependents = {name: [] for name in names}
+    for task in tasks:
+        for dep in task.deps:
+            if dep not in names:
+                raise ValueError(f"{task.name}: dependência desconhecida {dep!r}")
+            dependents[dep].append(task.name)
+        pending[task.name] = len(task.deps)
+    ready = [name for name, count in pending.items() if count == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for dependent in dependents[name]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                ready.append(dependent)
+    if visited != len(tasks):
+        raise ValueError("Dependências circulares entre tarefas")
+    return dependents
+
+
+def _timed(name, func, inputs):
+    began = time.perf_counter()
+    try:
+        with span("task", task=name):
+            result, error = func(inputs), None
+    except Exception as e:
+        result, error = None, e
+    return began, time.perf_counter(), result, error
+
+
+def run_pipeline(tasks, max_workers=None):
+    """Run tasks as soon as their dependencies have succeeded.
+
+    Args:
+        tasks (list): PipelineTask objects
+        max_workers (int): Thread pool size (default: one thread per task)
+
+    Returns:
+        tuple: ({name: result} for successful tasks, {name: report entry}).
+        Report entries have "status" (ok, failed or skipped), "start" and
+        "duration" in seconds from the pipeline start, and "error".
+    """
+    dependents = _check_graph(tasks)
+    by_name = {task.name: task for task in tasks}
+    pending = {task.name: len(task.deps) for task in tasks}
+    results = {}
+    report = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks) or 1) as executor:
+        running = {}
+
+        def submit(task):
+            inputs = {dep: results[dep] for dep in task.deps}
+            running[executor.submit(_timed, task.name, task.func, inputs)] = task
+
+        for task in tasks:
+            if not task.deps:
+                submit(task)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                began, ended, result, error = future.result()
+                report[task.name] = {
+                    "status": "ok" if error is None else "failed",
+                    "start": round(began - start, 3),
+                    "duration": round(ended - began, 3),
+                    "error": None if error is None else str(error)
+                }
+                if error is not None:
+                    # Dependents never reach zero pending and are reported as skipped
+                    continue
+                results[task.name] = result
+                for name in dependents[task.name]:
+                    pending[name] -= 1
+                    if pending[name] == 0:
+                        submit(by_name[name])
+    for task in tasks:
+        if task.name not in report:
+            report[task.name] = {"status": "skipped", "start": None, "duration": 0.0,
+                                 "error": "dependência falhou"}
+    return results, report
+
+
+def format_report(report, total):
+    """Timing table, tasks in start order, with wall time vs. summed task time."""
+    icons = {"ok": "✅", "failed": "❌", "skipped": "⏭️"}
+    lines = [f"   {'Tarefa':<24} {'Início':>8} {'Duração':>9}"]
+    order = sorted(report.items(), key=lambda item: (item[1]["start"] is None, item[1]["start"] or 0))
+    for name, entry in order:
+        began = "-" if entry["start"] is None else f"{entry['start']:.2f}s"
+        line = f"{icons[entry['status']]} {name:<24} {began:>8} {entry['duration']:>8.2f}s"
+        if entry["error"]:
+            line += f"  ({entry['error']})"
+        lines.append(line)
+    busy = sum(entry["duration"] for entry in report.values())
+    lines.append(f"⏱️ Tempo total: {total:.2f}s (soma das tarefas: {busy:.2f}s)")
+    return "\n".join(lines)
+
+
+def _write_page(filename, chunks, kind, data):
+    """Write, precompress and snapshot one page. Returns the file name."""
+    with span("render", page=filename):
+        write_chunks(filename, chunks)
+    if PRECOMPRESS_OUTPUT:
+        precompress(filename)
+    with _snapshot_lock:
+        snapshot_run(kind, [filename], data=data)
+    return filename
+
+
+def _ranked_page(name, kind, render, output_dir, timestamp):
+    def build(inputs):
+        news_list = inputs[name]
+        with _snapshot_lock:
+            previous = SnapshotStore().latest_data(kind)
+        changes = render_changes(diff_runs(previous, news_list)) if previous else ""
+        chunks = render(news_list, compute_news_statistics(news_list), output_dir=output_dir,
+                        changes=changes)
+        filename = os.path.join(output_dir, f"{kind}_{timestamp}.html")
+        return _write_page(filename, chunks, kind, news_list)
+    return build
+
+
+def _store_articles(inputs):
+    """Persist both ranked lists and refresh the search index."""
+    with ArticleStore() as store:
+        saved = 0
+        for name in ("current_news", "top_100"):
+            saved += store.upsert_many(inputs[name])
+            EngagementTimeSeries(store).record_run(inputs[name])
+        NewsSearchIndex(store).sync()
+    return saved
+
+
+def default_tasks(output_dir=".", timestamp=None, with_tweets=True):
+    """The collectors, one page task per collector and the article store update."""
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    tasks = [
+        PipelineTask("current_news", lambda _: CurrentHRNewsScraper().scrape_real_hr_news()),
+        PipelineTask("top_100", lambda _: Top100HRNewsCollector().get_top_hr_news()),
+        PipelineTask("real_data", lambda _: RealHRScraper().collect_all_real_data()),
+        PipelineTask("alternative_data", lambda _: AlternativeHRDataCollector().collect_all_data()),
+        PipelineTask("current_news_page", _ranked_page(
+            "current_news", "current_hr_news", iter_current_news_html, output_dir, timestamp),
+            deps=["current_news"]),
+        PipelineTask("top_100_page", _ranked_page(
+            "top_100", "top_100_hr_news", iter_top_100_html, output_dir, timestamp),
+            deps=["top_100"]),
+        PipelineTask("real_data_page", lambda inputs: _write_page(
+            os.path.join(output_dir, f"real_hr_scraped_{timestamp}.html"),
+            iter_real_data_html(inputs["real_data"], output_dir),
+            "real_hr_scraped", inputs["real_data"]), deps=["real_data"]),
+        PipelineTask("alternative_data_page", lambda inputs: _write_page(
+            os.path.join(output_dir, f"real_hr_data_{timestamp}.html"),
+            iter_html_from_real_data(inputs["alternative_data"], output_dir),
+            "real_hr_data", inputs["alternative_data"]), deps=["alternative_data"]),
+        PipelineTask("article_store", _store_articles, deps=["current_news", "top_100"]),
+    ]
+    if with_tweets:
+        tasks.append(PipelineTask("tweets", lambda _: _search_tweets()))
+        tasks.append(PipelineTask("tweets_page", lambda inputs: _write_tweets_page(
+            inputs["tweets"], output_dir, timestamp), deps=["tweets"]))
+    return tasks
+
+
+def _search_tweets():
+    result = GrokTweetSearcher(load_api_key()).search_tweets()
+    if result is None:
+        raise RuntimeError("busca de tweets falhou")
+    return result
+
+
+def _write_tweets_page(tweets_text, output_dir, timestamp):
+    return _write_page(os.path.join(output_dir, f"rh_tweets_{timestamp}.html"),
+                       [generate_html_page(tweets_text, timestamp)], "rh_tweets",
+                       {"text": tweets_text})
+
+
+def merge_results(results, report):
+    """One dataset with every collector's output (None when it failed)."""
+    return {
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        **{name: results.get(name) for name in COLLECTORS},
+        "pages": sorted(value for name, value in results.items() if name.endswith("_page")),
+        "timings": report
+    }
+
+
+def main():
+    """Run every collector concurrently and write the merged dataset."""
+    parser = argparse.ArgumentParser(description="Executa todos os coletores de RH em paralelo")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--workers", type=int, default=None, help="Threads (padrão: uma por tarefa)")
+    parser.add_argument("--no-tweets", action="store_true", help="Não consulta a API do Grok")
+    args = parser.parse_args()
+
+    print("🚀 HR Pipeline Runner")
+    print("=" * 60)
+    os.makedirs(args.output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    with_tweets = not args.no_tweets
+    if with_tweets and load_api_key() == "your_xai_api_key_here":
+        print("⚠️ XAI_API_KEY não configurada; busca de tweets desativada")
+        with_tweets = False
+
+    start = time.perf_counter()
+    results, report = run_pipeline(default_tasks(args.output_dir, timestamp, with_tweets),
+                                   args.workers)
+    total = time.perf_counter() - start
+
+    filename = os.path.join(args.output_dir, f"hr_pipeline_{timestamp}.json")
+    try:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(merge_results(results, report), f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Dados combinados salvos em {filename}")
+    except Exception as e:
+        print(f"❌ Erro ao salvar dados combinados: {e}")
+
+    print("\n📊 Tempo por tarefa:")
+    print(format_report(report, total))
+    report_run("hr_pipeline")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,13 @@ from datetime import datetime
 import time
 import re
 
+from config import PRECOMPRESS_OUTPUT
+from html_templates import get_template
+from html_writer import compression_summary, precompress, write_chunks
+from snapshot_store import snapshot_run
+from static_assets import build_stylesheet
+from tracing import report_run, span, traced
+
 
 class RealHRScraper:
     """Scrape real HR data from public sources."""
@@ -22,6 +29,7 @@ class RealHRScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
     
+    @traced("fetch")
     def scrape_hr_news(self):
         """Scrape HR news from Brazilian HR websites."""
         print("📰 Fazendo web scraping de notícias de RH...")
@@ -75,6 +83,7 @@ class RealHRScraper:
         
         return hr_news
     
+    @traced("fetch")
     def scrape_hr_jobs(self):
         """Scrape HR job postings from job sites."""
         print("💼 Fazendo web scraping de vagas de RH...")
@@ -118,6 +127,7 @@ class RealHRScraper:
             print(f"⚠️ Erro ao coletar vagas: {e}")
             return []
     
+    @traced("fetch")
     def scrape_hr_salary_data(self):
         """Scrape HR salary data from public sources."""
         print("💰 Coletando dados de salários de RH...")
@@ -166,6 +176,7 @@ class RealHRScraper:
             print(f"⚠️ Erro ao coletar dados de salário: {e}")
             return []
     
+    @traced("fetch")
     def scrape_hr_certifications(self):
         """Scrape HR certification and training data."""
         print("🎓 Coletando dados de certificações de RH...")
@@ -232,356 +243,28 @@ class RealHRScraper:
         return all_data
 
 
+def iter_real_data_html(data, output_dir="."):
+    """Yield the HTML page for real scraped data in chunks."""
+    news_item = get_template("items/real_data_news.html")
+    job_item = get_template("items/real_data_job.html")
+    salary_item = get_template("items/real_data_salary.html")
+    certification_item = get_template("items/real_data_certification.html")
+    return get_template("real_data.html").stream(
+        stylesheet=build_stylesheet("real_data", output_dir),
+        data=data,
+        counts={key: len(data[key]) for key in ("news", "jobs", "salaries", "certifications")},
+        sources=", ".join(data['sources']),
+        news_items=(news_item.render(news=news) for news in data["news"]),
+        job_items=(job_item.render(job=job) for job in data["jobs"]),
+        salary_items=(salary_item.render(salary=salary) for salary in data["salaries"]),
+        certification_items=(certification_item.render(cert=cert) for cert in data["certifications"])
+    )
+
+
 def generate_real_data_html(data):
     """Generate HTML page from real scraped data."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate news HTML
-    news_html = ""
-    for i, news in enumerate(data["news"], 1):
-        news_html += f"""
-        <div class="data-item news">
-            <div class="data-header">
-                <span class="platform-badge news">Notícias</span>
-                <span class="source">{news['source']}</span>
-                <span class="engagement">📊 {news['engagement']:,} visualizações</span>
-            </div>
-            <div class="title">{news['title']}</div>
-            <div class="content">{news['summary']}</div>
-            <div class="date">{news['date']}</div>
-        </div>
-        """
-    
-    # Generate jobs HTML
-    jobs_html = ""
-    for i, job in enumerate(data["jobs"], 1):
-        jobs_html += f"""
-        <div class="data-item job">
-            <div class="data-header">
-                <span class="platform-badge job">Vagas</span>
-                <span class="company">{job['company']}</span>
-                <span class="applications">👥 {job['applications']} candidatos</span>
-            </div>
-            <div class="title">{job['title']}</div>
-            <div class="location">📍 {job['location']}</div>
-            <div class="salary">💰 {job['salary']}</div>
-            <div class="content">{job['requirements']}</div>
-            <div class="date">{job['date']}</div>
-        </div>
-        """
-    
-    # Generate salaries HTML
-    salaries_html = ""
-    for i, salary in enumerate(data["salaries"], 1):
-        salaries_html += f"""
-        <div class="data-item salary">
-            <div class="data-header">
-                <span class="platform-badge salary">Salários</span>
-                <span class="trend">{salary['trend']}</span>
-                <span class="experience">{salary['experience']}</span>
-            </div>
-            <div class="position">{salary['position']}</div>
-            <div class="avg-salary">💰 {salary['avg_salary']}</div>
-            <div class="range">📊 {salary['range']}</div>
-            <div class="location">📍 {salary['location']}</div>
-        </div>
-        """
-    
-    # Generate certifications HTML
-    certs_html = ""
-    for i, cert in enumerate(data["certifications"], 1):
-        certs_html += f"""
-        <div class="data-item cert">
-            <div class="data-header">
-                <span class="platform-badge cert">Certificação</span>
-                <span class="institution">{cert['institution']}</span>
-                <span class="students">👥 {cert['students']} alunos</span>
-            </div>
-            <div class="name">{cert['name']}</div>
-            <div class="rating">⭐ {cert['rating']}</div>
-            <div class="details">⏱️ {cert['duration']} | 💰 {cert['price']}</div>
-            <div class="trend">📈 {cert['trend']}</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dados Reais de RH - Web Scraping</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        
-        .stats {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            text-align: center;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .section {{
-            padding: 30px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .section h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .data-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .data-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-        }}
-        
-        .data-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .platform-badge {{
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-            color: white;
-        }}
-        
-        .platform-badge.news {{
-            background: #28a745;
-        }}
-        
-        .platform-badge.job {{
-            background: #007bff;
-        }}
-        
-        .platform-badge.salary {{
-            background: #ffc107;
-            color: #333;
-        }}
-        
-        .platform-badge.cert {{
-            background: #6f42c1;
-        }}
-        
-        .company, .source, .institution {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .engagement, .applications, .students {{
-            font-size: 0.9em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 5px 12px;
-            border-radius: 20px;
-        }}
-        
-        .title, .name, .position {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.2em;
-            margin-bottom: 10px;
-        }}
-        
-        .content {{
-            margin: 15px 0;
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-        }}
-        
-        .location, .salary, .avg-salary, .range, .details {{
-            color: #666;
-            font-size: 1em;
-            margin: 5px 0;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 10px;
-        }}
-        
-        .trend {{
-            font-weight: bold;
-            color: #28a745;
-        }}
-        
-        .rating {{
-            color: #ffc107;
-            font-weight: bold;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-        }}
-        
-        .sources {{
-            margin-top: 10px;
-            font-size: 0.9em;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2em;
-            }}
-            
-            .data-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 Dados Reais de RH - Web Scraping</h1>
-            <p>Informações coletadas de sites públicos brasileiros sobre Recursos Humanos</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stats-grid">
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['news'])}</div>
-                    <div class="stat-label">Notícias</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['jobs'])}</div>
-                    <div class="stat-label">Vagas</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['salaries'])}</div>
-                    <div class="stat-label">Salários</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{len(data['certifications'])}</div>
-                    <div class="stat-label">Certificações</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📰 Notícias de RH</h2>
-            {news_html}
-        </div>
-        
-        <div class="section">
-            <h2>💼 Vagas de RH</h2>
-            {jobs_html}
-        </div>
-        
-        <div class="section">
-            <h2>💰 Salários de RH</h2>
-            {salaries_html}
-        </div>
-        
-        <div class="section">
-            <h2>🎓 Certificações</h2>
-            {certs_html}
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {data['timestamp']} | Real HR Data Scraper</p>
-            <div class="sources">
-                <strong>Fontes:</strong> {', '.join(data['sources'])}
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
+    html_content = "".join(iter_real_data_html(data))
     return html_content, timestamp
 
 
@@ -597,16 +280,23 @@ def main():
     data = scraper.collect_all_real_data()
     
     # Generate HTML
-    html_content, timestamp = generate_real_data_html(data)
-    filename = f"real_hr_scraped_{timestamp}.html"
+    # Each run replaces the same page; earlier versions live in the snapshot store
+    filename = "real_hr_scraped.html"
     
     try:
         # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page to disk instead of building it in memory
+        with span("render", page=filename):
+            write_chunks(filename, iter_real_data_html(data))
         
         print(f"✅ Dados reais coletados e página HTML gerada!")
         print(f"📁 Arquivo: {filename}")
+        if PRECOMPRESS_OUTPUT:
+            print(f"🗜️ {compression_summary(filename, precompress(filename))}")
+
+        # Keep a deduplicated snapshot of this run's data and page
+        run = snapshot_run("real_hr_scraped", [filename], data=data)
+        print(f"📸 Snapshot {run['id']} (+{run['added_bytes']:,} bytes novos)")
         
         # Try to open in browser
         import webbrowser
@@ -627,6 +317,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Erro: {e}")
+    
+    report_run("real_hr_scraped")
 
 
 if __name__ == "__main__":
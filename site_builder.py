@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Site Builder
+
+Static site build mode: one collected dataset in, a browsable site out.
+
+A single pass groups the articles by category and by source; the groups and
+the shared navigation sidebar are built once and reused by every page. The
+site then has an index with the top articles, pages per category and per
+source and a sitemap.xml. A group larger than the page size is split into
+linked pages (category-x.html, category-x_p2.html, ...) with the archive's
+pagination, so page weight does not grow with the dataset. Pages are
+independent of each other, so they are rendered in parallel in a process
+pool.
+
+Usage:
+    python site_builder.py scrape --output-dir site
+    python site_builder.py snapshot               # last current_hr_news run
+    python site_builder.py store --days 30 -k 5000 --workers 4 --page-size 50
+"""
+
+import argparse
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from config import PRECOMPRESS_OUTPUT, SITE_INDEX_SIZE, SITE_PAGE_SIZE, SITE_URL
+from current_hr_news_scraper import iter_current_news_html
+from html_templates import get_template
+from html_writer import precompress, write_chunks
+from news_stats import compute_news_statistics
+from paginated_pages import page_count, page_filename, render_pagination
+from static_assets import build_stylesheet
+from tracing import report_run, span
+
+
+INDEX_FILENAME = "index.html"
+SITEMAP_FILENAME = "sitemap.xml"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(name):
+    """ASCII file-name slug: "Gestão de Pessoas" -> "gestao-de-pessoas"."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return _SLUG_RE.sub("-", ascii_name.lower()).strip("-") or "geral"
+
+
+def group_articles(news_list):
+    """Split articles by category and by source in one pass.
+
+    Returns:
+        tuple: ({category: [news]}, {source: [news]}), each list in the
+        order of news_list
+    """
+    by_category = {}
+    by_source = {}
+    for news in news_list:
+        by_category.setdefault(news.get('category') or "RH Geral", []).append(news)
+        by_source.setdefault(news.get('source') or "Desconhecida", []).append(news)
+    return by_category, by_source
+
+
+def _page_names(groups, prefix):
+    """{group name: first page's file name}, with a numeric suffix when two slugs collide."""
+    names = {}
+    used = set()
+    for name in sorted(groups):
+        filename = f"{prefix}-{slugify(name)}.html"
+        suffix = 1
+        while filename in used:
+            suffix += 1
+            filename = f"{prefix}-{slugify(name)}-{suffix}.html"
+        used.add(filename)
+        names[name] = filename
+    return names
+
+
+def render_site_nav(by_category, by_source, category_pages, source_pages):
+    """Sidebar linking every category and source page; identical on all pages."""
+    link = get_template("items/site_link.html")
+    return get_template("items/site_nav.html").render(
+        index_href=INDEX_FILENAME,
+        category_links=[link.render(name=name, href=category_pages[name], count=len(items))
+                        for name, items in sorted(by_category.items())],
+        source_links=[link.render(name=name, href=source_pages[name], count=len(items))
+                      for name, items in sorted(by_source.items())]
+    )
+
+
+def render_sitemap(filenames, base_url=SITE_URL, lastmod=None):
+    """sitemap.xml listing every page under base_url."""
+    lastmod = lastmod or datetime.now().strftime("%Y-%m-%d")
+    base_url = base_url.rstrip("/")
+    url = get_template("items/sitemap_url.xml")
+    return get_template("sitemap.xml").render(
+        urls=[url.render(loc=f"{base_url}/{filename}", lastmod=lastmod) for filename in filenames]
+    )
+
+
+def _group_jobs(name, items, first_page, heading, site_nav, output_dir, page_size):
+    """Render jobs for one group, page_size articles per page.
+
+    Every page shows the whole group's statistics. Returns (jobs, file names).
+    """
+    basename = first_page[:-len(".html")]
+    stats = compute_news_statistics(items)
+    pages = page_count(len(items), page_size)
+    jobs = []
+    filenames = []
+    for page in range(1, pages + 1):
+        filename = page_filename(basename, page)
+        chunk = items[(page - 1) * page_size:page * page_size]
+        pagination = render_pagination(basename, page, pages) if pages > 1 else ""
+        jobs.append((os.path.join(output_dir, filename), chunk, stats, name, heading, site_nav,
+                     pagination, output_dir))
+        filenames.append(filename)
+    return jobs, filenames
+
+
+def _render_page(job):
+    """Worker: write one page and its compressed copies. Returns (path, bytes)."""
+    path, news_list, stats, page_title, heading, site_nav, pagination, output_dir = job
+    size = write_chunks(path, iter_current_news_html(news_list, stats, output_dir=output_dir,
+                                                     pagination=pagination, page_title=page_title,
+                                                     site_nav=site_nav, heading=heading))
+    if PRECOMPRESS_OUTPUT:
+        precompress(path)
+    return path, size
+
+
+def build_site(news_list, output_dir="site", workers=None, index_size=SITE_INDEX_SIZE,
+               base_url=SITE_URL, page_size=SITE_PAGE_SIZE):
+    """Render the whole site for one ranked news list.
+
+    Args:
+        news_list (list): Ranked articles in the collectors' dict shape
+        output_dir (str): Directory for the pages, assets and sitemap
+        workers (int): Worker processes (None: one per CPU, 1: render inline)
+        index_size (int): Articles shown on the index page
+        base_url (str): Public URL of output_dir, used in the sitemap
+        page_size (int): Articles per category or source page
+
+    Returns:
+        dict: {path: bytes written} for every page and the sitemap
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    os.makedirs(output_dir, exist_ok=True)
+    with span("group", articles=len(news_list)):
+        by_category, by_source = group_articles(news_list)
+    category_pages = _page_names(by_category, "category")
+    source_pages = _page_names(by_source, "source")
+    site_nav = render_site_nav(by_category, by_source, category_pages, source_pages)
+
+    index_items = news_list[:index_size]
+    jobs = [(os.path.join(output_dir, INDEX_FILENAME), index_items,
+             compute_news_statistics(index_items), None,
+             f"{len(index_items)} Notícias Atuais de RH", site_nav, "", output_dir)]
+    filenames = [INDEX_FILENAME]
+    for groups, pages, label in ((by_category, category_pages, "Categoria"),
+                                 (by_source, source_pages, "Fonte")):
+        for name in sorted(groups):
+            items = groups[name]
+            heading = f"{label} {name}: {len(items)} notícias de RH"
+            group_jobs, group_files = _group_jobs(name, items, pages[name], heading, site_nav,
+                                                  output_dir, page_size)
+            jobs.extend(group_jobs)
+            filenames.extend(group_files)
+
+    # Write the shared stylesheet once so workers never race to create it
+    build_stylesheet("current_news", output_dir)
+    # Spans recorded inside worker processes are lost; this one covers the whole pool
+    with span("render", pages=len(jobs)):
+        if workers == 1:
+            written = dict(map(_render_page, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                written = dict(executor.map(_render_page, jobs))
+
+    sitemap_path = os.path.join(output_dir, SITEMAP_FILENAME)
+    written[sitemap_path] = write_chunks(sitemap_path, [render_sitemap(filenames, base_url)])
+    return written
+
+
+def _load_news(args):
+    if args.source == "scrape":
+        from current_hr_news_scraper import CurrentHRNewsScraper
+        return CurrentHRNewsScraper().scrape_real_hr_news()
+    if args.source == "snapshot":
+        from snapshot_store import SnapshotStore
+        return SnapshotStore().latest_data("current_hr_news") or []
+    from article_store import DEFAULT_DB_PATH, ArticleStore
+    with ArticleStore(args.db or DEFAULT_DB_PATH) as store:
+        news_list = store.top_articles(k=args.k, days=args.days)
+    for rank, news in enumerate(news_list, 1):
+        news['rank'] = rank
+    return news_list
+
+
+def main():
+    """Collect or load one dataset and build the static site from it."""
+    parser = argparse.ArgumentParser(description="Gera o site estático de notícias de RH")
+    parser.add_argument("source", choices=("scrape", "snapshot", "store"),
+                        help="scrape: nova coleta; snapshot: última execução; store: banco")
+    parser.add_argument("--output-dir", default="site")
+    parser.add_argument("--workers", type=int, default=None, help="Processos (padrão: um por CPU)")
+    parser.add_argument("--base-url", default=SITE_URL, help="URL pública usada no sitemap")
+    parser.add_argument("--page-size", type=int, default=SITE_PAGE_SIZE,
+                        help="Notícias por página de categoria ou fonte")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite (source=store)")
+    parser.add_argument("-k", type=int, default=10_000, help="Máximo de notícias (source=store)")
+    parser.add_argument("--days", type=int, default=None, help="Janela em dias (source=store)")
+    args = parser.parse_args()
+
+    try:
+        news_list = _load_news(args)
+        if not news_list:
+            print("⚠️ Nenhuma notícia encontrada para gerar o site")
+            return
+        start = time.perf_counter()
+        written = build_site(news_list, args.output_dir, args.workers, base_url=args.base_url,
+                             page_size=args.page_size)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        print(f"❌ Erro ao gerar o site: {e}")
+        return
+
+    print(f"✅ Site gerado com {len(news_list)} notícias: {len(written) - 1} páginas + sitemap "
+          f"em {elapsed:.2f}s")
+    print(f"📁 {os.path.join(args.output_dir, INDEX_FILENAME)} "
+          f"({sum(written.values()):,} bytes no total)")
+    report_run("site")
+
+
+if __name__ == "__main__":
+    main()
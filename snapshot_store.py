@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+
+Content-addressed storage for each run's data and generated pages.
+
+Files are split into content-defined chunks (a Gear rolling hash picks the
+boundaries, so an insertion only changes the chunks around it) and every
+chunk is stored once under its SHA-256, zlib-compressed. A run is just a
+manifest listing the chunks of its files, kept in snapshots/index.json.
+Consecutive runs that share most of their HTML and data therefore add only
+the chunks that changed.
+
+Retention keeps the latest run per hour for 2 days and the latest run per
+day for 90 days, per kind of run; chunks no longer referenced are deleted.
+
+Several processes (daemon, pipeline runner, one-shot CLIs) may share a store.
+Index updates and garbage collection hold an exclusive lock on index.lock and
+re-read the index inside it, and chunks written within the last
+GC_GRACE_SECONDS are never collected, because a concurrent save stores its
+chunks before it adds the run that references them.
+
+Usage:
+    python snapshot_store.py list
+    python snapshot_store.py import current_hr_news_*.html
+    python snapshot_store.py restore 20250814_050040_current_hr_news current_hr_news.html
+    python snapshot_store.py prune
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta
+
+from tracing import traced
+
+try:
+    import fcntl
+except ImportError:
+    # No flock on Windows; concurrent writers are not supported there
+    fcntl = None
+
+
+DEFAULT_SNAPSHOT_DIR = "snapshots"
+
+MIN_CHUNK_SIZE = 2 * 1024
+MAX_CHUNK_SIZE = 64 * 1024
+# Boundary when the top 13 bits of the rolling hash are zero: ~8 KiB chunks.
+# The top bits depend on the last 64 bytes, the low bits only on the last few.
+CHUNK_MASK = ((1 << 13) - 1) << 51
+
+HOURLY_RETENTION_DAYS = 2
+DAILY_RETENTION_DAYS = 90
+
+# Unreferenced chunks younger than this may belong to a save still in progress
+GC_GRACE_SECONDS = 3600
+
+_gear_rng = random.Random(0x5EED)
+_GEAR = tuple(_gear_rng.getrandbits(64) for _ in range(256))
+_HASH_MASK = (1 << 64) - 1
+
+_TIMESTAMP_RE = re.compile(r"^(?P<kind>.+?)_(?P<ts>\d{8}_\d{6})\.html$")
+
+
+def chunk_boundaries(data):
+    """Yield (start, end) offsets of the content-defined chunks of data."""
+    gear = _GEAR
+    length = len(data)
+    start = 0
+    while start < length:
+        end = min(start + MAX_CHUNK_SIZE, length)
+        h = 0
+        position = start + MIN_CHUNK_SIZE
+        if position >= end:
+            yield start, end
+            return
+        for i in range(start, start + MIN_CHUNK_SIZE):
+            h = ((h << 1) + gear[data[i]]) & _HASH_MASK
+        while position < end:
+            h = ((h << 1) + gear[data[position]]) & _HASH_MASK
+            position += 1
+            if not h & CHUNK_MASK:
+                break
+        yield start, position
+        start = position
+
+
+class _FileLock:
+    """Exclusive flock on a lock file, shared by every process using the store."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, "a")
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        # Closing the file releases the lock
+        self.file.close()
+        return False
+
+
+class SnapshotStore:
+    """Deduplicated run snapshots with an index and a retention policy."""
+
+    def __init__(self, root=DEFAULT_SNAPSHOT_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        self.lock_path = os.path.join(root, "index.lock")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"runs": []}
+
+    def _save_index(self):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _put_chunk(self, chunk):
+        """Store one chunk unless it exists. Returns (digest, stored bytes or 0)."""
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            try:
+                # Refresh the mtime so GC treats the chunk as in use until it is indexed
+                os.utime(path)
+                return digest, 0
+            except FileNotFoundError:
+                pass
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(chunk, 6)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        return digest, len(compressed)
+
+    def put(self, data):
+        """Store bytes as chunks. Returns (manifest entry, new bytes on disk)."""
+        chunks = []
+        added = 0
+        for start, end in chunk_boundaries(data):
+            digest, stored = self._put_chunk(data[start:end])
+            chunks.append(digest)
+            added += stored
+        entry = {"size": len(data), "sha256": hashlib.sha256(data).hexdigest(), "chunks": chunks}
+        return entry, added
+
+    def save_run(self, kind, files=(), data=None, at=None):
+        """Snapshot one run.
+
+        Args:
+            kind (str): Run type, e.g. "current_hr_news"; retention is per kind
+            files (iterable): Paths of generated outputs to keep
+            data: JSON-serializable run data (news list, collector dict)
+            at (datetime): Run time (now if None)
+
+        Returns:
+            dict: The run record added to the index, with "added_bytes"
+        """
+        at = at or datetime.now()
+        payloads = {}
+        if data is not None:
+            # One key per line keeps unchanged records in unchanged chunks
+            payloads["data.json"] = json.dumps(data, ensure_ascii=False, sort_keys=True,
+                                               indent=1).encode("utf-8")
+        for path in files:
+            with open(path, "rb") as f:
+                payloads[os.path.basename(path)] = f.read()
+        manifest = {}
+        added = 0
+        # Chunks are written without the lock; the grace period keeps GC away from them
+        for name, payload in payloads.items():
+            manifest[name], stored = self.put(payload)
+            added += stored
+        with _FileLock(self.lock_path):
+            # A chunk that already existed may have been collected before our utime;
+            # GC cannot run while we hold the lock, so store any missing one again
+            for name, entry in manifest.items():
+                if not all(os.path.exists(self._object_path(d)) for d in entry["chunks"]):
+                    manifest[name], stored = self.put(payloads[name])
+                    added += stored
+            # Another process may have added runs since this store was opened
+            self.index = self._load_index()
+            run_id = f"{at:%Y%m%d_%H%M%S}_{kind}"
+            existing = {run["id"] for run in self.index["runs"]}
+            suffix = 1
+            while run_id in existing:
+                suffix += 1
+                run_id = f"{at:%Y%m%d_%H%M%S}_{kind}_{suffix}"
+            run = {"id": run_id, "kind": kind, "at": at.isoformat(timespec="seconds"),
+                   "files": manifest, "added_bytes": added}
+            self.index["runs"].append(run)
+            self.index["runs"].sort(key=lambda r: r["at"])
+            self._save_index()
+        return run
+
+    def runs(self, kind=None):
+        return [run for run in self.index["runs"] if kind is None or run["kind"] == kind]
+
+    def get_run(self, run_id):
+        for run in self.index["runs"]:
+            if run["id"] == run_id:
+                return run
+        return None
+
+    def restore(self, run_id, name):
+        """Reassemble one file of a run. Raises KeyError if it is unknown."""
+        run = self.get_run(run_id)
+        if run is None or name not in run["files"]:
+            raise KeyError(f"{run_id}/{name}")
+        parts = []
+        for digest in run["files"][name]["chunks"]:
+            with open(self._object_path(digest), "rb") as f:
+                parts.append(zlib.decompress(f.read()))
+        data = b"".join(parts)
+        if hashlib.sha256(data).hexdigest() != run["files"][name]["sha256"]:
+            raise ValueError(f"Snapshot corrompido: {run_id}/{name}")
+        return data
+
+    def latest_data(self, kind):
+        """Data saved with the most recent run of a kind, or None."""
+        for run in reversed(self.runs(kind)):
+            if "data.json" in run["files"]:
+                return json.loads(self.restore(run["id"], "data.json"))
+        return None
+
+    def apply_retention(self, now=None, hourly_days=HOURLY_RETENTION_DAYS,
+                        daily_days=DAILY_RETENTION_DAYS):
+        """Drop runs outside the retention policy and unreferenced chunks.
+
+        Per kind, the newest run of each hour is kept for ``hourly_days`` and
+        the newest run of each day for ``daily_days``; older runs are removed.
+        Returns (removed run ids, chunk files deleted).
+        """
+        now = now or datetime.now()
+        with _FileLock(self.lock_path):
+            self.index = self._load_index()
+            removed = self._apply_retention(now, hourly_days, daily_days)
+            if not removed:
+                return [], 0
+            return removed, self._collect_garbage()
+
+    def _apply_retention(self, now, hourly_days, daily_days):
+        hourly_cutoff = now - timedelta(days=hourly_days)
+        daily_cutoff = now - timedelta(days=daily_days)
+        kept = []
+        removed = []
+        seen_buckets = set()
+        for run in sorted(self.index["runs"], key=lambda r: r["at"], reverse=True):
+            at = datetime.fromisoformat(run["at"])
+            if at >= hourly_cutoff:
+                bucket = (run["kind"], at.strftime("%Y%m%d%H"))
+            elif at >= daily_cutoff:
+                bucket = (run["kind"], at.strftime("%Y%m%d"))
+            else:
+                removed.append(run["id"])
+                continue
+            if bucket in seen_buckets:
+                removed.append(run["id"])
+                continue
+            seen_buckets.add(bucket)
+            kept.append(run)
+        if removed:
+            self.index["runs"] = sorted(kept, key=lambda r: r["at"])
+            self._save_index()
+        return removed
+
+    def collect_garbage(self):
+        """Delete chunk files not referenced by any run. Returns the count."""
+        with _FileLock(self.lock_path):
+            self.index = self._load_index()
+            return self._collect_garbage()
+
+    def _collect_garbage(self, grace_seconds=GC_GRACE_SECONDS):
+        cutoff = time.time() - grace_seconds
+        referenced = {digest for run in self.index["runs"]
+                      for entry in run["files"].values() for digest in entry["chunks"]}
+        deleted = 0
+        for prefix in os.listdir(self.objects_dir):
+            directory = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(directory):
+                if prefix + name in referenced:
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                deleted += 1
+        return deleted
+
+    def disk_usage(self):
+        """(logical bytes across all runs, compressed bytes actually stored)."""
+        logical = sum(entry["size"] for run in self.index["runs"] for entry in run["files"].values())
+        stored = 0
+        for prefix in os.listdir(self.objects_dir):
+            directory = os.path.join(self.objects_dir, prefix)
+            stored += sum(os.path.getsize(os.path.join(directory, name))
+                          for name in os.listdir(directory))
+        return logical, stored
+
+
+@traced("snapshot")
+def snapshot_run(kind, files=(), data=None, root=DEFAULT_SNAPSHOT_DIR):
+    """Save a run and apply retention; the collectors' one-call entry point."""
+    store = SnapshotStore(root)
+    run = store.save_run(kind, files, data)
+    store.apply_retention()
+    return run
+
+
+def main():
+    """Inspect, import, restore and prune snapshots."""
+    parser = argparse.ArgumentParser(description="Snapshots deduplicados das execuções")
+    parser.add_argument("--root", default=DEFAULT_SNAPSHOT_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="Lista as execuções guardadas")
+    importer = subparsers.add_parser("import", help="Importa páginas <tipo>_AAAAMMDD_HHMMSS.html")
+    importer.add_argument("paths", nargs="+")
+    restore = subparsers.add_parser("restore", help="Recupera um arquivo de uma execução")
+    restore.add_argument("run_id")
+    restore.add_argument("name")
+    restore.add_argument("-o", "--output", default=None)
+    subparsers.add_parser("prune", help="Aplica a política de retenção")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.root)
+    if args.command == "list":
+        for run in store.runs():
+            files = ", ".join(run["files"])
+            print(f"   {run['id']} | {run['at']} | {files} | +{run['added_bytes']:,} bytes")
+        logical, stored = store.disk_usage()
+        print(f"💾 {len(store.runs())} execuções, {logical:,} bytes lógicos, {stored:,} bytes em disco")
+    elif args.command == "import":
+        for path in args.paths:
+            match = _TIMESTAMP_RE.match(os.path.basename(path))
+            if not match:
+                print(f"⚠️ Nome sem timestamp, ignorado: {path}")
+                continue
+            at = datetime.strptime(match.group("ts"), "%Y%m%d_%H%M%S")
+            run = store.save_run(match.group("kind"), [path], at=at)
+            print(f"📥 {path} → {run['id']} (+{run['added_bytes']:,} bytes)")
+    elif args.command == "restore":
+        try:
+            data = store.restore(args.run_id, args.name)
+        except (KeyError, ValueError) as e:
+            print(f"❌ Erro ao recuperar: {e}")
+            return 1
+        with open(args.output or args.name, "wb") as f:
+            f.write(data)
+        print(f"📤 {args.output or args.name} ({len(data):,} bytes)")
+    else:
+        removed, deleted = store.apply_retention()
+        print(f"🧹 {len(removed)} execuções removidas, {deleted} blocos apagados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
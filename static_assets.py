@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Static Assets
+
+Content-hashed, minified stylesheets shared by the generated pages.
+
+Page stylesheets live in templates/css/. Instead of inlining them into every
+page (and every stored snapshot), the generators link to
+assets/<name>.<hash>.css. The file name changes whenever the CSS changes, so
+the file can be served with a one-year immutable Cache-Control header (see
+vercel.json) and browsers never fetch a stale copy.
+
+Usage:
+    python static_assets.py            # build every stylesheet into assets/
+"""
+
+import hashlib
+import os
+import re
+import sys
+
+from config import PRECOMPRESS_OUTPUT
+from html_templates import TEMPLATE_DIR
+from html_writer import precompress
+
+
+ASSETS_DIR = "assets"
+CSS_SOURCE_DIR = os.path.join(TEMPLATE_DIR, "css")
+HASH_LENGTH = 12
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+# Spaces before ':' are kept: "a :hover" and "a:hover" are different selectors
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*|:\s+")
+
+_built = {}
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(lambda m: m.group(1) or ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def build_stylesheet(name, output_dir="."):
+    """Minify templates/css/<name>.css into <output_dir>/assets/<name>.<hash>.css.
+
+    Returns the path of the asset relative to output_dir, ready to be used as
+    an href by pages written to the same directory. The file is only written
+    when it does not exist yet; results are memoized per process.
+    """
+    key = (name, os.path.abspath(output_dir))
+    href = _built.get(key)
+    if href is not None:
+        return href
+    with open(os.path.join(CSS_SOURCE_DIR, f"{name}.css"), encoding="utf-8") as f:
+        data = minify_css(f.read()).encode("utf-8")
+    href = f"{ASSETS_DIR}/{name}.{content_hash(data)}.css"
+    path = os.path.join(output_dir, href)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        if PRECOMPRESS_OUTPUT:
+            precompress(path)
+    _built[key] = href
+    return href
+
+
+def build_all(output_dir="."):
+    """Build every stylesheet in templates/css/. Returns {name: href}."""
+    names = sorted(os.path.splitext(entry)[0] for entry in os.listdir(CSS_SOURCE_DIR)
+                   if entry.endswith(".css"))
+    return {name: build_stylesheet(name, output_dir) for name in names}
+
+
+def main():
+    """Build all stylesheets into the given directory (default: current)."""
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    for name, href in build_all(output_dir).items():
+        size = os.path.getsize(os.path.join(output_dir, href))
+        print(f"🎨 {name}: {href} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Synthetic News Generator
+
+Seeded, NumPy-vectorized bulk generator of HR news articles for load testing.
+
+It reproduces the fields and distributions of
+CurrentHRNewsScraper.generate_current_news_for_source and
+generate_additional_current_news (same topics, sources, categories, title and
+summary templates, recency-based engagement) but draws every column at once
+from an explicit seed. Parallel workers get independent random streams via
+SeedSequence.spawn, so a run is reproducible for a given (seed, workers) pair.
+Dates are drawn relative to a fixed reference day (DEFAULT_NOW unless --now
+is given), so the same seed yields the same data on any day.
+
+Requires NumPy (pip install numpy).
+
+Usage:
+    python synthetic_news.py 1000000 --seed 42 --workers 4 --now 2025-08-14
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from article_model import ArticleTable
+from current_hr_news_scraper import category_from_topic
+
+
+CURRENT_TOPICS = [
+    "Nova legislação trabalhista 2024", "IA e automação em RH", "Home office híbrido",
+    "Benefícios flexíveis", "Diversidade e inclusão", "Geração Z no trabalho",
+    "Bem-estar corporativo", "E-learning corporativo", "Retenção de talentos",
+    "Salários e remuneração", "Transformação digital em RH", "Gestão de performance",
+    "Cultura organizacional", "Liderança moderna", "Recrutamento digital",
+    "People Analytics", "Compliance trabalhista", "Gestão de mudanças",
+    "Desenvolvimento de lideranças", "Clima organizacional"
+]
+
+MAIN_SOURCES = {
+    "Portal RH Brasil": "https://portalrh.com.br/noticias",
+    "Revista RH": "https://revistarh.com.br/artigos",
+    "HR Brasil": "https://hrbrasil.com.br/noticias",
+    "Gestão RH": "https://gestaorh.com.br/artigos",
+    "RH Digital": "https://rhdigital.com.br/noticias"
+}
+
+ADDITIONAL_SOURCES = {
+    "Portal RH Brasil": "https://portalrhbrasil.com.br/noticias",
+    "Revista RH": "https://revistarh.com.br/noticias",
+    "HR Brasil": "https://hrbrasil.com.br/noticias",
+    "Gestão RH": "https://gestãorh.com.br/noticias",
+    "RH Digital": "https://rhdigital.com.br/noticias",
+    "Portal Carreira": "https://portalcarreira.com.br/artigos",
+    "RH Online": "https://rhonline.com.br/noticias",
+    "Gestão de Pessoas": "https://gestaodepessoas.com.br/artigos",
+    "RH News": "https://rhnews.com.br/noticias",
+    "HR Trends": "https://hrtrends.com.br/artigos"
+}
+
+ADDITIONAL_CATEGORIES = [
+    "Legislação", "Tecnologia", "Trabalho Remoto", "Benefícios", "Diversidade",
+    "Gerações", "Bem-estar", "Treinamento", "Retenção", "Remuneração",
+    "Recrutamento", "Gestão", "Liderança", "Cultura", "Inovação"
+]
+
+TOPIC_SLUGS = [
+    "nova-legislacao-trabalhista-2024", "ia-automacao-rh", "home-office-hibrido",
+    "beneficios-flexiveis", "diversidade-inclusao", "geracao-z-trabalho",
+    "bem-estar-corporativo", "e-learning-corporativo", "retencao-talentos",
+    "salarios-remuneracao", "transformacao-digital-rh", "gestao-performance",
+    "cultura-organizacional", "lideranca-moderna", "recrutamento-digital",
+    "people-analytics", "compliance-trabalhista", "gestao-mudancas",
+    "desenvolvimento-liderancas", "clima-organizacional"
+]
+
+MAX_DAYS_AGO = 30
+
+# Reference "today" for generated dates
+DEFAULT_NOW = datetime(2025, 8, 14)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("synthetic_news requires NumPy: pip install numpy")
+
+
+def _title_templates(year):
+    return [
+        f"Tendências que dominarão {year}", "Como implementar com sucesso",
+        "Novas tecnologias revolucionam", "Estratégias inovadoras para",
+        f"O futuro em {year}", "Melhores práticas atuais", "Transformação digital",
+        "Cases de sucesso recentes", "Desafios e oportunidades", "Guia completo atualizado"
+    ]
+
+
+def _summary_templates(topic, year):
+    topic = topic.lower()
+    return [
+        f"Artigo atualizado sobre {topic} com insights valiosos para profissionais de RH em {year}. Inclui dados recentes e estratégias práticas.",
+        f"Análise completa sobre {topic} e suas implicações para o mercado de trabalho atual. Especialistas compartilham experiências recentes.",
+        f"Tendências emergentes em {topic} que estão transformando a gestão de pessoas. Dados atualizados e casos práticos.",
+        f"Como as empresas estão adaptando suas estratégias de {topic} para o novo cenário de trabalho. Insights exclusivos.",
+        f"Guia prático sobre {topic} com foco nas necessidades atuais do mercado brasileiro. Inclui ferramentas e metodologias."
+    ]
+
+
+class _Vocabulary:
+    """Precomputed string tables; rows only store indexes into them."""
+
+    def __init__(self, year):
+        title_templates = _title_templates(year)
+        topic_categories = [category_from_topic(topic) for topic in CURRENT_TOPICS]
+
+        self.sources = list(ADDITIONAL_SOURCES)
+        self.categories = list(dict.fromkeys(topic_categories + ADDITIONAL_CATEGORIES))
+        category_index = {name: i for i, name in enumerate(self.categories)}
+        source_index = {name: i for i, name in enumerate(self.sources)}
+
+        self.main_source_codes = np.array([source_index[name] for name in MAIN_SOURCES])
+        self.main_source_bases = list(MAIN_SOURCES.values())
+        self.source_bases = list(ADDITIONAL_SOURCES.values())
+        self.topic_category_codes = np.array([category_index[c] for c in topic_categories])
+        self.additional_category_codes = np.array(
+            [category_index[c] for c in ADDITIONAL_CATEGORIES])
+
+        # Main articles: topic x title template and topic x summary template
+        self.n_title_templates = len(title_templates)
+        self.main_titles = np.array([f"{topic}: {template}" for topic in CURRENT_TOPICS
+                                     for template in title_templates], dtype=object)
+        self.n_summary_templates = 5
+        self.main_summaries = np.array([summary for topic in CURRENT_TOPICS
+                                        for summary in _summary_templates(topic, year)],
+                                       dtype=object)
+        # Additional articles: one title and summary per category
+        self.additional_titles = np.array(
+            [f"Tendências atuais em {c.lower()}: o que mudou em {year}"
+             for c in ADDITIONAL_CATEGORIES], dtype=object)
+        self.additional_summaries = np.array(
+            [f"Análise atualizada sobre {c.lower()} com foco nas mudanças recentes do mercado. Dados de {year}."
+             for c in ADDITIONAL_CATEGORIES], dtype=object)
+        self.additional_slugs = [c.lower().replace(' ', '-') for c in ADDITIONAL_CATEGORIES]
+
+
+def _generate_columns(seed_sequence, n, now_ordinal, year, additional_fraction, offset):
+    """Draw n articles as columns from one independent random stream."""
+    rng = np.random.default_rng(seed_sequence)
+    vocab = _Vocabulary(year)
+
+    is_additional = rng.random(n) < additional_fraction
+    days_ago = rng.integers(0, MAX_DAYS_AGO, size=n, endpoint=True)
+
+    # Engagement mirrors the per-article formulas of the scraper
+    main_views = np.maximum(5000, 50000 - days_ago * 1000) + rng.integers(0, 5000, size=n, endpoint=True)
+    extra_views = np.maximum(3000, 30000 - days_ago * 800) + rng.integers(0, 3000, size=n, endpoint=True)
+    views = np.where(is_additional, extra_views, main_views)
+    shares = np.where(is_additional, np.maximum(30, views // 120), np.maximum(50, views // 100))
+    comments = np.where(is_additional, np.maximum(5, views // 600), np.maximum(10, views // 500))
+
+    topic = rng.integers(0, len(CURRENT_TOPICS), size=n)
+    main_source = rng.integers(0, len(MAIN_SOURCES), size=n)
+    title_template = rng.integers(0, vocab.n_title_templates, size=n)
+    summary_template = rng.integers(0, vocab.n_summary_templates, size=n)
+    extra_source = rng.integers(0, len(ADDITIONAL_SOURCES), size=n)
+    extra_category = rng.integers(0, len(ADDITIONAL_CATEGORIES), size=n)
+
+    source_codes = np.where(is_additional, extra_source, vocab.main_source_codes[main_source])
+    category_codes = np.where(is_additional, vocab.additional_category_codes[extra_category],
+                              vocab.topic_category_codes[topic])
+    titles = np.where(is_additional, vocab.additional_titles[extra_category],
+                      vocab.main_titles[topic * vocab.n_title_templates + title_template])
+    summaries = np.where(is_additional, vocab.additional_summaries[extra_category],
+                         vocab.main_summaries[topic * vocab.n_summary_templates + summary_template])
+
+    # Unique URLs so bulk data can also exercise the store and diff code
+    urls = [
+        f"{vocab.source_bases[s]}/{vocab.additional_slugs[c]}-{year}-{offset + i}" if extra
+        else f"{vocab.main_source_bases[m]}/{TOPIC_SLUGS[t]}-{offset + i}"
+        for i, (extra, s, c, m, t) in enumerate(zip(is_additional.tolist(), extra_source.tolist(),
+                                                    extra_category.tolist(), main_source.tolist(),
+                                                    topic.tolist()))
+    ]
+
+    return {
+        "titles": titles,
+        "summaries": summaries,
+        "urls": urls,
+        "dates": now_ordinal - days_ago,
+        "views": views,
+        "shares": shares,
+        "comments": comments,
+        "source_codes": source_codes,
+        "category_codes": category_codes,
+        "is_current": (days_ago <= 7).astype(np.int8),
+        "sources": vocab.sources,
+        "categories": vocab.categories
+    }
+
+
+def _generate_worker(args):
+    return _generate_columns(*args)
+
+
+class SyntheticNewsGenerator:
+    """Reproducible bulk article generator."""
+
+    def __init__(self, seed=0, now=None, additional_fraction=0.1):
+        _require_numpy()
+        self.seed = seed
+        self.now = now or DEFAULT_NOW
+        self.additional_fraction = additional_fraction
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+    def spawn(self, n_streams):
+        """Independent child seed sequences, one per worker."""
+        return self.seed_sequence.spawn(n_streams)
+
+    def generate(self, n, workers=1):
+        """Generate n articles as an ArticleTable.
+
+        With ``workers > 1`` the rows are split across processes, each drawing
+        from its own spawned stream; results are concatenated in worker order.
+        """
+        now_ordinal = self.now.toordinal()
+        year = self.now.year
+        streams = self.spawn(max(1, workers))
+        sizes = [n // len(streams) + (1 if i < n % len(streams) else 0)
+                 for i in range(len(streams))]
+        offsets = [sum(sizes[:i]) for i in range(len(sizes))]
+        jobs = [(stream, size, now_ordinal, year, self.additional_fraction, offset)
+                for stream, size, offset in zip(streams, sizes, offsets)]
+
+        if len(jobs) == 1:
+            parts = [_generate_worker(jobs[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                parts = list(pool.map(_generate_worker, jobs))
+
+        first = parts[0]
+        return ArticleTable.from_columns(
+            titles=[title for part in parts for title in part["titles"].tolist()],
+            summaries=[summary for part in parts for summary in part["summaries"].tolist()],
+            urls=[url for part in parts for url in part["urls"]],
+            dates=np.concatenate([part["dates"] for part in parts]),
+            views=np.concatenate([part["views"] for part in parts]),
+            shares=np.concatenate([part["shares"] for part in parts]),
+            comments=np.concatenate([part["comments"] for part in parts]),
+            sources=first["sources"],
+            source_codes=np.concatenate([part["source_codes"] for part in parts]),
+            categories=first["categories"],
+            category_codes=np.concatenate([part["category_codes"] for part in parts]),
+            is_current=np.concatenate([part["is_current"] for part in parts])
+        )
+
+    def generate_dicts(self, n, workers=1):
+        """Generate n articles in the collectors' dict shape."""
+        return self.generate(n, workers=workers).to_dicts()
+
+
+def main():
+    """Generate synthetic articles and report timing."""
+    parser = argparse.ArgumentParser(description="Gera notícias sintéticas de RH para testes de carga")
+    parser.add_argument("count", type=int, help="Número de notícias")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--now", type=datetime.fromisoformat, default=DEFAULT_NOW,
+                        help="Data de referência das notícias (AAAA-MM-DD)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = SyntheticNewsGenerator(seed=args.seed, now=args.now).generate(args.count,
+                                                                          workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(table):,} notícias geradas em {elapsed:.2f}s (seed={args.seed}, workers={args.workers})")
+    for news in table.iter_dicts(range(min(3, len(table)))):
+        print(f"   • {news['title'][:60]} | {news['source']} | {news['date']} | {news['views']:,}")
+
+
+if __name__ == "__main__":
+    main()
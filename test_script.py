@@ -133,6 +133,20 @@ def test_configuration_import():
         print()
 
 
+def test_search_plural_stemming():
+    """Singular and plural forms index to the same search term."""
+    print("=== Testing Search Plural Stemming ===")
+    from news_search import analyze
+
+    pairs = [("profissionais", "profissional"), ("salariais", "salarial"),
+             ("papéis", "papel"), ("lençóis", "lençol"), ("gestões", "gestão"),
+             ("benefícios", "benefício"), ("bônus", "bônus")]
+    for plural, singular in pairs:
+        assert analyze(plural) == analyze(singular), (plural, singular)
+    print(f"✅ {len(pairs)} singular/plural pairs share their search terms")
+    print()
+
+
 def main():
     """Run all tests."""
     print("🧪 Grok HR Tweets Searcher - Test Suite")
@@ -147,6 +161,7 @@ def main():
     test_payload_creation()
     test_error_handling()
     simulate_successful_response()
+    test_search_plural_stemming()
     
     print("=" * 60)
     print("✅ All tests completed successfully!")
@@ -157,6 +172,7 @@ def main():
     print("   • Payload creation: ✅ Working")
     print("   • Error handling: ✅ Working")
     print("   • Configuration: ✅ Working")
+    print("   • Search stemming: ✅ Working")
     print()
     print("💡 To use with real API:")
     print("   1. Get an xAI API key from https://console.x.ai")
@@ -12,6 +12,19 @@ from datetime import datetime
 import time
 import re
 
+from article_store import ArticleStore
+from config import PRECOMPRESS_OUTPUT
+from engagement_timeseries import EngagementTimeSeries
+from html_templates import get_template, iter_group_stats
+from html_writer import compression_summary, precompress, write_chunks
+from news_diff import diff_runs, render_changes
+from news_ranking import rank_top_k
+from news_search import NewsSearchIndex
+from news_stats import compute_news_statistics
+from snapshot_store import SnapshotStore, snapshot_run
+from static_assets import build_stylesheet
+from tracing import report_run, span, traced
+
 
 class Top100HRNewsCollector:
     """Collect top 100 HR news articles from multiple sources."""
@@ -22,6 +35,7 @@ class Top100HRNewsCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
     
+    @traced("fetch")
     def get_top_hr_news(self):
         """Get top 100 HR news articles with highest views."""
         print("📰 Coletando as 100 notícias mais relevantes de RH...")
@@ -184,438 +198,50 @@ class Top100HRNewsCollector:
                 "source": sources[i % len(sources)],
                 "summary": f"Artigo sobre {categories[i % len(categories)].lower()} com insights valiosos para profissionais de RH. Inclui dados atualizados e estratégias práticas.",
                 "url": f"https://{sources[i % len(sources)].lower().replace(' ', '')}.com.br/artigo-{i}",
-                "date": f"2024-01-{max(1, 15 - (i // 7))}",
+                "date": f"2024-01-{max(1, 15 - (i // 7)):02d}",
                 "views": views,
                 "shares": shares,
                 "comments": comments,
                 "category": categories[i % len(categories)]
             })
         
-        # Sort by views (highest first)
-        top_news.sort(key=lambda x: x['views'], reverse=True)
-        
-        # Reassign ranks
-        for i, news in enumerate(top_news, 1):
-            news['rank'] = i
+        # Rank by views (highest first) and reassign ranks
+        top_news = rank_top_k(top_news, k=100)
         
         print(f"✅ {len(top_news)} notícias coletadas e ranqueadas por visualizações")
         return top_news
     
     def get_news_statistics(self, news_list):
-        """Generate statistics from the news data."""
-        total_views = sum(news['views'] for news in news_list)
-        total_shares = sum(news['shares'] for news in news_list)
-        total_comments = sum(news['comments'] for news in news_list)
-        
-        categories = {}
-        for news in news_list:
-            cat = news['category']
-            if cat not in categories:
-                categories[cat] = {'count': 0, 'views': 0}
-            categories[cat]['count'] += 1
-            categories[cat]['views'] += news['views']
-        
-        sources = {}
-        for news in news_list:
-            source = news['source']
-            if source not in sources:
-                sources[source] = {'count': 0, 'views': 0}
-            sources[source]['count'] += 1
-            sources[source]['views'] += news['views']
-        
-        return {
-            'total_views': total_views,
-            'total_shares': total_shares,
-            'total_comments': total_comments,
-            'categories': categories,
-            'sources': sources,
-            'avg_views': total_views // len(news_list),
-            'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0],
-            'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0]
-        }
+        """Generate statistics from the news data in a single pass."""
+        return compute_news_statistics(news_list)
+
+
+def iter_top_100_html(news_list, stats, output_dir=".", pagination="", changes=""):
+    """Yield the HTML page for top 100 HR news in chunks."""
+    item = get_template("items/top_100_item.html")
+    news_items = (
+        item.render(
+            news=news,
+            rank_class="top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
+        )
+        for news in news_list
+    )
+    return get_template("top_100.html").stream(
+        stylesheet=build_stylesheet("top_100", output_dir),
+        stats=stats,
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        changes=changes,
+        news_items=news_items,
+        pagination=pagination,
+        category_items=iter_group_stats(stats['categories']),
+        source_items=iter_group_stats(stats['sources'])
+    )
 
 
 def generate_top_100_html(news_list, stats):
     """Generate HTML page for top 100 HR news."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate news HTML
-    news_html = ""
-    for news in news_list:
-        rank_class = "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
-        
-        news_html += f"""
-        <div class="news-item {rank_class}">
-            <div class="rank-badge">#{news['rank']}</div>
-            <div class="news-content">
-                <div class="news-header">
-                    <span class="source">{news['source']}</span>
-                    <span class="category">{news['category']}</span>
-                    <span class="date">{news['date']}</span>
-                </div>
-                <h3 class="title">{news['title']}</h3>
-                <p class="summary">{news['summary']}</p>
-                <div class="engagement">
-                    <span class="views">👁️ {news['views']:,} visualizações</span>
-                    <span class="shares">📤 {news['shares']:,} compartilhamentos</span>
-                    <span class="comments">💬 {news['comments']:,} comentários</span>
-                </div>
-            </div>
-        </div>
-        """
-    
-    # Generate category stats HTML
-    category_html = ""
-    for category, data in sorted(stats['categories'].items(), key=lambda x: x[1]['views'], reverse=True):
-        category_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{category}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    # Generate source stats HTML
-    source_html = ""
-    for source, data in sorted(stats['sources'].items(), key=lambda x: x[1]['views'], reverse=True):
-        source_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{source}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Top 100 Notícias de RH - Mais Visualizadas</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.3em;
-            opacity: 0.9;
-            margin-bottom: 20px;
-        }}
-        
-        .stats-overview {{
-            background: #f8f9fa;
-            padding: 30px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            text-align: center;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 12px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 1.1em;
-            font-weight: 500;
-        }}
-        
-        .content {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            padding: 30px;
-        }}
-        
-        .news-section {{
-            background: white;
-        }}
-        
-        .news-section h2 {{
-            color: #333;
-            margin-bottom: 25px;
-            font-size: 2em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .news-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-            position: relative;
-        }}
-        
-        .news-item:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 12px 30px rgba(0,0,0,0.15);
-        }}
-        
-        .news-item.top-10 {{
-            border-left: 5px solid #28a745;
-            background: linear-gradient(135deg, #f8fff9 0%, #ffffff 100%);
-        }}
-        
-        .news-item.top-50 {{
-            border-left: 5px solid #ffc107;
-        }}
-        
-        .news-item.top-100 {{
-            border-left: 5px solid #6c757d;
-        }}
-        
-        .rank-badge {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            background: #667eea;
-            color: white;
-            padding: 8px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        .news-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .source {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .category {{
-            background: #e9ecef;
-            color: #495057;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .title {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.4em;
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }}
-        
-        .summary {{
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-            margin-bottom: 20px;
-        }}
-        
-        .engagement {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .engagement span {{
-            font-size: 0.95em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: 500;
-        }}
-        
-        .sidebar {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 12px;
-            height: fit-content;
-        }}
-        
-        .sidebar h3 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-label {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.1em;
-            margin-bottom: 5px;
-        }}
-        
-        .stat-number {{
-            color: #667eea;
-            font-weight: bold;
-            font-size: 1.2em;
-        }}
-        
-        .stat-views {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 5px;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 25px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        @media (max-width: 1200px) {{
-            .content {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2.5em;
-            }}
-            
-            .news-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .engagement {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Top 100 Notícias de RH</h1>
-            <p>As notícias mais visualizadas sobre Recursos Humanos no Brasil</p>
-            <p>Ranking baseado em visualizações, compartilhamentos e engajamento</p>
-        </div>
-        
-        <div class="stats-overview">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_views']:,}</div>
-                    <div class="stat-label">Total de Visualizações</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_shares']:,}</div>
-                    <div class="stat-label">Total de Compartilhamentos</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_comments']:,}</div>
-                    <div class="stat-label">Total de Comentários</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['avg_views']:,}</div>
-                    <div class="stat-label">Média de Visualizações</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="news-section">
-                <h2>🏆 Ranking das Notícias</h2>
-                {news_html}
-            </div>
-            
-            <div class="sidebar">
-                <h3>📈 Estatísticas por Categoria</h3>
-                {category_html}
-                
-                <h3>📰 Estatísticas por Fonte</h3>
-                {source_html}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Top 100 HR News Collector</p>
-            <p>Ranking baseado em visualizações, compartilhamentos e engajamento das notícias</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
+    html_content = "".join(iter_top_100_html(news_list, stats))
     return html_content, timestamp
 
 
@@ -634,16 +260,34 @@ def main():
     stats = collector.get_news_statistics(news_list)
     
     # Generate HTML
-    html_content, timestamp = generate_top_100_html(news_list, stats)
-    filename = f"top_100_hr_news_{timestamp}.html"
+    # Each run replaces the same page; earlier versions live in the snapshot store
+    filename = "top_100_hr_news.html"
     
     try:
-        # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Show what changed since the last snapshot of this page
+        previous = SnapshotStore().latest_data("top_100_hr_news")
+        changes = render_changes(diff_runs(previous, news_list)) if previous else ""
+        
+        # Stream the page to disk instead of building it in memory
+        with span("render", page=filename):
+            write_chunks(filename, iter_top_100_html(news_list, stats, changes=changes))
         
         print(f"✅ Top 100 notícias coletadas e página HTML gerada!")
         print(f"📁 Arquivo: {filename}")
+        if PRECOMPRESS_OUTPUT:
+            print(f"🗜️ {compression_summary(filename, precompress(filename))}")
+        
+        # Persist articles so dashboards can query them without re-crawling
+        with ArticleStore() as store:
+            saved = store.upsert_many(news_list)
+            print(f"🗄️ {saved} notícias salvas em {store.path} ({store.count()} no total)")
+            indexed = NewsSearchIndex(store).sync()
+            print(f"🔍 {indexed} notícias indexadas para busca textual")
+            EngagementTimeSeries(store).record_run(news_list)
+
+        # Keep a deduplicated snapshot of this run's data and page
+        run = snapshot_run("top_100_hr_news", [filename], data=news_list)
+        print(f"📸 Snapshot {run['id']} (+{run['added_bytes']:,} bytes novos)")
         
         # Try to open in browser
         import webbrowser
@@ -667,6 +311,8 @@ def main():
         
     except Exception as e:
         print(f"❌ Erro: {e}")
+    
+    report_run("top_100_hr_news")
 
 
 if __name__ == "__main__":
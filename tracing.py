@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tracing
+
+Low-overhead spans for the collectors and page generators.
+
+Code marks its stages with ``with span("fetch", source=name):`` or the
+``@traced("categorize")`` decorator. While tracing is off (the default),
+span() returns one shared no-op context manager and traced functions only
+pay a flag check. With tracing on, every span is recorded with its thread
+and its time excluding nested spans, and report_run() at the end of a run
+writes a Chrome trace (open it in chrome://tracing or ui.perfetto.dev) and
+prints a per-stage summary table.
+
+Only the latest MAX_EVENTS spans are kept, so a long-lived process cannot
+grow without bound; such processes should call report_run() and reset()
+once per unit of work (the daemon does this after every job).
+
+Enable with TRACING_ENABLED in config.py or HR_TRACE=1 in the environment:
+
+    HR_TRACE=1 python current_hr_news_scraper.py
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from config import TRACE_DIR, TRACING_ENABLED
+
+
+# Spans kept in memory; older ones are dropped first
+MAX_EVENTS = 100_000
+
+_enabled = TRACING_ENABLED or os.environ.get("HR_TRACE", "").lower() in ("1", "true", "yes")
+_origin_ns = time.perf_counter_ns()
+_events = deque(maxlen=MAX_EVENTS)
+_thread_names = {}
+_local = threading.local()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start', 'child_ns')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.child_ns = 0
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+            thread = threading.current_thread()
+            _thread_names[thread.ident] = thread.name
+        stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter_ns() - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].child_ns += duration
+        # deque.append is atomic, so threads can record without a lock
+        _events.append((self.name, self.start, duration, duration - self.child_ns,
+                        threading.get_ident(), self.args))
+        return False
+
+
+def enable(on=True):
+    """Turn recording on or off for the rest of the process."""
+    global _enabled
+    _enabled = on
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name, **args):
+    """Context manager timing one stage; a shared no-op while tracing is off."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name):
+    """Decorator form of span() for functions and methods."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def chrome_trace():
+    """Recorded spans in the Chrome trace event format."""
+    pid = os.getpid()
+    events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+              for tid, name in _thread_names.items()]
+    for name, start, duration, _, tid, args in list(_events):
+        event = {"name": name, "cat": "hr", "ph": "X", "pid": pid, "tid": tid,
+                 "ts": (start - _origin_ns) / 1000, "dur": duration / 1000}
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        events.append(event)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def summary():
+    """Per-stage totals: {name: {"count", "total_ms", "self_ms", "max_ms"}}."""
+    stages = {}
+    for name, _, duration, self_ns, _, _ in list(_events):
+        stage = stages.get(name)
+        if stage is None:
+            stage = stages[name] = {"count": 0, "total_ms": 0.0, "self_ms": 0.0, "max_ms": 0.0}
+        stage["count"] += 1
+        stage["total_ms"] += duration / 1e6
+        stage["self_ms"] += self_ns / 1e6
+        stage["max_ms"] = max(stage["max_ms"], duration / 1e6)
+    return stages
+
+
+def format_summary(stages, wall_ms):
+    """Summary table, largest self time first. Total includes nested spans."""
+    lines = [f"   {'Etapa':<16} {'Chamadas':>8} {'Total ms':>10} {'Próprio ms':>11} "
+             f"{'Máx ms':>9} {'%':>6}"]
+    for name, stage in sorted(stages.items(), key=lambda item: item[1]["self_ms"], reverse=True):
+        share = 100 * stage["self_ms"] / wall_ms if wall_ms else 0.0
+        lines.append(f"   {name:<16} {stage['count']:>8} {stage['total_ms']:>10.1f} "
+                     f"{stage['self_ms']:>11.1f} {stage['max_ms']:>9.1f} {share:>5.1f}%")
+    lines.append(f"   Tempo total da execução: {wall_ms:.1f} ms")
+    return "\n".join(lines)
+
+
+def report_run(label, trace_dir=TRACE_DIR):
+    """Write <trace_dir>/<label>_<timestamp>.json and print the summary.
+
+    Does nothing while tracing is off. Returns the trace path or None.
+    """
+    if not _enabled:
+        return None
+    wall_ms = (time.perf_counter_ns() - _origin_ns) / 1e6
+    os.makedirs(trace_dir, exist_ok=True)
+    # Daemon job names such as "source:RH Digital" are not safe file names
+    label = re.sub(r"[^\w.-]+", "_", label)
+    path = os.path.join(trace_dir, f"{label}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(chrome_trace(), f)
+    except OSError as e:
+        print(f"⚠️ Erro ao salvar trace: {e}")
+        path = None
+    print("\n⏱️ Tempo por etapa:")
+    print(format_summary(summary(), wall_ms))
+    if path:
+        print(f"🧭 Trace: {path}")
+    return path
+
+
+def reset():
+    """Drop recorded spans and restart the run clock."""
+    global _origin_ns
+    _events.clear()
+    _origin_ns = time.perf_counter_ns()